@@ -1,5 +1,5 @@
 #srlsp-game/src/signperu/app.py
-# Script de arranque: crea contexto (EventBus, cola de frames, DB, juego)
+# Script de arranque: crea contexto (EventBus, anillo de frames, DB, juego)
 # y arranca la GUI principal (MainWindow).
 #
 # NOTAS:
@@ -9,12 +9,14 @@
 # - La ventana principal debe ejecutarse en el hilo principal
 import argparse
 import os
+import re
 import sys
-from queue import Queue
+from signperu.core import tuner
 from signperu.core.events import EventBus
-from signperu.core.capture import CaptureThread
-from signperu.core.processing import ProcessingThread
-from signperu.core.detector import DetectorWrapper
+from signperu.core.lanes import LaneManager
+from signperu.core.recorder import FrameRecorder
+from signperu.core.sources import make_source
+from signperu.core.warmup import shutdown as shutdown_detectors, start_warmup
 from signperu.persistence.db_manager import DBManager
 
 """
@@ -25,6 +27,9 @@ Uso:
   python -m signperu.app --game AH
   python -m signperu.app --game LC
   python -m signperu.app            # pide selección por consola
+  python -m signperu.app --game LC --source clip.mp4          # sin cámara
+  python -m signperu.app --game LC --source synthetic --fast  # máximo throughput
+  python -m signperu.app --game LC --source 0 --source 1      # dos estaciones (una cámara c/u)
 """
 # Intentamos importar los juegos disponibles
 try:
@@ -48,6 +53,7 @@ except Exception as e:
 # Config simple
 class _C:
     CAMERA_SRC = 0
+    CAMERA_SOURCES = [0]
     FPS = 12
     DB_PATH = os.path.join("data", "signperu.db")
 config = _C()
@@ -77,7 +83,10 @@ def choose_game_interactive():
     print("Selección no válida. Saliendo.")
     sys.exit(1)
 
-def run(selected_game_key=None):
+def run(selected_game_key=None, sources=None, realtime=True, record=None):
+    # MediaPipe se carga en segundo plano mientras se elige juego / se abre la BD
+    start_warmup()
+
     # elegir juego si no se pasó por argumento
     if not selected_game_key:
         selected_game_key = choose_game_interactive()
@@ -93,15 +102,31 @@ def run(selected_game_key=None):
     event_bus = EventBus()
     db = DBManager.get_instance(config.DB_PATH)
 
-    frame_q = Queue(maxsize=2)
-    capture = CaptureThread(event_bus, src=config.CAMERA_SRC, target_fps=config.FPS, frame_queue=frame_q)
-    detector = DetectorWrapper()
-    processing = ProcessingThread(event_bus, detector, frame_q)
+    # un carril (captura + detector + procesamiento) por fuente
+    specs = sources or getattr(config, "CAMERA_SOURCES", None) or [config.CAMERA_SRC]
+    lanes = LaneManager(event_bus, [make_source(s, realtime=realtime) for s in specs], target_fps=config.FPS)
+
+    # grabación opcional de la sesión (se reproduce luego con --source <carpeta>)
+    # con varias fuentes, una subcarpeta por estación (cada una se reproduce por separado)
+    recorders = []
+    if record:
+        for lane in lanes.lanes:
+            path = record
+            if len(lanes.lanes) > 1:
+                path = os.path.join(record, re.sub(r"[^\w.#-]", "_", lane.source_id))
+            recorder = FrameRecorder(event_bus, path, size=getattr(config, "RECORD_SIZE", None),
+                                     max_fps=getattr(config, "RECORD_MAX_FPS", 0), source_id=lane.source_id)
+            try:
+                recorder.start()
+            except FileExistsError as e:
+                print(f"[app] No se graba: {e}")
+                continue
+            recorders.append(recorder)
+            print(f"[app] Grabando frames de {lane.source_id} en {path}")
 
     # arrancar hilos antes de lanzar la UI/juego (para que haya feed y detecciones)
-    capture.start()
-    processing.start()
-    print("[app] Hilos capture & processing iniciados.")
+    lanes.start()
+    print(f"[app] Hilos capture & processing iniciados ({len(lanes.lanes)} fuente/s).")
 
     # crear instancia del juego y ejecutarlo (bloqueante)
     try:
@@ -114,23 +139,28 @@ def run(selected_game_key=None):
         # parada y limpieza (se ejecuta cuando el juego termina o falla)
         print("[app] Deteniendo hilos y cerrando BD...")
         try:
-            capture.stop()
-        except Exception:
-            pass
-        try:
-            processing.stop()
+            lanes.stop()
+            shutdown_detectors()   # los detectores vuelven a la reserva al parar; aquí se cierran
         except Exception:
             pass
+        for recorder in recorders:
+            recorder.stop()
+            print(f"[app] Grabación {recorder.path}: {recorder.recorded} frames, {recorder.dropped} descartados.")
         try:
             db.close()
         except Exception:
             pass
+        tuner.wait_calibration()   # la calibración pendiente corre al parar los carriles
         print("[app] Salida limpia.")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Launcher de pruebas para juegos SignPeru.")
     parser.add_argument("--game", type=str, help="Clave del juego a ejecutar (AH, LC, LADRILLOS)")
     parser.add_argument("--menu", action="store_true", help="Forzar menu interactivo")
+    parser.add_argument("--source", type=str, action="append",
+                        help="Fuente de frames: índice de cámara, vídeo, carpeta de imágenes, grabación o 'synthetic' (repetible: una por estación)")
+    parser.add_argument("--record", type=str, help="Carpeta donde grabar los frames capturados (replay con --source)")
+    parser.add_argument("--fast", action="store_true", help="Entregar frames lo más rápido posible (sin pacing de tiempo real)")
     args = parser.parse_args()
 
     selected = None
@@ -142,4 +172,4 @@ if __name__ == "__main__":
         # si no hay args, usamos prompt interactivo
         selected = None
 
-    run(selected_game_key=selected)
+    run(selected_game_key=selected, sources=args.source, realtime=not args.fast, record=args.record)
@@ -1,317 +1,148 @@
 # srlsp-game/src/signperu/clasificador/abecedario.py
-import mediapipe as mp
 import cv2
 import numpy as np
 
+from signperu.clasificador.manos import HandTracker, manos_payload
+from signperu.clasificador.reglas import ABECEDARIO
+from signperu.clasificador.roi import HandROI
+from signperu.core.overlay import LandmarkOverlay
+
+
+def landmarks_array(hand_landmarks, width, height):
+    """
+    Convierte los landmarks normalizados de MediaPipe en un array (21, 2) float32 de
+    píxeles (x, y) del frame procesado, en un solo recorrido. Sin redondeo: la
+    clasificación trabaja a resolución subpíxel.
+    """
+    lms = hand_landmarks.landmark
+    pts = np.array([p.x for p in lms] + [p.y for p in lms]).reshape(2, -1).T * (width, height)
+    return pts.astype(np.float32)
+
+
 class ClasificadorSenia:
-    def __init__(self):
-        # Inicialización de MediaPipe para detección de manos
+    def __init__(self, roi_tracking=True, model_complexity=1,
+                 min_detection_confidence=0.7, min_tracking_confidence=0.5, max_num_hands=1):
+        # Inicialización de MediaPipe para detección de manos. Import diferido: cargar
+        # mediapipe tarda segundos y solo lo necesita quien construye el clasificador
+        # (core/warmup.py lo hace en segundo plano al arrancar la aplicación).
+        # Complejidad y umbrales los elige core/tuner.py según la máquina.
+        import mediapipe as mp
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(static_image_mode=False,
-                                         max_num_hands=1,
-                                         min_detection_confidence=0.7,
-                                         min_tracking_confidence=0.5)
-        self.mp_drawing = mp.solutions.drawing_utils
+                                         max_num_hands=max_num_hands,
+                                         model_complexity=model_complexity,
+                                         min_detection_confidence=min_detection_confidence,
+                                         min_tracking_confidence=min_tracking_confidence)
+        self.overlay = LandmarkOverlay(thickness=1, point_size=3)
         self.abecedario = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-
-    def procesar_mano(self, frame):
+        self.reglas_disparadas = []   # reglas cumplidas en la última mano clasificada
+        # recorte alrededor de la mano del frame anterior (None = siempre frame completo).
+        # Solo con una mano: con varias el recorte dejaría fuera a las demás
+        self.roi = HandROI() if roi_tracking and max_num_hands == 1 else None
+        self.tracker = HandTracker()  # ids estables entre frames (clasificador/manos.py)
+        self.manos = []               # manos del último frame (ver manos_payload)
+        self._ultimos_puntos = None   # landmarks (N, 21, 2) de las últimas manos, para anotar()
+
+    def reset(self):
+        """
+        Olvida el seguimiento de la sesión anterior sin reconstruir el grafo de MediaPipe:
+        descarta la ROI y pasa un frame vacío para que Hands suelte la mano que seguía
+        (el siguiente frame vuelve a la detección de palma).
+        """
+        if self.roi is not None:
+            self.roi.lost()
+        self.tracker.reset()
+        self.manos = []
+        self._ultimos_puntos = None
+        self.reglas_disparadas = []
+        self.hands.process(np.zeros((64, 64, 3), dtype=np.uint8))
+
+    def close(self):
+        """Libera el grafo de MediaPipe (DetectorWrapper.close)."""
+        self.hands.close()
+
+    def procesar_mano(self, frame, anotar=True):
         """
         Procesa la imagen para detectar puntos clave de la mano.
-        Ahora: dibuja sobre la copia RGB (la que usa mediapipe), convierte a BGR para OpenCV
-        y devuelve (letra_detectada | None, frame_annotado_BGR, lista_coordenadas_o_None).
+        Devuelve (letra_detectada | None, frame_annotado_BGR, coordenadas (21, 2) int16 | None)
+        de la mano principal (la de id más bajo); todas las manos quedan en self.manos.
+        Con anotar=False no se copia ni se dibuja nada: se devuelve `frame` tal cual (la
+        anotación es un paso aparte, ver anotar()).
+        Las reglas usan medidas relativas al tamaño de la mano, así que `frame` puede
+        llegar a cualquier resolución; las coordenadas son píxeles de `frame`.
+        Con seguimiento de ROI solo se procesa el recorte alrededor de la mano anterior;
+        si ahí no aparece, se busca en el frame completo.
         """
-        # obtener tamaño
-        height, width, _ = frame.shape
-
+        detectadas, origen, region = [], (0, 0), frame
+        if self.roi is not None and self.roi.box is not None:
+            region, origen = self.roi.crop(frame)
+            detectadas = self._detectar(region)
+            if not detectadas:
+                # mano perdida en el recorte: búsqueda en el frame completo
+                self.roi.lost()
+                region, origen = frame, (0, 0)
+        if not detectadas:
+            detectadas = self._detectar(frame)
+
+        if not detectadas:
+            # si no detectó nada devolvemos el frame original (BGR) y None para coords
+            self.tracker.assign(np.zeros((0, 21, 2), dtype=np.float32), [])
+            self.manos = []
+            self._ultimos_puntos = None
+            return None, frame, None
+
+        # convertimos los landmarks una sola vez a píxeles del frame completo: (N, 21, 2)
+        rh, rw = region.shape[:2]
+        puntos = np.stack([landmarks_array(lm, rw, rh) for lm, _ in detectadas])
+        puntos += origen
+        lados = [lado for _, lado in detectadas]
+        ids = self.tracker.assign(puntos, lados)
+        # todas las manos en una sola evaluación vectorizada de la tabla de reglas
+        self.manos = manos_payload(puntos, lados, ids, ABECEDARIO.clasificar_manos(puntos))
+        principal = self.manos[0]
+        if self.roi is not None:
+            self.roi.update(puntos[ids.index(principal["id"])], frame.shape)
+        # reglas cumplidas (empates incluidos) disponibles para depuración
+        letra_detectada, self.reglas_disparadas = principal["letra"], principal["reglas"]
+        # copia compacta int16 (21, 2) para el evento 'hand_detected'
+        coordenadas = principal["landmarks"]
+        self._ultimos_puntos = puntos
+
+        if not anotar:
+            return letra_detectada, frame, coordenadas
+        return letra_detectada, self.anotar(frame), coordenadas
+
+    def anotar(self, frame):
+        """Copia BGR de `frame` con los landmarks de las últimas manos detectadas dibujados."""
+        # los puntos ya están en píxeles del frame completo (core/overlay.py)
+        return self.overlay.draw(frame.copy(), self._ultimos_puntos)
+
+    def _detectar(self, imagen_bgr):
+        """Lista de (landmarks, lateralidad) de las manos en imagen_bgr (relativos a ella)."""
         # MediaPipe espera RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        resultado = self.hands.process(frame_rgb)
-
-        if resultado.multi_hand_landmarks:
-            for hand_landmarks in resultado.multi_hand_landmarks:
-                # Dibujamos sobre frame_rgb (RGB colors)
-                self.mp_drawing.draw_landmarks(frame_rgb,hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=1, circle_radius=1),
-                    self.mp_drawing.DrawingSpec(color=(0, 128, 255), thickness=1, circle_radius=1)
-                )
-                # extraemos coordenadas (x,y) enteras relativas al tamaño original
-                coordenadas = self.extraer_coordenadas(hand_landmarks, frame.shape)
-                # clasificamos la letra usando los landmarks (sigue usando hand_landmarks)
-                letra_detectada = self.clasificar_letra(hand_landmarks, width, height)
-                # convertimos la imagen anotada de RGB -> BGR para que OpenCV y CTk la muestren correctamente
-                frame_annotado_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
-
-                return letra_detectada, frame_annotado_bgr, coordenadas
-
-        # si no detectó nada devolvemos el frame original (BGR) y None para coords
-        return None, frame, None
+        resultado = self.hands.process(cv2.cvtColor(imagen_bgr, cv2.COLOR_BGR2RGB))
+        if not resultado.multi_hand_landmarks:
+            return []
+        lados = [h.classification[0].label for h in (resultado.multi_handedness or [])]
+        lados += [None] * (len(resultado.multi_hand_landmarks) - len(lados))
+        return list(zip(resultado.multi_hand_landmarks, lados))
 
     def extraer_coordenadas(self, landmarks, frame_shape):
-        """Extrae las coordenadas normalizadas de los puntos de la mano."""
+        """Coordenadas (x, y) en píxeles de los puntos de la mano como array (21, 2) int16."""
         altura, ancho, _ = frame_shape
-        coordenadas = [(int(p.x * ancho), int(p.y * altura)) for p in landmarks.landmark]
-        return coordenadas
-
-    def clasificar_letra(self, hand_landmarks, image_width, image_height):
-        """Clasifica la letra basándose en las coordenadas."""
-        # Aquí puedes añadir tu lógica para comparar distancias y asignar una letra
+        return landmarks_array(landmarks, ancho, altura).astype(np.int16)
 
-        def distancia_euclidiana(p1, p2):
-            d = ((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2) ** 0.5
-            return d
-
-        # Índice (Index Finger)
-        index_finger_mcp = (int(hand_landmarks.landmark[5].x * image_width), int(hand_landmarks.landmark[5].y * image_height))
-        index_finger_pip = (int(hand_landmarks.landmark[6].x * image_width), int(hand_landmarks.landmark[6].y * image_height))
-        index_finger_dip = (int(hand_landmarks.landmark[7].x * image_width), int(hand_landmarks.landmark[7].y * image_height))
-        index_finger_tip = (int(hand_landmarks.landmark[8].x * image_width), int(hand_landmarks.landmark[8].y * image_height))
-        # Pulgar (Thumb)
-        thumb_cmc = (int(hand_landmarks.landmark[1].x * image_width), int(hand_landmarks.landmark[1].y * image_height))
-        thumb_mcp = (int(hand_landmarks.landmark[2].x * image_width), int(hand_landmarks.landmark[2].y * image_height))
-        thumb_ip = (int(hand_landmarks.landmark[3].x * image_width), int(hand_landmarks.landmark[3].y * image_height))
-        thumb_tip = (int(hand_landmarks.landmark[4].x * image_width), int(hand_landmarks.landmark[4].y * image_height))
-        thumb_pip = (int(hand_landmarks.landmark[2].x * image_width), int(hand_landmarks.landmark[2].y * image_height))
-        # Dedo medio (Middle Finger)
-        middle_finger_mcp = (int(hand_landmarks.landmark[9].x * image_width), int(hand_landmarks.landmark[9].y * image_height))
-        middle_finger_pip = (int(hand_landmarks.landmark[10].x * image_width), int(hand_landmarks.landmark[10].y * image_height))
-        middle_finger_dip = (int(hand_landmarks.landmark[11].x * image_width), int(hand_landmarks.landmark[11].y * image_height))
-        middle_finger_tip = (int(hand_landmarks.landmark[12].x * image_width), int(hand_landmarks.landmark[12].y * image_height))
-        # Anular (Ring Finger)
-        ring_finger_mcp = (int(hand_landmarks.landmark[13].x * image_width), int(hand_landmarks.landmark[13].y * image_height))
-        ring_finger_pip = (int(hand_landmarks.landmark[14].x * image_width), int(hand_landmarks.landmark[14].y * image_height))
-        ring_finger_dip = (int(hand_landmarks.landmark[15].x * image_width), int(hand_landmarks.landmark[15].y * image_height))
-        ring_finger_tip = (int(hand_landmarks.landmark[16].x * image_width), int(hand_landmarks.landmark[16].y * image_height))
-        # Meñique (Pinky Finger)
-        pinky_tip_mcp = (int(hand_landmarks.landmark[17].x * image_width), int(hand_landmarks.landmark[17].y * image_height))
-        pinky_pip = (int(hand_landmarks.landmark[18].x * image_width), int(hand_landmarks.landmark[18].y * image_height))
-        pinky_dip = (int(hand_landmarks.landmark[19].x * image_width), int(hand_landmarks.landmark[19].y * image_height))
-        pinky_tip = (int(hand_landmarks.landmark[20].x * image_width), int(hand_landmarks.landmark[20].y * image_height))
-        #Muñeca (wrist)
-        wrist = (int(hand_landmarks.landmark[0].x * image_width), int(hand_landmarks.landmark[0].y * image_height))
-                    
-        ring_finger_pip2 = (int(hand_landmarks.landmark[5].x * image_width), int(hand_landmarks.landmark[5].y * image_height))
-                    
-        # Para fines de ejemplo, seleccionaremos una letra fija
-        if abs(thumb_tip[1] - index_finger_pip[1]) <30 \
-            and abs(thumb_tip[1] - middle_finger_pip[1]) < 30 and abs(thumb_tip[1] - ring_finger_pip[1]) < 30\
-            and abs(thumb_tip[1] - pinky_pip[1]) < 30:
-            return 'A'
-                    
-        elif index_finger_pip[1] > index_finger_tip[1] and pinky_pip[1] - pinky_tip[1] > 0 and \
-            middle_finger_pip[1] - middle_finger_tip[1] >0 and ring_finger_pip[1] - ring_finger_tip[1] >0 and \
-            middle_finger_tip[1] - ring_finger_tip[1] <0 and abs(thumb_tip[1] - ring_finger_pip2[1])<40:
-            return 'B'
-                        
-        elif 30 < abs(index_finger_tip[1] - thumb_tip[1]) < 80 and \
-            abs(index_finger_tip[0] - thumb_tip[0]) < 50 and \
-            middle_finger_tip[1] > middle_finger_dip[1] and \
-            ring_finger_tip[1] > ring_finger_dip[1] and \
-            pinky_tip[1] > pinky_dip[1]:
-            return 'C'
-                    
-        elif distancia_euclidiana(thumb_tip, middle_finger_tip) < 65 \
-            and distancia_euclidiana(thumb_tip, ring_finger_tip) < 65 \
-            and pinky_pip[1] < pinky_tip[1] \
-            and middle_finger_tip[1] > middle_finger_pip[1]\
-            and ring_finger_tip[1] > ring_finger_pip[1] \
-            and index_finger_pip[1] > index_finger_tip[1]:       
-            return 'D'   
-                             
-        elif index_finger_pip[1] < index_finger_tip[1] and pinky_pip[1] < pinky_tip[1]  and \
-            middle_finger_pip[1] < middle_finger_tip[1] and ring_finger_pip[1] < ring_finger_tip[1] \
-            and abs(index_finger_tip[1] - thumb_tip[1]) < 15 and thumb_tip[1] - index_finger_tip[1] > 0 \
-            and thumb_tip[1] - middle_finger_tip[1] > 0 and thumb_tip[1] - ring_finger_tip[1] > 0:
-            return 'E' 
-                        
-        elif  pinky_pip[1] - pinky_tip[1] > 0 and middle_finger_pip[1] - middle_finger_tip[1] > 0 and \
-            ring_finger_pip[1] - ring_finger_tip[1] > 0 and index_finger_pip[1] - index_finger_tip[1] < 0 \
-            and abs(thumb_pip[1] - thumb_tip[1]) > 0 and distancia_euclidiana(index_finger_tip, thumb_tip) <65:          
-            return 'F'             
-        # Seguimos con las demas señas
-
-        elif 20 < abs(index_finger_tip[1] - thumb_tip[1]) < 60 and \
-            10 < abs(index_finger_tip[0] - thumb_tip[0]) < 30 and \
-            middle_finger_tip[1] > middle_finger_pip[1] and ring_finger_tip[1] > ring_finger_pip[1] and \
-            pinky_tip[1] > pinky_pip[1]:
-            return 'G' 
-                    
-        # Listo: H
-        elif index_finger_pip[1] > index_finger_tip[1] and middle_finger_pip[1] > middle_finger_tip[1] and \
-            ring_finger_pip[1] < ring_finger_tip[1] and pinky_pip[1] < pinky_tip[1] and \
-            abs(index_finger_tip[1] - middle_finger_tip[1]) < 20 and \
-            index_finger_tip[1] < middle_finger_tip[1] and index_finger_tip[1] < ring_finger_tip[1] and \
-            index_finger_tip[1] < pinky_tip[1]:  # El índice está por encima de los demás dedos
-            return 'H' 
-                  
-        # Listo : I
-        elif pinky_tip[1] < pinky_pip[1] and index_finger_tip[1] > index_finger_dip[1] and \
-            middle_finger_tip[1] > middle_finger_dip[1] and ring_finger_tip[1] > ring_finger_dip[1] and \
-            thumb_tip[1] > thumb_ip[1]:
-            return 'I' 
-            
-        # Listp:J                   
-        elif pinky_tip[1] < pinky_pip[1] and index_finger_tip[1] > index_finger_dip[1] and \
-            middle_finger_tip[1] > middle_finger_dip[1] and ring_finger_tip[1] > ring_finger_dip[1] and \
-            thumb_tip[1] > thumb_ip[1] and \
-            distancia_euclidiana(thumb_tip, index_finger_pip) < 20:  # El pulgar toca index_finger_pip:  
-            return 'J'
-        
-        # Listo: K
-        elif index_finger_tip[1] < index_finger_pip[1] and middle_finger_tip[1] < middle_finger_pip[1] and \
-            ring_finger_tip[1] > ring_finger_pip[1] and pinky_tip[1] > pinky_pip[1] and \
-            thumb_tip[0] < middle_finger_mcp[0] and 20< abs(index_finger_tip[1] - middle_finger_tip[1]) < 30 and\
-            distancia_euclidiana(thumb_tip, index_finger_pip) < 20 and \
-            index_finger_tip[1] < middle_finger_tip[1] and index_finger_tip[1] < ring_finger_tip[1] and \
-            index_finger_tip[1] < pinky_tip[1]:  # El índice está por encima de los demás dedos
-            
-            return 'K'
-
-        #Falta calibrar L
-        #distancia_euclidiana(thumb_tip, index_finger_mcp) > 30 : Separación horizontal entre el pulgar y la base del índice
-        elif distancia_euclidiana(thumb_tip, index_finger_mcp) > 30 \
-            and index_finger_tip[1] < index_finger_pip[1] \
-            and middle_finger_tip[1] > middle_finger_pip[1] \
-            and ring_finger_tip[1] > ring_finger_pip[1] \
-            and pinky_tip[1] > pinky_pip[1]:  # Meñique doblado hacia la palma
-            return 'L'
-        
-        #Falta calibrar M
-        elif wrist[1] < thumb_tip[1] and wrist[1] < index_finger_tip[1] \
-            and distancia_euclidiana(thumb_tip, pinky_dip) < 20 \
-            and index_finger_tip[1] < index_finger_pip[1] \
-            and middle_finger_tip[1] < middle_finger_pip[1] \
-            and ring_finger_tip[1] < ring_finger_pip[1] \
-            and pinky_tip[1] > pinky_pip[1] \
-            and abs(index_finger_tip[0] - middle_finger_tip[0]) < 15 \
-            and abs(middle_finger_tip[0] - ring_finger_tip[0]) < 15:  # Separación corta entre medio y anular (eje X)
-            return 'M'
-        #Falta calibrar N
-        elif wrist[1] < thumb_tip[1] and wrist[1] < index_finger_tip[1] \
-            and distancia_euclidiana(thumb_tip, pinky_tip) < 20 \
-            and distancia_euclidiana(thumb_tip, ring_finger_tip) < 20 \
-            and index_finger_tip[1] < index_finger_pip[1] \
-            and middle_finger_tip[1] < middle_finger_pip[1] \
-            and ring_finger_tip[1] > ring_finger_pip[1] \
-            and pinky_tip[1] > pinky_pip[1] \
-            and abs(index_finger_tip[0] - middle_finger_tip[0]) < 15:  # Separación corta en el eje X entre índice y medio
-            return 'N'
-        #Falta calibrar O
-        elif distancia_euclidiana(thumb_tip, index_finger_tip) < 10 \
-            and distancia_euclidiana(thumb_tip, middle_finger_tip) < 10 \
-            and distancia_euclidiana(thumb_tip, ring_finger_tip) < 10 \
-            and distancia_euclidiana(thumb_tip, pinky_tip) < 10 \
-            and index_finger_tip[1] > index_finger_pip[1] \
-            and middle_finger_tip[1] > middle_finger_pip[1] \
-            and ring_finger_tip[1] > ring_finger_pip[1] \
-            and pinky_tip[1] > pinky_pip[1]:  # Meñique doblado hacia la palma
-            return 'O'
-
-        # and wrist[1] < pinky_tip[1] :La muñeca está por encima de todos los puntos
-        # and thumb_tip[1] > index_finger_mcp[1] : El pulgar está hacia abajo
-        elif wrist[1] < thumb_tip[1] and wrist[1] < index_finger_tip[1] \
-            and wrist[1] < middle_finger_tip[1] and wrist[1] < ring_finger_tip[1] \
-            and wrist[1] < pinky_tip[1] \
-            and thumb_tip[1] > index_finger_mcp[1] \
-            and index_finger_tip[1] < index_finger_mcp[1] \
-            and middle_finger_tip[1] > index_finger_tip[1]:  # Medio apunta hacia abajo
-            return 'P'
-        
-        # Falta calibrar letra Q 
-        elif wrist[1] < thumb_tip[1] and wrist[1] < index_finger_tip[1] \
-            and wrist[1] < middle_finger_tip[1] and wrist[1] < ring_finger_tip[1] \
-            and wrist[1] < pinky_tip[1] and thumb_tip[1] < index_finger_mcp[1] \
-            and index_finger_tip[1] > index_finger_pip[1] \
-            and middle_finger_tip[1] > middle_finger_pip[1] \
-            and ring_finger_tip[1] > ring_finger_pip[1] \
-            and pinky_tip[1] > pinky_pip[1] \
-            and abs(thumb_tip[0] - index_finger_tip[0]) > 10:  # Separación horizontal entre el pulgar y el índice
-            return 'Q'
-  
-        # Falta calibrar letra R  
-        elif distancia_euclidiana(index_finger_tip, middle_finger_tip) < 20 \
-                and index_finger_tip[1] < index_finger_pip[1] \
-                and middle_finger_tip[1] < middle_finger_pip[1] \
-                and ring_finger_tip[1] > ring_finger_pip[1] \
-                and pinky_tip[1] > pinky_pip[1] and thumb_tip[1] > index_finger_pip[1] \
-                and distancia_euclidiana(thumb_tip, index_finger_pip) > 30:
-            return 'R'
-        # Letra echa con logica propia_ probar 
-        elif abs(thumb_tip[0] - ring_finger_tip[0]) < 20 and abs(thumb_tip[1] - ring_finger_tip[1]) < 20 and \
-            abs(index_finger_tip[0] - middle_finger_dip[0]) < 20 and \
-            abs(index_finger_tip[1] - middle_finger_dip[1]) < 20 and \
-            middle_finger_tip[1] < index_finger_tip[1] and \
-            ring_finger_pip[1] > ring_finger_dip[1] and \
-            pinky_pip[1] > pinky_dip[1] and \
-            pinky_tip[1] > ring_finger_tip[1]:
-            return 'R'
-
-        # Calibrar S
-        elif abs(thumb_ip[0] - index_finger_dip[0]) < 20 and abs(thumb_ip[1] - index_finger_dip[1]) < 20 and \
-            abs(thumb_tip[0] - middle_finger_pip[0]) < 20 and \
-            abs(thumb_tip[1] - middle_finger_pip[1]) < 20 and \
-            index_finger_pip[1] > index_finger_dip[1] and \
-            middle_finger_pip[1] > middle_finger_dip[1] and \
-            ring_finger_pip[1] > ring_finger_dip[1] and \
-            pinky_pip[1] > pinky_dip[1]:
-            return 'S'
-
-        # Calibrar T
-        elif abs(thumb_tip[0] - index_finger_dip[0]) < 20 and abs(thumb_tip[1] - index_finger_dip[1]) < 20 and \
-            abs(index_finger_tip[1] - index_finger_dip[1]) < 10 and \
-            middle_finger_pip[1] > index_finger_pip[1] and \
-            ring_finger_pip[1] > index_finger_pip[1] and \
-            pinky_pip[1] > index_finger_pip[1]:
-            return 'T'
-
-       # Calibrar U
-        elif abs(thumb_tip[0] - middle_finger_dip[0]) < 30 and abs(thumb_tip[1] - middle_finger_dip[1]) < 30 and \
-            index_finger_pip[1] > index_finger_tip[1] and middle_finger_pip[1] < middle_finger_tip[1] and \
-            ring_finger_pip[1] < ring_finger_tip[1] and pinky_pip[1] > pinky_tip[1]:
-            return 'U' 
-        
-        # Calibrar V
-        elif abs(thumb_tip[0] - ring_finger_pip[0]) < 30 and abs(thumb_tip[1] - ring_finger_pip[1]) < 30 and \
-            index_finger_pip[1] > index_finger_tip[1] and \
-            middle_finger_pip[1] > middle_finger_tip[1] and \
-            ring_finger_pip[1] < ring_finger_tip[1] and pinky_pip[1] < pinky_tip[1] and \
-            abs(index_finger_tip[0] - middle_finger_tip[0]) > 50:
-            return 'V'
-        # Calibrar W
-        elif abs(thumb_tip[0] - pinky_tip[0]) < 30 and abs(thumb_tip[1] - pinky_tip[1]) < 30 and \
-            index_finger_pip[1] > index_finger_tip[1] and \
-            middle_finger_pip[1] > middle_finger_tip[1] and \
-            ring_finger_pip[1] > ring_finger_tip[1] and \
-            pinky_pip[1] < pinky_tip[1] and \
-            abs(index_finger_tip[0] - middle_finger_tip[0]) > 50 and \
-            abs(middle_finger_tip[0] - ring_finger_tip[0]) > 50:
-            return 'W'
-        # Calibrar X
-        elif abs(thumb_tip[0] - middle_finger_dip[0]) < 30 and abs(thumb_tip[1] - middle_finger_dip[1]) < 30 and \
-            index_finger_pip[1] < middle_finger_pip[1] and \
-            index_finger_pip[1] < ring_finger_pip[1] and \
-            index_finger_pip[1] < pinky_pip[1] and \
-            index_finger_tip[1] > index_finger_pip[1] and \
-            middle_finger_pip[1] < middle_finger_tip[1] and \
-            ring_finger_pip[1] < ring_finger_tip[1] and \
-            pinky_pip[1] < pinky_tip[1]:
-            return 'X'
-        
-        # Calibrar letra Y
-        elif abs(thumb_tip[0] - index_finger_pip[0]) > 50 and thumb_tip[1] < index_finger_pip[1] and \
-            index_finger_pip[1] > middle_finger_pip[1] and \
-            middle_finger_pip[1] > ring_finger_pip[1] and \
-            ring_finger_pip[1] > pinky_pip[1] and \
-            abs(pinky_tip[0] - ring_finger_pip[0]) > 50 and \
-            pinky_tip[1] < ring_finger_pip[1]:
-            return 'Y'
-
-        # Calibrar letra Z
-        elif abs(thumb_tip[0] - middle_finger_pip[0]) < 20 and \
-            abs(thumb_tip[1] - middle_finger_pip[1]) < 20 and \
-            index_finger_pip[1] < middle_finger_pip[1] and \
-            middle_finger_pip[1] > ring_finger_pip[1] and \
-            ring_finger_pip[1] > pinky_pip[1]:
-            return 'Z'
-
-        return None 
\ No newline at end of file
+    def clasificar_letra(self, puntos, image_width=None, image_height=None):
+        """
+        Clasifica la letra basándose en las coordenadas (tabla clasificador/reglas.py).
+        puntos: array (21, 2) de píxeles de cualquier resolución (landmarks_array); también
+        acepta los hand_landmarks de MediaPipe junto con image_width/image_height.
+        """
+        letra, _ = self.clasificar_con_reglas(puntos, image_width, image_height)
+        return letra
+
+    def clasificar_con_reglas(self, puntos, image_width=None, image_height=None):
+        """Como clasificar_letra pero devuelve también las reglas que se cumplieron: (letra, [nombres])."""
+        if not isinstance(puntos, np.ndarray):
+            puntos = landmarks_array(puntos, image_width, image_height)
+        return ABECEDARIO.clasificar(puntos) 
\ No newline at end of file
@@ -0,0 +1,87 @@
+# srlsp-game/src/signperu/clasificador/cascada.py
+# Clasificación en cascada: primero las reglas (baratas); un clasificador más caro solo
+# para las manos en que las reglas no deciden.
+#
+# NOTAS:
+# - La etapa de reglas ya corrió al detectar: cada mano de manos_payload trae su letra, las
+#   reglas cumplidas y el margen (clasificador/reglas.py), así que decidir si hace falta la
+#   etapa cara no cuesta otra evaluación.
+# - Una mano es ambigua si no se cumple ninguna letra, si se cumplen varias letras
+#   distintas (R y R2 cuentan como una) o si su margen es menor que `min_margin`
+#   (0 = solo los dos primeros casos).
+# - La etapa cara es cualquier objeto con clasificar(landmarks (21, 2) px) -> letra | None
+#   (p. ej. clasificador/plantillas.py). Si devuelve None se queda la letra de las reglas. Sin
+#   etapa cara la cascada solo cuenta cuántas manos la habrían necesitado.
+# - CascadeStats da la tasa de cada etapa (DetectorWrapper.stats()["cascade"]) para
+#   comprobar que la etapa cara corre en una fracción pequeña de las manos.
+import time
+
+MOTIVOS = ("ninguna", "varias", "margen")
+
+
+class CascadeStats:
+    """Manos vistas, resueltas por reglas, ambiguas (por motivo) y enviadas a la etapa cara."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.hands = 0
+        self.fast = 0
+        self.ambiguous = dict.fromkeys(MOTIVOS, 0)
+        self.heavy = 0
+        self.heavy_changed = 0   # la etapa cara cambió la letra de las reglas
+        self._heavy_s = 0.0
+
+    def on_heavy(self, seconds, changed):
+        self.heavy += 1
+        self.heavy_changed += int(changed)
+        self._heavy_s += seconds
+
+    def snapshot(self):
+        n = max(1, self.hands)
+        return {
+            "hands": self.hands,
+            "fast_rate": self.fast / n,
+            "ambiguous_rate": sum(self.ambiguous.values()) / n,
+            "heavy_rate": self.heavy / n,
+            "ambiguous": dict(self.ambiguous),
+            "heavy_changed": self.heavy_changed,
+            "heavy_mean_ms": 1000.0 * self._heavy_s / self.heavy if self.heavy else None,
+        }
+
+
+class ClasificadorCascada:
+    def __init__(self, pesado=None, min_margin=0.0):
+        self.pesado = pesado
+        self.min_margin = min_margin
+        self.stats = CascadeStats()
+
+    def motivo(self, mano):
+        """Por qué las reglas no bastan para `mano` (ver MOTIVOS) o None si la resuelven."""
+        if mano["letra"] is None:
+            return "ninguna"
+        # "R2" es la segunda regla de R: misma letra
+        if len({nombre.rstrip("0123456789") for nombre in mano["reglas"]}) > 1:
+            return "varias"
+        if mano["margen"] < self.min_margin:
+            return "margen"
+        return None
+
+    def resolver(self, manos):
+        """Pasa las manos ambiguas por la etapa cara (modifica `manos`: letra y etapa)."""
+        for mano in manos:
+            self.stats.hands += 1
+            motivo = self.motivo(mano)
+            if motivo is None:
+                self.stats.fast += 1
+                continue
+            self.stats.ambiguous[motivo] += 1
+            if self.pesado is None:
+                continue
+            t0 = time.perf_counter()
+            letra = self.pesado.clasificar(mano["landmarks"])
+            cambia = letra is not None and letra != mano["letra"]
+            self.stats.on_heavy(time.perf_counter() - t0, cambia)
+            if cambia:
+                mano["letra"], mano["etapa"] = letra, "modelo"
+        return manos
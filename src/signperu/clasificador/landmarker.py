@@ -0,0 +1,147 @@
+# srlsp-game/src/signperu/clasificador/landmarker.py
+# Motor alternativo: MediaPipe Tasks HandLandmarker en modo LIVE_STREAM (asíncrono).
+#
+# NOTAS:
+# - Misma interfaz que ClasificadorSenia (procesar_mano, anotar, reset, reglas_disparadas),
+#   así DetectorWrapper elige motor con cfg.DETECTOR_ENGINE sin que cambie nada más.
+# - procesar_mano() solo envía el frame (detect_async con su timestamp) y devuelve el
+#   último resultado ya terminado: la inferencia del frame N corre en el hilo de MediaPipe
+#   mientras ProcessingThread vuelve a por el N+1. La clasificación por reglas se hace en
+#   el callback, también fuera del hilo de procesamiento. Precio: la letra y los landmarks
+#   devueltos son de un frame anterior (normalmente el previo); se descartan si tienen más
+#   de `max_age` segundos.
+# - Si MediaPipe está ocupado, LIVE_STREAM descarta frames de entrada por su cuenta: no
+#   se acumula cola.
+# - El HandTracker se usa desde el callback (hilo de MediaPipe) y desde reset() (otro
+#   hilo): ambos lo tocan bajo `_tracker_lock` (siempre antes que `_lock`). reset() anota
+#   el timestamp del frame vacío que envía y el callback descarta los resultados de frames
+#   enviados hasta entonces, que si no devolverían a `_ultimo` la mano de la sesión anterior.
+# - El modelo .task es local (DETECTOR_TASKS_MODEL o clasificador/modelos/hand_landmarker.task,
+#   que no se distribuye con el repo: descargar el "hand_landmarker.task" oficial de
+#   MediaPipe). Sin él DetectorWrapper vuelve al motor legacy.
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from signperu.clasificador.manos import HandTracker, manos_payload
+from signperu.clasificador.reglas import ABECEDARIO
+from signperu.core.overlay import LandmarkOverlay
+
+MODEL_PATH = os.path.join(os.path.dirname(__file__), "modelos", "hand_landmarker.task")
+
+
+class ClasificadorLandmarker:
+    def __init__(self, model_path=MODEL_PATH, min_detection_confidence=0.7,
+                 min_tracking_confidence=0.5, max_age=0.5, on_result=None, max_num_hands=1):
+        # import diferido, igual que en ClasificadorSenia (core/warmup.py lo carga en segundo plano)
+        import mediapipe as mp
+        from mediapipe.tasks.python import BaseOptions, vision
+        self._mp = mp
+        self.overlay = LandmarkOverlay(thickness=1, point_size=3)
+        self.reglas_disparadas = []
+        self.max_age_ms = int(max_age * 1000)
+        self.on_result = on_result    # callback(latencia_s) por cada resultado (estadísticas)
+        self._lock = threading.Lock()
+        self._tracker_lock = threading.Lock()   # tracker + orden de los resultados frente a reset()
+        self._reset_ts = 0               # resultados con timestamp <= este son de antes de reset()
+        self._ultimo = (0, [], None)     # (timestamp_ms, manos, puntos (N, 21, 2) float32 | None)
+        self.tracker = HandTracker()
+        self.manos = []
+        self._ultimos_puntos = None
+        self._enviados = {}              # timestamp_ms -> perf_counter() del envío (latencia)
+        self._last_ts = 0
+        options = vision.HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            result_callback=self._on_result)
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def _timestamp_ms(self):
+        # LIVE_STREAM exige timestamps estrictamente crecientes
+        ts = max(time.monotonic_ns() // 1_000_000, self._last_ts + 1)
+        self._last_ts = ts
+        return ts
+
+    def _on_result(self, result, output_image, timestamp_ms):
+        """Callback en el hilo de MediaPipe: clasifica y deja el resultado listo para el siguiente frame."""
+        manos, puntos = [], None
+        with self._tracker_lock:
+            if timestamp_ms <= self._reset_ts:
+                return   # frame enviado antes de reset(): es de la sesión anterior
+            if result.hand_landmarks:
+                puntos = np.array([[[p.x, p.y] for p in lms] for lms in result.hand_landmarks], dtype=np.float32)
+                puntos *= (output_image.width, output_image.height)
+                lados = [h[0].category_name if h else None for h in result.handedness]
+                lados += [None] * (len(puntos) - len(lados))
+                ids = self.tracker.assign(puntos, lados)
+                # todas las manos en una sola evaluación vectorizada de la tabla de reglas
+                manos = manos_payload(puntos, lados, ids, ABECEDARIO.clasificar_manos(puntos))
+            else:
+                self.tracker.assign(np.zeros((0, 21, 2), dtype=np.float32), [])
+            with self._lock:
+                self._ultimo = (timestamp_ms, manos, puntos)
+                t_envio = self._enviados.pop(timestamp_ms, None)
+                # entradas descartadas por MediaPipe (estaba ocupado) nunca tendrán resultado
+                for ts in [ts for ts in self._enviados if ts < timestamp_ms]:
+                    del self._enviados[ts]
+        if self.on_result is not None and t_envio is not None:
+            self.on_result(time.perf_counter() - t_envio)
+
+    def procesar_mano(self, frame, anotar=True):
+        """
+        Envía `frame` a MediaPipe y devuelve el último resultado terminado:
+        (letra | None, frame (anotado si se pide), coordenadas (21, 2) int16 | None) de la
+        mano principal; todas las manos quedan en self.manos (como en ClasificadorSenia).
+        Las coordenadas son píxeles del frame en que se detectó (mismo tamaño que `frame`).
+        """
+        ts = self._timestamp_ms()
+        imagen = self._mp.Image(image_format=self._mp.ImageFormat.SRGB,
+                                data=cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        with self._lock:
+            self._enviados[ts] = time.perf_counter()
+        self.landmarker.detect_async(imagen, ts)
+
+        with self._lock:
+            ts_res, manos, puntos = self._ultimo
+        if not manos or ts - ts_res > self.max_age_ms:
+            self.manos = []
+            self._ultimos_puntos = None
+            return None, frame, None
+        self.manos = manos
+        self._ultimos_puntos = puntos
+        # mano principal: la de id más bajo (manos_payload las ordena por id)
+        letra, self.reglas_disparadas, coordenadas = manos[0]["letra"], manos[0]["reglas"], manos[0]["landmarks"]
+        if not anotar:
+            return letra, frame, coordenadas
+        return letra, self.anotar(frame), coordenadas
+
+    def anotar(self, frame):
+        """Copia BGR de `frame` con los landmarks (todas las manos) del último resultado dibujados."""
+        return self.overlay.draw(frame.copy(), self._ultimos_puntos)
+
+    def reset(self):
+        """Olvida el último resultado; un frame vacío hace que MediaPipe suelte la mano que seguía."""
+        with self._tracker_lock:
+            # los resultados pendientes (hasta el frame vacío incluido) se descartan al llegar
+            ts = self._timestamp_ms()
+            self._reset_ts = ts
+            self.tracker.reset()
+            with self._lock:
+                self._ultimo = (0, [], None)
+                self._enviados.clear()
+        self.manos = []
+        self._ultimos_puntos = None
+        self.reglas_disparadas = []
+        vacio = self._mp.Image(image_format=self._mp.ImageFormat.SRGB,
+                               data=np.zeros((64, 64, 3), dtype=np.uint8))
+        self.landmarker.detect_async(vacio, ts)
+
+    def close(self):
+        self.landmarker.close()
@@ -0,0 +1,84 @@
+# srlsp-game/src/signperu/clasificador/manos.py
+# Identificadores estables para varias manos en la misma cámara.
+#
+# NOTAS:
+# - MediaPipe no garantiza el orden de las manos entre frames. HandTracker empareja las
+#   manos de cada frame con las del anterior por distancia entre centros (en unidades de
+#   tamaño de mano, así no depende de la resolución), con penalización si cambia la
+#   lateralidad, y de forma voraz de menor a mayor distancia.
+# - Una mano que no aparece conserva su id durante `max_missing` detecciones (parpadeos
+#   del detector); pasado eso el id se retira y no se reutiliza.
+# - La mano "principal" (la que alimenta letra/landmarks de un solo jugador) es la de id
+#   más bajo: la que lleva más tiempo en escena.
+import numpy as np
+
+from signperu.clasificador.reglas import MIDDLE_MCP, WRIST
+
+
+class HandTracker:
+    def __init__(self, max_dist=1.5, max_missing=5, side_penalty=1.0):
+        self.max_dist = max_dist
+        self.max_missing = max_missing
+        self.side_penalty = side_penalty
+        self._next_id = 1
+        self._ids = []        # ids de las pistas activas
+        self._centros = None  # (T, 2) centro de cada pista
+        self._lados = []      # lateralidad de cada pista
+        self._faltas = []     # detecciones seguidas sin verla
+
+    def reset(self):
+        self._ids, self._centros, self._lados, self._faltas = [], None, [], []
+
+    def assign(self, puntos, lados):
+        """
+        puntos: (N, 21, 2) píxeles de las manos del frame; lados: N etiquetas ("Left"/"Right"/None).
+        Devuelve la lista de N ids estables.
+        """
+        n = len(puntos)
+        centros = puntos.mean(axis=1) if n else np.zeros((0, 2), dtype=np.float32)
+        ids = [None] * n
+        usadas = set()
+        if n and self._ids:
+            tam = np.linalg.norm(puntos[:, MIDDLE_MCP] - puntos[:, WRIST], axis=-1)
+            dist = np.linalg.norm(centros[:, None, :] - self._centros[None, :, :], axis=-1)
+            dist = dist / np.maximum(tam, 1e-6)[:, None]
+            dist += self.side_penalty * (np.array(lados, dtype=object)[:, None] != np.array(self._lados, dtype=object)[None, :])
+            for i, t in zip(*np.unravel_index(np.argsort(dist, axis=None), dist.shape)):
+                if dist[i, t] > self.max_dist:
+                    break
+                if ids[i] is None and t not in usadas:
+                    ids[i] = self._ids[t]
+                    usadas.add(t)
+        # pistas no vistas: una falta más (se retiran al superar max_missing)
+        nuevos_ids, nuevos_centros, nuevos_lados, nuevas_faltas = [], [], [], []
+        for t, tid in enumerate(self._ids):
+            if t not in usadas and self._faltas[t] < self.max_missing:
+                nuevos_ids.append(tid)
+                nuevos_centros.append(self._centros[t])
+                nuevos_lados.append(self._lados[t])
+                nuevas_faltas.append(self._faltas[t] + 1)
+        for i in range(n):
+            if ids[i] is None:
+                ids[i] = self._next_id
+                self._next_id += 1
+            nuevos_ids.append(ids[i])
+            nuevos_centros.append(centros[i])
+            nuevos_lados.append(lados[i])
+            nuevas_faltas.append(0)
+        self._ids, self._lados, self._faltas = nuevos_ids, nuevos_lados, nuevas_faltas
+        self._centros = np.array(nuevos_centros, dtype=np.float32).reshape(-1, 2)
+        return ids
+
+
+def manos_payload(puntos, lados, ids, resultados):
+    """
+    Lista de manos para el evento 'hand_detected' (kwarg hands=), ordenada por id:
+    [{"id", "lado", "letra", "reglas", "margen", "etapa", "landmarks" (21, 2) int16}].
+    `resultados`: salida de ReglasCompiladas.clasificar_manos. "etapa" dice quién decidió la
+    letra ("reglas", o "modelo" si la cascada de clasificador/cascada.py la cambió).
+    """
+    manos = [{"id": tid, "lado": lado, "letra": letra, "reglas": reglas, "margen": margen,
+              "etapa": "reglas", "landmarks": pts.astype(np.int16)}
+             for pts, lado, tid, (letra, reglas, margen) in zip(puntos, lados, ids, resultados)]
+    manos.sort(key=lambda m: m["id"])
+    return manos
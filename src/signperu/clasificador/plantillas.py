@@ -0,0 +1,191 @@
+# srlsp-game/src/signperu/clasificador/plantillas.py
+# Clasificador por vecino más cercano contra una biblioteca de plantillas etiquetadas.
+#
+# Formato del índice (carpeta, se construye offline con `python -m signperu.clasificador.plantillas`):
+#   meta.json      -> letras, alumnos, dimensión, tamaño de hoja, nº de plantillas
+#   puntos.npy     -> (N, 42) float32 vectores de características, en el orden de las hojas
+#   letras.npy     -> (N,) int16 índice en meta["letras"]
+#   alumnos.npy    -> (N,) int32 índice en meta["alumnos"] (0 = plantilla general)
+#   hojas.npy      -> (H, 2) int32 rango [inicio, fin) de cada hoja del KD-tree en puntos.npy
+#   cajas.npy      -> (2, H, 42) float32 caja envolvente de cada hoja (mínimos, máximos)
+#
+# NOTAS:
+# - Característica: los 21 landmarks relativos a la muñeca y divididos por el tamaño de la
+#   mano (muñeca -> MCP medio, igual que las reglas), aplanados a 42 valores. La distancia
+#   es euclídea en "tamaños de mano".
+# - El KD-tree se construye una vez (corte por la mediana de la dimensión de más varianza
+#   hasta hojas de `hoja` plantillas, contiguas en puntos.npy). Cargar es solo
+#   np.load(mmap_mode='r'): no se lee ni se reconstruye nada al arrancar y los carriles
+#   comparten las páginas del SO.
+# - Consulta exacta "mejor hoja primero": la distancia² de la consulta a las cajas de todas
+#   las hojas se calcula en una sola operación NumPy (cota inferior), y se recorren las
+#   hojas de menor a mayor cota hasta que la cota supera el mejor candidato. Recorrer los
+#   nodos internos en Python costaba más de lo que podaba en 42 dimensiones. Las poses se
+#   agrupan por letra, así que se abren pocas hojas incluso con decenas de miles de plantillas.
+# - Plantillas por alumno: cada plantilla tiene un alumno ("" = general). Con `alumno`
+#   se buscan las generales más las suyas; sin él, solo las generales.
+# - ClasificadorPlantillas.clasificar() (letra | None) es la etapa cara de la cascada de
+#   DetectorWrapper (clasificador/cascada.py); None si la plantilla más cercana está a más
+#   de `max_dist`.
+import argparse
+import csv
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from signperu.clasificador.reglas import MIDDLE_MCP, WRIST
+
+META_FILE = "meta.json"
+
+
+def caracteristicas(puntos):
+    """Vectores (N, 42) float32 de landmarks (N, 21, 2) o (21, 2) en píxeles."""
+    puntos = np.asarray(puntos, dtype=np.float32)
+    if puntos.ndim == 2:
+        puntos = puntos[None]
+    rel = puntos - puntos[:, WRIST:WRIST + 1]
+    tam = np.linalg.norm(rel[:, MIDDLE_MCP], axis=-1)
+    return (rel / np.maximum(tam, 1e-6)[:, None, None]).reshape(len(puntos), -1)
+
+
+# ---------------- construcción (offline) ----------------
+def construir_indice(puntos, letras, alumnos, carpeta, hoja=64):
+    """
+    Construye y guarda el índice en `carpeta`.
+    puntos: (N, 21, 2) landmarks en píxeles; letras, alumnos: N etiquetas ("" = general).
+    """
+    x = caracteristicas(puntos)
+    nombres_letras = sorted(set(letras))
+    nombres_alumnos = [""] + sorted(set(alumnos) - {""})
+    y = np.array([nombres_letras.index(l) for l in letras], dtype=np.int16)
+    a = np.array([nombres_alumnos.index(al) for al in alumnos], dtype=np.int32)
+
+    orden = np.arange(len(x))
+    hojas = []
+
+    def dividir(inicio, fin):
+        if fin - inicio <= hoja:
+            hojas.append((inicio, fin))
+            return
+        sub = x[orden[inicio:fin]]
+        dim = int(np.argmax(sub.var(axis=0)))
+        mitad = (fin - inicio) // 2
+        orden[inicio:fin] = orden[inicio:fin][np.argpartition(sub[:, dim], mitad)]
+        dividir(inicio, inicio + mitad)
+        dividir(inicio + mitad, fin)
+
+    dividir(0, len(x))
+    x = x[orden]
+    os.makedirs(carpeta, exist_ok=True)
+    np.save(os.path.join(carpeta, "puntos.npy"), np.ascontiguousarray(x))
+    np.save(os.path.join(carpeta, "letras.npy"), y[orden])
+    np.save(os.path.join(carpeta, "alumnos.npy"), a[orden])
+    np.save(os.path.join(carpeta, "hojas.npy"), np.array(hojas, dtype=np.int32))
+    np.save(os.path.join(carpeta, "cajas.npy"),
+            np.array([[x[i:f].min(axis=0) for i, f in hojas],
+                      [x[i:f].max(axis=0) for i, f in hojas]], dtype=np.float32))
+    with open(os.path.join(carpeta, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({"letras": nombres_letras, "alumnos": nombres_alumnos, "dim": int(x.shape[1]),
+                   "hoja": hoja, "plantillas": int(len(x))}, f, indent=2, ensure_ascii=False)
+
+
+def leer_csv(rutas):
+    """Plantillas de CSV con columnas letra, alumno, x0, y0, ..., x20, y20 (píxeles)."""
+    puntos, letras, alumnos = [], [], []
+    for ruta in rutas:
+        with open(ruta, newline="", encoding="utf-8") as f:
+            for fila in csv.DictReader(f):
+                letras.append(fila["letra"].strip().upper())
+                alumnos.append((fila.get("alumno") or "").strip())
+                puntos.append([[float(fila[f"x{i}"]), float(fila[f"y{i}"])] for i in range(21)])
+    return np.array(puntos, dtype=np.float32).reshape(-1, 21, 2), letras, alumnos
+
+
+# ---------------- consulta ----------------
+class IndicePlantillas:
+    """Índice KD-tree de solo lectura cargado con memory-map."""
+    def __init__(self, carpeta):
+        with open(os.path.join(carpeta, META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.letras = meta["letras"]
+        self.alumnos = meta["alumnos"]
+        # np.asarray: vista ndarray sobre el mmap (sin copia ni la sobrecarga de np.memmap)
+        self.puntos = np.asarray(np.load(os.path.join(carpeta, "puntos.npy"), mmap_mode="r"))
+        self.etiquetas = np.asarray(np.load(os.path.join(carpeta, "letras.npy"), mmap_mode="r"))
+        self.de_alumno = np.asarray(np.load(os.path.join(carpeta, "alumnos.npy"), mmap_mode="r"))
+        self.hojas = np.load(os.path.join(carpeta, "hojas.npy")).tolist()
+        cajas = np.load(os.path.join(carpeta, "cajas.npy"), mmap_mode="r")
+        self._min, self._max = np.asarray(cajas[0]), np.asarray(cajas[1])
+
+    def __len__(self):
+        return len(self.puntos)
+
+    def buscar(self, puntos, alumno=None):
+        """
+        Plantilla más cercana a la mano `puntos` (21, 2) px: (letra | None, distancia, alumno).
+        Con `alumno` se consideran también sus plantillas propias.
+        """
+        q = caracteristicas(puntos)[0]
+        permitido = self.alumnos.index(alumno) if alumno in self.alumnos else 0
+        mejor_d2, mejor = float("inf"), -1
+        # cota inferior de la distancia² a cada hoja: distancia a su caja envolvente
+        fuera = np.maximum(self._min - q, 0) + np.maximum(q - self._max, 0)
+        cotas = np.einsum("hd,hd->h", fuera, fuera)
+        for h in np.argsort(cotas).tolist():
+            if cotas[h] >= mejor_d2:
+                break
+            inicio, fin = self.hojas[h]
+            d2 = ((self.puntos[inicio:fin] - q) ** 2).sum(axis=1)
+            alumnos = self.de_alumno[inicio:fin]
+            d2[(alumnos != 0) & (alumnos != permitido)] = np.inf
+            i = int(d2.argmin())
+            if d2[i] < mejor_d2:
+                mejor_d2, mejor = float(d2[i]), inicio + i
+        if mejor < 0:
+            return None, float("inf"), None
+        return (self.letras[int(self.etiquetas[mejor])], mejor_d2 ** 0.5,
+                self.alumnos[int(self.de_alumno[mejor])] or None)
+
+
+@lru_cache(maxsize=4)
+def cargar_indice(carpeta):
+    """Índice compartido por todos los detectores del proceso (la carga es un mmap)."""
+    return IndicePlantillas(carpeta)
+
+
+class ClasificadorPlantillas:
+    """Motor de clasificación por plantillas: clasificar(landmarks) -> letra | None."""
+    def __init__(self, carpeta, max_dist=1.0, alumno=None):
+        self.indice = cargar_indice(os.path.abspath(carpeta))
+        self.max_dist = max_dist
+        self.alumno = alumno
+        self.ultima_distancia = None
+
+    def clasificar_con_distancia(self, puntos):
+        letra, distancia, _ = self.indice.buscar(puntos, self.alumno)
+        self.ultima_distancia = distancia
+        return letra, distancia
+
+    def clasificar(self, puntos):
+        letra, distancia = self.clasificar_con_distancia(puntos)
+        return letra if distancia <= self.max_dist else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Construye el índice de plantillas de landmarks.")
+    parser.add_argument("csv", nargs="+", help="CSV con columnas letra, alumno, x0, y0, ..., x20, y20")
+    parser.add_argument("-o", "--salida", required=True, help="Carpeta del índice")
+    parser.add_argument("--hoja", type=int, default=64, help="Plantillas por hoja del KD-tree")
+    args = parser.parse_args()
+    puntos, letras, alumnos = leer_csv(args.csv)
+    if not len(puntos):
+        parser.error("no hay plantillas en los CSV")
+    construir_indice(puntos, letras, alumnos, args.salida, hoja=args.hoja)
+    print(f"{len(puntos)} plantillas ({len(set(letras))} letras, "
+          f"{len(set(alumnos) - {''})} alumnos) -> {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
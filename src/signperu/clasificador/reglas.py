@@ -0,0 +1,254 @@
+# srlsp-game/src/signperu/clasificador/reglas.py
+# Reglas del abecedario como tabla declarativa, evaluadas para todas las letras a la vez.
+#
+# NOTAS:
+# - Cada regla es (letra, [condiciones]); una condición acota una característica de un
+#   par de landmarks con límites estrictos:  lo < valor < hi.
+#     menor_y(a, b)          -> y[a] < y[b]   (a está por encima de b en la imagen)
+#     menor_x(a, b)          -> x[a] < x[b]
+#     ady(a, b, lo, hi)      -> lo < |y[a] - y[b]| < hi
+#     adx(a, b, lo, hi)      -> lo < |x[a] - x[b]| < hi
+#     dist(a, b, lo, hi)     -> lo < distancia(a, b) < hi   (se evalúa al cuadrado, sin raíz)
+# - Independiente de la resolución: antes de evaluar, los puntos se dividen por el tamaño
+#   de la mano (muñeca -> MCP del dedo medio). Los umbrales de la tabla se escriben en
+#   píxeles de una mano de referencia de REFERENCE_HAND_SIZE px (la mano típica en un
+#   frame 640x480, con la que se calibraron) y se compilan a unidades de "tamaño de mano".
+#   Así el detector puede trabajar con frames de 320x240 o menores sin recalibrar.
+# - ReglasCompiladas junta los pares y las condiciones repetidas, calcula todas las
+#   características con una sola resta vectorizada y resuelve cada regla con un producto
+#   matriz (condiciones cumplidas x pertenencia). El coste por mano es constante y admite
+#   lotes (N, 21, 2).
+# - Si varias reglas se cumplen gana la primera de la tabla (mismo orden que el antiguo
+#   if/elif), pero clasificar() devuelve también todas las que se cumplieron, así que los
+#   empates dejan de ser silenciosos.
+# - Margen (clasificar_manos): puntuación de cada letra = fracción de condiciones cumplidas
+#   de su mejor regla; margen = mejor letra - segunda. 0 si dos letras se cumplen a la vez,
+#   cercano a 0 si otra letra estuvo a punto de cumplirse. Lo usa la cascada
+#   (clasificador/cascada.py) para decidir cuándo hace falta un clasificador más caro.
+import numpy as np
+
+# Índices de los 21 landmarks de MediaPipe Hands
+(WRIST, THUMB_CMC, THUMB_MCP, THUMB_IP, THUMB_TIP,
+ INDEX_MCP, INDEX_PIP, INDEX_DIP, INDEX_TIP,
+ MIDDLE_MCP, MIDDLE_PIP, MIDDLE_DIP, MIDDLE_TIP,
+ RING_MCP, RING_PIP, RING_DIP, RING_TIP,
+ PINKY_MCP, PINKY_PIP, PINKY_DIP, PINKY_TIP) = range(21)
+
+INF = float("inf")
+# longitud muñeca -> MCP medio (px) de la mano con la que se calibraron los umbrales a 640x480
+REFERENCE_HAND_SIZE = 100.0
+_TIPOS = ("dx", "dy", "adx", "ady", "d2")
+
+
+# ---------------- constructores de condiciones ----------------
+def menor_y(a, b):
+    return ("dy", a, b, -INF, 0)
+
+
+def menor_x(a, b):
+    return ("dx", a, b, -INF, 0)
+
+
+def ady(a, b, lo=-INF, hi=INF):
+    return ("ady", a, b, lo, hi)
+
+
+def adx(a, b, lo=-INF, hi=INF):
+    return ("adx", a, b, lo, hi)
+
+
+def dist(a, b, lo=None, hi=None):
+    return ("d2", a, b, -INF if lo is None else lo ** 2, INF if hi is None else hi ** 2)
+
+
+def _muneca_arriba(*puntos):
+    return [menor_y(WRIST, p) for p in puntos]
+
+
+# ---------------- tabla del abecedario (umbrales en px de la mano de referencia) ----------------
+_I = [menor_y(PINKY_TIP, PINKY_PIP), menor_y(INDEX_DIP, INDEX_TIP), menor_y(MIDDLE_DIP, MIDDLE_TIP),
+      menor_y(RING_DIP, RING_TIP), menor_y(THUMB_IP, THUMB_TIP)]
+
+REGLAS = [
+    ("A", [ady(THUMB_TIP, INDEX_PIP, hi=30), ady(THUMB_TIP, MIDDLE_PIP, hi=30),
+           ady(THUMB_TIP, RING_PIP, hi=30), ady(THUMB_TIP, PINKY_PIP, hi=30)]),
+    ("B", [menor_y(INDEX_TIP, INDEX_PIP), menor_y(PINKY_TIP, PINKY_PIP), menor_y(MIDDLE_TIP, MIDDLE_PIP),
+           menor_y(RING_TIP, RING_PIP), menor_y(MIDDLE_TIP, RING_TIP), ady(THUMB_TIP, INDEX_MCP, hi=40)]),
+    ("C", [ady(INDEX_TIP, THUMB_TIP, 30, 80), adx(INDEX_TIP, THUMB_TIP, hi=50),
+           menor_y(MIDDLE_DIP, MIDDLE_TIP), menor_y(RING_DIP, RING_TIP), menor_y(PINKY_DIP, PINKY_TIP)]),
+    ("D", [dist(THUMB_TIP, MIDDLE_TIP, hi=65), dist(THUMB_TIP, RING_TIP, hi=65), menor_y(PINKY_PIP, PINKY_TIP),
+           menor_y(MIDDLE_PIP, MIDDLE_TIP), menor_y(RING_PIP, RING_TIP), menor_y(INDEX_TIP, INDEX_PIP)]),
+    ("E", [menor_y(INDEX_PIP, INDEX_TIP), menor_y(PINKY_PIP, PINKY_TIP), menor_y(MIDDLE_PIP, MIDDLE_TIP),
+           menor_y(RING_PIP, RING_TIP), ady(INDEX_TIP, THUMB_TIP, hi=15), menor_y(INDEX_TIP, THUMB_TIP),
+           menor_y(MIDDLE_TIP, THUMB_TIP), menor_y(RING_TIP, THUMB_TIP)]),
+    ("F", [menor_y(PINKY_TIP, PINKY_PIP), menor_y(MIDDLE_TIP, MIDDLE_PIP), menor_y(RING_TIP, RING_PIP),
+           menor_y(INDEX_PIP, INDEX_TIP), ady(THUMB_MCP, THUMB_TIP, lo=0), dist(INDEX_TIP, THUMB_TIP, hi=65)]),
+    ("G", [ady(INDEX_TIP, THUMB_TIP, 20, 60), adx(INDEX_TIP, THUMB_TIP, 10, 30),
+           menor_y(MIDDLE_PIP, MIDDLE_TIP), menor_y(RING_PIP, RING_TIP), menor_y(PINKY_PIP, PINKY_TIP)]),
+    ("H", [menor_y(INDEX_TIP, INDEX_PIP), menor_y(MIDDLE_TIP, MIDDLE_PIP), menor_y(RING_PIP, RING_TIP),
+           menor_y(PINKY_PIP, PINKY_TIP), ady(INDEX_TIP, MIDDLE_TIP, hi=20),
+           # el índice está por encima de los demás dedos
+           menor_y(INDEX_TIP, MIDDLE_TIP), menor_y(INDEX_TIP, RING_TIP), menor_y(INDEX_TIP, PINKY_TIP)]),
+    ("I", _I),
+    # J comparte las condiciones de I (+ el pulgar toca index_pip): con prioridad por
+    # orden nunca gana, pero aparece en las reglas disparadas
+    ("J", _I + [dist(THUMB_TIP, INDEX_PIP, hi=20)]),
+    ("K", [menor_y(INDEX_TIP, INDEX_PIP), menor_y(MIDDLE_TIP, MIDDLE_PIP), menor_y(RING_PIP, RING_TIP),
+           menor_y(PINKY_PIP, PINKY_TIP), menor_x(THUMB_TIP, MIDDLE_MCP), ady(INDEX_TIP, MIDDLE_TIP, 20, 30),
+           dist(THUMB_TIP, INDEX_PIP, hi=20),
+           menor_y(INDEX_TIP, MIDDLE_TIP), menor_y(INDEX_TIP, RING_TIP), menor_y(INDEX_TIP, PINKY_TIP)]),
+    ("L", [dist(THUMB_TIP, INDEX_MCP, lo=30), menor_y(INDEX_TIP, INDEX_PIP), menor_y(MIDDLE_PIP, MIDDLE_TIP),
+           menor_y(RING_PIP, RING_TIP), menor_y(PINKY_PIP, PINKY_TIP)]),
+    ("M", _muneca_arriba(THUMB_TIP, INDEX_TIP) +
+          [dist(THUMB_TIP, PINKY_DIP, hi=20), menor_y(INDEX_TIP, INDEX_PIP), menor_y(MIDDLE_TIP, MIDDLE_PIP),
+           menor_y(RING_TIP, RING_PIP), menor_y(PINKY_PIP, PINKY_TIP),
+           adx(INDEX_TIP, MIDDLE_TIP, hi=15), adx(MIDDLE_TIP, RING_TIP, hi=15)]),
+    ("N", _muneca_arriba(THUMB_TIP, INDEX_TIP) +
+          [dist(THUMB_TIP, PINKY_TIP, hi=20), dist(THUMB_TIP, RING_TIP, hi=20), menor_y(INDEX_TIP, INDEX_PIP),
+           menor_y(MIDDLE_TIP, MIDDLE_PIP), menor_y(RING_PIP, RING_TIP), menor_y(PINKY_PIP, PINKY_TIP),
+           adx(INDEX_TIP, MIDDLE_TIP, hi=15)]),
+    ("O", [dist(THUMB_TIP, INDEX_TIP, hi=10), dist(THUMB_TIP, MIDDLE_TIP, hi=10),
+           dist(THUMB_TIP, RING_TIP, hi=10), dist(THUMB_TIP, PINKY_TIP, hi=10),
+           menor_y(INDEX_PIP, INDEX_TIP), menor_y(MIDDLE_PIP, MIDDLE_TIP),
+           menor_y(RING_PIP, RING_TIP), menor_y(PINKY_PIP, PINKY_TIP)]),
+    ("P", _muneca_arriba(THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP) +
+          [menor_y(INDEX_MCP, THUMB_TIP), menor_y(INDEX_TIP, INDEX_MCP), menor_y(INDEX_TIP, MIDDLE_TIP)]),
+    ("Q", _muneca_arriba(THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP) +
+          [menor_y(THUMB_TIP, INDEX_MCP), menor_y(INDEX_PIP, INDEX_TIP), menor_y(MIDDLE_PIP, MIDDLE_TIP),
+           menor_y(RING_PIP, RING_TIP), menor_y(PINKY_PIP, PINKY_TIP), adx(THUMB_TIP, INDEX_TIP, lo=10)]),
+    ("R", [dist(INDEX_TIP, MIDDLE_TIP, hi=20), menor_y(INDEX_TIP, INDEX_PIP), menor_y(MIDDLE_TIP, MIDDLE_PIP),
+           menor_y(RING_PIP, RING_TIP), menor_y(PINKY_PIP, PINKY_TIP), menor_y(INDEX_PIP, THUMB_TIP),
+           dist(THUMB_TIP, INDEX_PIP, lo=30)]),
+    # segunda variante de R (lógica propia)
+    ("R", [adx(THUMB_TIP, RING_TIP, hi=20), ady(THUMB_TIP, RING_TIP, hi=20),
+           adx(INDEX_TIP, MIDDLE_DIP, hi=20), ady(INDEX_TIP, MIDDLE_DIP, hi=20), menor_y(MIDDLE_TIP, INDEX_TIP),
+           menor_y(RING_DIP, RING_PIP), menor_y(PINKY_DIP, PINKY_PIP), menor_y(RING_TIP, PINKY_TIP)]),
+    ("S", [adx(THUMB_IP, INDEX_DIP, hi=20), ady(THUMB_IP, INDEX_DIP, hi=20),
+           adx(THUMB_TIP, MIDDLE_PIP, hi=20), ady(THUMB_TIP, MIDDLE_PIP, hi=20),
+           menor_y(INDEX_DIP, INDEX_PIP), menor_y(MIDDLE_DIP, MIDDLE_PIP),
+           menor_y(RING_DIP, RING_PIP), menor_y(PINKY_DIP, PINKY_PIP)]),
+    ("T", [adx(THUMB_TIP, INDEX_DIP, hi=20), ady(THUMB_TIP, INDEX_DIP, hi=20), ady(INDEX_TIP, INDEX_DIP, hi=10),
+           menor_y(INDEX_PIP, MIDDLE_PIP), menor_y(INDEX_PIP, RING_PIP), menor_y(INDEX_PIP, PINKY_PIP)]),
+    ("U", [adx(THUMB_TIP, MIDDLE_DIP, hi=30), ady(THUMB_TIP, MIDDLE_DIP, hi=30), menor_y(INDEX_TIP, INDEX_PIP),
+           menor_y(MIDDLE_PIP, MIDDLE_TIP), menor_y(RING_PIP, RING_TIP), menor_y(PINKY_TIP, PINKY_PIP)]),
+    ("V", [adx(THUMB_TIP, RING_PIP, hi=30), ady(THUMB_TIP, RING_PIP, hi=30), menor_y(INDEX_TIP, INDEX_PIP),
+           menor_y(MIDDLE_TIP, MIDDLE_PIP), menor_y(RING_PIP, RING_TIP), menor_y(PINKY_PIP, PINKY_TIP),
+           adx(INDEX_TIP, MIDDLE_TIP, lo=50)]),
+    ("W", [adx(THUMB_TIP, PINKY_TIP, hi=30), ady(THUMB_TIP, PINKY_TIP, hi=30), menor_y(INDEX_TIP, INDEX_PIP),
+           menor_y(MIDDLE_TIP, MIDDLE_PIP), menor_y(RING_TIP, RING_PIP), menor_y(PINKY_PIP, PINKY_TIP),
+           adx(INDEX_TIP, MIDDLE_TIP, lo=50), adx(MIDDLE_TIP, RING_TIP, lo=50)]),
+    ("X", [adx(THUMB_TIP, MIDDLE_DIP, hi=30), ady(THUMB_TIP, MIDDLE_DIP, hi=30),
+           menor_y(INDEX_PIP, MIDDLE_PIP), menor_y(INDEX_PIP, RING_PIP), menor_y(INDEX_PIP, PINKY_PIP),
+           menor_y(INDEX_PIP, INDEX_TIP), menor_y(MIDDLE_PIP, MIDDLE_TIP),
+           menor_y(RING_PIP, RING_TIP), menor_y(PINKY_PIP, PINKY_TIP)]),
+    ("Y", [adx(THUMB_TIP, INDEX_PIP, lo=50), menor_y(THUMB_TIP, INDEX_PIP), menor_y(MIDDLE_PIP, INDEX_PIP),
+           menor_y(RING_PIP, MIDDLE_PIP), menor_y(PINKY_PIP, RING_PIP),
+           adx(PINKY_TIP, RING_PIP, lo=50), menor_y(PINKY_TIP, RING_PIP)]),
+    ("Z", [adx(THUMB_TIP, MIDDLE_PIP, hi=20), ady(THUMB_TIP, MIDDLE_PIP, hi=20),
+           menor_y(INDEX_PIP, MIDDLE_PIP), menor_y(RING_PIP, MIDDLE_PIP), menor_y(PINKY_PIP, RING_PIP)]),
+]
+
+
+class ReglasCompiladas:
+    """
+    Tabla de reglas preparada para evaluarse con NumPy.
+    clasificar(puntos (21, 2))      -> (letra | None, [nombres de reglas cumplidas])
+    clasificar_lote(puntos (N, 21, 2)) -> lista de letras | None
+    clasificar_manos(puntos (N, 21, 2)) -> [(letra | None, [nombres], margen)] con una sola evaluación
+    `puntos` en píxeles (x, y) de cualquier resolución, con la misma escala en ambos ejes.
+    """
+    def __init__(self, reglas=REGLAS, hand_size=REFERENCE_HAND_SIZE):
+        self.letras = [letra for letra, _ in reglas]
+        # nombre único por regla: la segunda variante de R se llama "R2"
+        vistos = {}
+        self.nombres = []
+        for letra in self.letras:
+            vistos[letra] = vistos.get(letra, 0) + 1
+            self.nombres.append(letra if vistos[letra] == 1 else f"{letra}{vistos[letra]}")
+
+        pares, caracts, conds = {}, {}, {}
+        miembros = []    # (condición, regla)
+        for r, (_, condiciones) in enumerate(reglas):
+            for tipo, a, b, lo, hi in condiciones:
+                # umbrales de la mano de referencia -> unidades de tamaño de mano
+                k = hand_size ** 2 if tipo == "d2" else hand_size
+                lo, hi = lo / k, hi / k
+                p = pares.setdefault((a, b), len(pares))
+                f = caracts.setdefault((_TIPOS.index(tipo), p), len(caracts))
+                c = conds.setdefault((f, lo, hi), len(conds))
+                miembros.append((c, r))
+
+        ab = np.array(list(pares), dtype=np.intp)
+        self._a, self._b = ab[:, 0], ab[:, 1]
+        tp = np.array(list(caracts), dtype=np.intp)
+        self._tipo, self._par = tp[:, 0], tp[:, 1]
+        cl = list(conds)
+        self._feat = np.array([f for f, _, _ in cl], dtype=np.intp)
+        self._lo = np.array([lo for _, lo, _ in cl], dtype=np.float64)
+        self._hi = np.array([hi for _, _, hi in cl], dtype=np.float64)
+        self._m = np.zeros((len(cl), len(reglas)), dtype=np.int32)
+        for c, r in miembros:
+            self._m[c, r] = 1
+        self._n = self._m.sum(axis=0)    # condiciones por regla
+        # letra (sin duplicados) de cada regla, para puntuar por letra (R y R2 son la misma)
+        self.letras_unicas = list(dict.fromkeys(self.letras))
+        self._letra_de_regla = np.array([self.letras_unicas.index(l) for l in self.letras], dtype=np.intp)
+
+    @staticmethod
+    def normalizar(puntos):
+        """Puntos (N, 21, 2) divididos por el tamaño de cada mano (muñeca -> MCP medio)."""
+        puntos = puntos.astype(np.float32)
+        tam = np.linalg.norm(puntos[:, MIDDLE_MCP] - puntos[:, WRIST], axis=-1)
+        return puntos / np.maximum(tam, 1e-6)[:, None, None]
+
+    def caracteristicas(self, puntos):
+        """Valores (N, F) de todas las características usadas por la tabla (puntos ya normalizados)."""
+        d = puntos[:, self._a] - puntos[:, self._b]          # (N, P, 2)
+        dx, dy = d[..., 0], d[..., 1]
+        todas = np.stack((dx, dy, np.abs(dx), np.abs(dy), dx * dx + dy * dy), axis=1)   # (N, 5, P)
+        return todas[:, self._tipo, self._par]
+
+    def _cumplidas(self, puntos):
+        """Condiciones cumplidas por regla (N, R) int32."""
+        puntos = np.asarray(puntos)
+        if puntos.ndim == 2:
+            puntos = puntos[None]
+        v = self.caracteristicas(self.normalizar(puntos))[:, self._feat]      # (N, C)
+        ok = (v > self._lo) & (v < self._hi)
+        return ok.astype(np.int32) @ self._m
+
+    def evaluar(self, puntos):
+        """Matriz booleana (N, R): qué reglas se cumplen para cada mano."""
+        return self._cumplidas(puntos) == self._n
+
+    def margenes(self, cumplidas):
+        """Margen (N,) entre la mejor letra y la segunda, a partir de _cumplidas()."""
+        frac = cumplidas / self._n                                   # (N, R)
+        por_letra = np.zeros((len(frac), len(self.letras_unicas)))
+        np.maximum.at(por_letra.T, self._letra_de_regla, frac.T)     # mejor regla de cada letra
+        top = np.sort(por_letra, axis=1)[:, -2:]
+        return top[:, 1] - top[:, 0]
+
+    def clasificar_lote(self, puntos):
+        cumplidas = self.evaluar(puntos)
+        primera = cumplidas.argmax(axis=1)
+        return [self.letras[r] if cumplidas[i, r] else None for i, r in enumerate(primera.tolist())]
+
+    def clasificar_manos(self, puntos):
+        cumplidas = self._cumplidas(puntos)
+        resultados = []
+        for fila, margen in zip(cumplidas == self._n, self.margenes(cumplidas).tolist()):
+            r = np.flatnonzero(fila).tolist()
+            resultados.append((self.letras[r[0]] if r else None, [self.nombres[i] for i in r], margen))
+        return resultados
+
+    def clasificar(self, puntos):
+        cumplidas = self.evaluar(puntos)[0]
+        disparadas = [self.nombres[r] for r in np.flatnonzero(cumplidas).tolist()]
+        if not disparadas:
+            return None, disparadas
+        return self.letras[int(cumplidas.argmax())], disparadas
+
+
+# instancia compartida (la tabla es inmutable)
+ABECEDARIO = ReglasCompiladas()
@@ -0,0 +1,62 @@
+# srlsp-game/src/signperu/clasificador/roi.py
+# Región de interés (ROI) de la mano para recortar la entrada de MediaPipe.
+#
+# NOTAS:
+# - Tras detectar una mano, HandROI guarda un recorte cuadrado con margen alrededor de
+#   sus landmarks; el siguiente frame solo procesa ese recorte (conversión de color y
+#   detección sobre muchos menos píxeles).
+# - El recorte es "pegajoso": solo se recalcula cuando la mano se acerca al borde o cambia
+#   mucho de tamaño. Así el seguimiento interno de MediaPipe (static_image_mode=False)
+#   ve un encuadre estable en lugar de uno que salta en cada frame.
+# - Si la mano no aparece en el recorte, ClasificadorSenia reintenta con el frame
+#   completo en ese mismo frame y la ROI se descarta (lost()).
+
+
+class HandROI:
+    """
+    padding: margen alrededor de la caja de la mano (fracción de su lado mayor).
+    margin:  fracción interior del recorte que la mano puede ocupar antes de recolocarlo.
+    min_size: lado mínimo del recorte en píxeles.
+    """
+    def __init__(self, padding=0.6, margin=0.12, min_size=96):
+        self.padding = padding
+        self.margin = margin
+        self.min_size = min_size
+        self.box = None   # (x0, y0, x1, y1) en píxeles del frame completo
+
+    def crop(self, frame):
+        """Devuelve (vista del recorte, (x0, y0)); el frame entero si no hay ROI."""
+        if self.box is None:
+            return frame, (0, 0)
+        x0, y0, x1, y1 = self.box
+        return frame[y0:y1, x0:x1], (x0, y0)
+
+    def lost(self):
+        self.box = None
+
+    def update(self, puntos, frame_shape):
+        """Recoloca la ROI a partir de los landmarks (21, 2) en píxeles del frame completo."""
+        h, w = frame_shape[:2]
+        xmin, ymin = puntos.min(axis=0).tolist()
+        xmax, ymax = puntos.max(axis=0).tolist()
+        lado = max(xmax - xmin, ymax - ymin)
+        if self.box is not None and self._contiene(xmin, ymin, xmax, ymax, lado):
+            return
+        lado = max(self.min_size, int(lado * (1 + 2 * self.padding)))
+        if lado >= min(w, h):
+            # la mano ocupa casi todo el frame: recortar no ahorra nada
+            self.box = None
+            return
+        cx, cy = (xmin + xmax) / 2, (ymin + ymax) / 2
+        x0 = int(min(max(cx - lado / 2, 0), w - lado))
+        y0 = int(min(max(cy - lado / 2, 0), h - lado))
+        self.box = (x0, y0, x0 + lado, y0 + lado)
+
+    def _contiene(self, xmin, ymin, xmax, ymax, lado):
+        x0, y0, x1, y1 = self.box
+        actual = x1 - x0
+        m = self.margin * actual
+        dentro = xmin >= x0 + m and ymin >= y0 + m and xmax <= x1 - m and ymax <= y1 - m
+        # si la mano encogió mucho, el recorte ya es demasiado grande para ella
+        proporcionado = lado * (1 + 2 * self.padding) > 0.6 * actual or actual <= self.min_size
+        return dentro and proporcionado
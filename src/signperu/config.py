@@ -2,11 +2,43 @@
 # config.py
 # Configuración global del proyecto (valores por defecto)
 CAMERA_SRC = 0
+CAMERA_SOURCES = [CAMERA_SRC]  # una fuente por estación (varias cámaras en el mismo proceso)
+INFERENCE_WORKERS = None    # inferencias simultáneas entre estaciones (None = núcleos - 1)
 FPS = 12
 CAMERA_INDEX = 0            # índice de la cámara por defecto
 FRAME_WIDTH = 640           # ancho de la imagen capturada
 FRAME_HEIGHT = 480          # alto de la imagen capturada
 TARGET_FPS = 20             # fps objetivo para captura/procesamiento
-DETECTOR_SMOOTHING_WINDOW = 5  # tamaño de ventana para suavizado temporal
-DETECTOR_CONFIRM_THRESHOLD = 3 # número mínimo de repeticiones para confirmar una detección
+DETECTION_SIZE = (320, 240) # resolución (máx.) del frame que recibe el detector; None = frame completo.
+                            # Las reglas son relativas al tamaño de la mano: se puede bajar (p. ej. 256x192)
+GOVERNOR_ENABLED = True     # regula la tasa de captura según el throughput del detector
+GOVERNOR_MIN_FPS = 5        # tasa mínima de captura aunque el detector vaya muy lento
+CAPTURE_DECODE_ON_DEMAND = True  # grab() continuo y retrieve() solo de los frames que se van a usar
+DETECTOR_ROI_TRACKING = True     # MediaPipe procesa solo un recorte alrededor de la mano del frame anterior
+DETECTION_STRIDE_MAX = 1         # >1: MediaPipe solo cada N frames (N adaptativo <= este valor), el resto se predice
+DETECTION_STRIDE_BUDGET = 0.5    # fracción de un núcleo que puede ocupar la detección al elegir N
+DETECTOR_GATE = True             # salta MediaPipe si no hay movimiento (miniatura 32x24) y no se sigue una mano
+GATE_MOTION_THRESHOLD = 4.0      # diferencia media de gris (0-255) que cuenta como movimiento
+GATE_SKIN_MIN = 0.0              # fracción mínima de píxeles con tono de piel (0 = no se usa)
+GATE_HOLD_S = 1.0                # segundos que la puerta sigue abierta tras movimiento o mano
+DETECTOR_ENGINE = "legacy"        # "tasks": HandLandmarker LIVE_STREAM asíncrono (necesita el modelo .task)
+DETECTOR_TASKS_MODEL = None      # ruta al hand_landmarker.task (None = clasificador/modelos/hand_landmarker.task)
+DETECTOR_MAX_HANDS = 1           # manos por frame (>1: todas se clasifican y se publican en hand_detected hands=)
+DETECTOR_TEMPLATES = None        # carpeta del índice de plantillas (python -m signperu.clasificador.plantillas); etapa cara de la cascada
+DETECTOR_TEMPLATES_MAX_DIST = 0.8  # distancia máxima (en tamaños de mano) para aceptar la plantilla más cercana
+DETECTOR_TEMPLATES_STUDENT = None  # alumno cuyas plantillas propias se usan además de las generales
+DETECTOR_CASCADE_MIN_MARGIN = 0.0  # margen de reglas bajo el que una mano va a la etapa cara (0 = solo ninguna/varias letras)
+DETECTOR_MODEL_COMPLEXITY = 1    # modelo de landmarks de MediaPipe Hands (0 = ligero, 1 = completo)
+DETECTOR_MIN_DETECTION_CONFIDENCE = 0.7
+DETECTOR_MIN_TRACKING_CONFIDENCE = 0.5
+DETECTOR_AUTOTUNE = True         # core/tuner.py elige complejidad, DETECTION_SIZE y umbrales para esta máquina
+DETECTOR_LATENCY_BUDGET_MS = 40  # latencia objetivo de una detección (mediana) para el tuner
+TUNER_PROFILE_PATH = "signperu/data/detector_profiles.json"  # perfiles elegidos, uno por máquina
+TUNER_MAX_AGE_DAYS = 7           # pasado este tiempo se vuelve a medir la máquina
+TUNER_CALIBRATION_SOURCE = None  # grabación/vídeo con manos para calibrar (app.py --record); None = no se calibra
+DETECTOR_PROCESS = False         # True: MediaPipe en un proceso aparte por carril (frames por memoria compartida)
+RECORD_SIZE = (320, 240)         # tamaño de los frames grabados con --record (None = resolución completa)
+RECORD_MAX_FPS = 15              # tasa máxima grabada (0 = todos los frames capturados)
+DETECTOR_SMOOTHING_WINDOW = 0.5  # segundos de la ventana de suavizado temporal (independiente de los fps)
+DETECTOR_CONFIRM_THRESHOLD = 0.6 # fracción de la ventana que una letra debe ocupar para confirmarse
 DB_PATH = "signperu/data/signperu.db"   # ruta de la base de datos SQLite (carpeta data/)
@@ -1,60 +1,164 @@
 # srlsp-game/src/signperu/core/capture.py
-# Captura frames de la cámara en un hilo y los pone en una queue (thread-safe)
-import cv2
+# Captura frames de una FrameSource (cámara, vídeo, imágenes, sintética) en un hilo
+# y los publica en un FrameRing (buffers preasignados)
 import threading
 import time
-from queue import Queue, Empty
-from queue import Queue, Full
+
+import cv2
+
+from signperu import config as cfg
+from signperu.core.envelope import FrameEnvelope
+from signperu.core.frame_ring import FrameRing
+from signperu.core.governor import RateGovernor
+from signperu.core.sources import make_source
+from signperu.core.streams import StreamScaler, fit_size
 
 class CaptureThread(threading.Thread):
     """
-    Lector de cámara en un hilo. Publica frames por event_bus y también los pone en frame_queue.
+    Lector de frames en un hilo. Escribe cada frame directamente en un slot
+    preasignado del FrameRing (sin asignar memoria por frame) y lo publica por event_bus.
+    `source` puede ser una FrameSource o cualquier spec aceptada por make_source();
+    si no se indica se usa la cámara `src`.
+    La tasa de captura la decide un RateGovernor (compártelo con ProcessingThread).
+    Cada frame se escala una sola vez aquí: a DETECTION_SIZE en `detection_ring`
+    (lo que consume ProcessingThread) y a las resoluciones de pantalla pedidas
+    por los suscriptores de los flujos "frame@WxH" (ver core/streams.py).
     """
-    def __init__(self, event_bus, src=0, target_fps=20, frame_queue:Queue=None):
+    def __init__(self, event_bus, src=0, target_fps=20, frame_ring:FrameRing=None, slots=4, source=None,
+                 governor:RateGovernor=None, primary=True):
         super().__init__(daemon=True)
         self.src = src
-        self.cap = None
+        self.source = make_source(source if source is not None else src)
         self.running = False
         self.event_bus = event_bus
         self.target_fps = target_fps
-        self.frame_queue = frame_queue or Queue(maxsize=2)
+        self.frame_ring = frame_ring or FrameRing(shape=(cfg.FRAME_HEIGHT, cfg.FRAME_WIDTH, 3), slots=slots)
+        # anillo de frames a resolución de detección (el mismo anillo si DETECTION_SIZE es None)
+        self.detection_size = getattr(cfg, "DETECTION_SIZE", None)
+        if self.detection_size:
+            det_w, det_h = fit_size((self.frame_ring.shape[1], self.frame_ring.shape[0]), self.detection_size)
+            self.detection_ring = FrameRing(shape=(det_h, det_w, 3), slots=slots)
+        else:
+            self.detection_ring = self.frame_ring
+        self.detection_ring.ref_size = (self.frame_ring.shape[1], self.frame_ring.shape[0])
+        # primary=False (cámaras secundarias, ver core/lanes.py): solo flujos etiquetados con su fuente
+        self.scaler = StreamScaler(event_bus, source_id=self.source.source_id, primary=primary)
+        # fuentes en modo "lo más rápido posible" no tienen tope de fps
+        self.governor = governor or RateGovernor(max_fps=target_fps if self.source.realtime else 0,
+                                                 enabled=getattr(cfg, "GOVERNOR_ENABLED", True))
+        self.decode_on_demand = getattr(cfg, "CAPTURE_DECODE_ON_DEMAND", True)
+        self.grabbed = 0          # frames capturados con grab() (decodificados o no)
+        self._last_decode = 0.0
 
     def run(self):
-        # inicializar la captura
-        self.cap = cv2.VideoCapture(self.src, cv2.CAP_DSHOW if hasattr(cv2, "CAP_DSHOW") else 0)
-        if not self.cap.isOpened():
-            print("[CaptureThread] No se pudo abrir la cámara")
+        # inicializar la fuente
+        if not self.source.open():
+            print(f"[CaptureThread] No se pudo abrir la fuente {self.source.source_id}")
             return
         self.running = True
-        interval = 1.0 / max(1, self.target_fps)
+        # decodificación bajo demanda: grab() continuo para vaciar el buffer del driver y
+        # retrieve() (decodificar) solo cuando alguien va a usar el frame
+        on_demand = self.decode_on_demand and self.source.supports_grab and self.source.realtime
         while self.running:
             t0 = time.time()
-            ret, frame = self.cap.read()
-            if not ret:
-                time.sleep(0.05)
+            if on_demand:
+                if not self.source.grab():
+                    if self._source_finished():
+                        break
+                    continue
+                t_capture_ns = time.monotonic_ns()
+                self.grabbed += 1
+                if not self._want_decode():
+                    # el siguiente grab() bloquea hasta el próximo frame: él marca el ritmo
+                    continue
+            idx, slot = self.frame_ring.acquire_write()
+            if slot is None:
+                # todos los slots prestados: los consumidores van atrasados
+                time.sleep(0.005)
                 continue
-            # publicamos frame en cola (para procesamiento) y en bus (para GUI si desea)
-            try:
-                # non-blocking put: si cola llena, descartamos el frame anterior
-                self.frame_queue.put(frame, block=False)
-            except Full:
-                try:
-                    _ = self.frame_queue.get_nowait() # si la cola está llena, tratamos de vaciar uno y reintentar 
-                    self.frame_queue.put(frame, block=False)
-                except Exception:
-                    pass
-            # publicar por bus (opcional)
-            self.event_bus.publish("frame_captured", frame)
+            # leemos/decodificamos directamente sobre el buffer preasignado
+            if on_demand:
+                ret, frame = self.source.retrieve(slot)
+            else:
+                ret, frame = self.source.read(slot)
+                t_capture_ns = time.monotonic_ns()
+            if not ret or frame is None:
+                if self._source_finished():
+                    break
+                continue
+            if frame.shape != slot.shape:
+                # la fuente entrega otra resolución: reasignamos el pool una sola vez
+                self.frame_ring.reshape(frame.shape)
+                idx, slot = self.frame_ring.acquire_write()
+            if frame is not slot:
+                # el backend no pudo escribir en sitio; copiamos al slot para mantener el pool
+                slot[...] = frame
+            # envelope: seq + instante de captura + fuente, viaja con el frame por todo el pipeline
+            env = FrameEnvelope(self.frame_ring.seq + 1, t_capture_ns, self.source.source_id, slot)
+            self.frame_ring.commit(idx, env)
+            self._publish_detection_frame(env)
+            # flujos a resolución de pantalla (solo los que tienen suscriptores)
+            self.scaler.publish(env)
+            # publicar por bus (opcional). La referencia es válida ~slots-1 capturas.
+            self.event_bus.publish("frame_captured", env)
+            self.governor.on_captured(self.detection_ring.dropped)
+            self._last_decode = time.monotonic()
+            if on_demand:
+                continue
+            # el intervalo lo marca el regulador (tasa de captura == tasa de publicación)
             dt = time.time() - t0
-            sleep = interval - dt
+            sleep = self.governor.interval() - dt
             if sleep > 0:
                 time.sleep(sleep)
 
+    def _source_finished(self):
+        """Tras un fallo de lectura: True si la fuente se agotó (y paramos), False para reintentar."""
+        if self.source.exhausted:
+            print(f"[CaptureThread] Fin de la fuente {self.source.source_id}")
+            self.running = False
+            self.event_bus.publish("capture_finished", self.source.source_id)
+            return True
+        time.sleep(0.05)
+        return False
+
+    def _want_decode(self):
+        """
+        Modo bajo demanda: ¿merece la pena decodificar el frame recién capturado con grab()?
+        Solo si ya toca según el regulador y si alguien lo va a consumir.
+        """
+        if time.monotonic() - self._last_decode < self.governor.interval():
+            return False
+        if self.detection_ring.pending and not self.scaler.active() \
+                and not self.event_bus.has_subscribers("frame_captured"):
+            # el detector aún no tomó el último frame y nadie más mira: se tiraría sin usarse
+            return False
+        return True
+
+    def _publish_detection_frame(self, env):
+        """Escala env.frame a la resolución de detección y lo publica en detection_ring."""
+        frame = env.frame
+        ref_size = (frame.shape[1], frame.shape[0])
+        if self.detection_ring is self.frame_ring:
+            self.detection_ring.ref_size = ref_size
+            return
+        if ref_size != self.detection_ring.ref_size:
+            # cambió la resolución de la fuente: recalculamos el tamaño de detección
+            det_w, det_h = fit_size(ref_size, self.detection_size)
+            self.detection_ring.reshape((det_h, det_w, 3))
+            self.detection_ring.ref_size = ref_size
+        idx, buf = self.detection_ring.acquire_write()
+        if buf is None:
+            return
+        cv2.resize(frame, (buf.shape[1], buf.shape[0]), dst=buf, interpolation=cv2.INTER_AREA)
+        self.detection_ring.commit(idx, env.derive(frame=buf))
+
+    def stats(self):
+        """fps actual/objetivo, throughput del detector y contadores de descartes."""
+        return dict(self.governor.stats(), grabbed=self.grabbed)
+
     def stop(self):
         self.running = False
         try:
-            if self.cap and self.cap.isOpened(): # liberamos recursos
-                self.cap.release()
+            self.source.release() # liberamos recursos
         except Exception:
             pass
-
@@ -0,0 +1,86 @@
+# srlsp-game/src/signperu/core/confirmation.py
+# Suavizado temporal y confirmación de letras, compartido por todos los consumidores.
+#
+# NOTAS:
+# - Basado en tiempo, no en número de frames: cada detección real aporta el tiempo
+#   transcurrido desde la anterior (limitado a `max_gap`) a su letra. Una letra se
+#   confirma cuando acumula `threshold * window` segundos dentro de los últimos `window`
+#   segundos, así la latencia de confirmación no depende de los fps conseguidos.
+# - Histéresis: la letra confirmada se libera cuando baja de la mitad de ese tiempo
+#   (o la confirma otra letra).
+# - Eventos (publicados en el EventBus con el kwarg source= de la estación):
+#     'letter_confirmed' (letra, t_capture_ns=)          -> una vez, al confirmar
+#     'letter_held'      (letra, held_s=, t_capture_ns=) -> cada `held_interval` s mientras dura
+#     'letter_released'  (letra, held_s=, t_capture_ns=) -> al soltarla
+# - ProcessingThread tiene un LetterConfirmer por carril y le pasa solo las detecciones
+#   reales (no las predichas por stride); los frames descartados por la puerta cuentan
+#   como "sin mano".
+# - Con DETECTOR_MAX_HANDS > 1 hay un LetterConfirmer por mano (id estable de
+#   clasificador/manos.py); sus eventos llevan además el kwarg hand= con ese id.
+from collections import deque
+
+
+class LetterConfirmer:
+    def __init__(self, event_bus, window=0.5, threshold=0.6, held_interval=0.5, max_gap=0.25, hand=None):
+        self.event_bus = event_bus
+        self._extra = {} if hand is None else {"hand": hand}   # kwargs añadidos a cada evento
+        self.window_ns = int(window * 1e9)
+        self.confirm_ns = int(threshold * window * 1e9)
+        self.release_ns = self.confirm_ns // 2
+        self.held_interval_ns = int(held_interval * 1e9)
+        self.max_gap_ns = int(max_gap * 1e9)
+        self.letra = None           # letra confirmada actualmente (None = ninguna)
+        self._samples = deque()     # (t_ns, letra, peso_ns) de la ventana, en orden
+        self._last_t = None
+        self._source = None
+        self._since_ns = 0          # instante de confirmación de self.letra
+        self._held_ns = 0           # último 'letter_held' publicado
+
+    def reset(self):
+        """Olvida la ventana; si había una letra confirmada publica su 'letter_released'."""
+        if self.letra is not None:
+            self._release(self._last_t, self._source)
+        self._samples.clear()
+        self._last_t = None
+
+    @property
+    def idle(self):
+        """Sin letra confirmada ni detecciones en la ventana (se puede descartar)."""
+        return self.letra is None and not any(l is not None for _, l, _ in self._samples)
+
+    def update(self, letra, t_ns, source=None):
+        """Registra una detección real (letra o None) capturada en t_ns."""
+        if self._last_t is not None and t_ns <= self._last_t:
+            return   # frame repetido o fuera de orden
+        peso = 0 if self._last_t is None else min(t_ns - self._last_t, self.max_gap_ns)
+        self._last_t = t_ns
+        self._source = source
+        self._samples.append((t_ns, letra or None, peso))
+        inicio = t_ns - self.window_ns
+        while self._samples and self._samples[0][0] <= inicio:
+            self._samples.popleft()
+
+        tiempos = {}
+        for _, l, p in self._samples:
+            if l is not None:
+                tiempos[l] = tiempos.get(l, 0) + p
+        mejor = max(tiempos, key=tiempos.get) if tiempos else None
+
+        if self.letra is not None:
+            if mejor is not None and mejor != self.letra and tiempos[mejor] >= self.confirm_ns:
+                self._release(t_ns, source)
+            elif tiempos.get(self.letra, 0) < self.release_ns:
+                self._release(t_ns, source)
+            elif t_ns - self._held_ns >= self.held_interval_ns:
+                self._held_ns = t_ns
+                self.event_bus.publish("letter_held", self.letra, held_s=(t_ns - self._since_ns) / 1e9,
+                                       t_capture_ns=t_ns, source=source, **self._extra)
+        if self.letra is None and mejor is not None and tiempos[mejor] >= self.confirm_ns:
+            self.letra = mejor
+            self._since_ns = self._held_ns = t_ns
+            self.event_bus.publish("letter_confirmed", mejor, t_capture_ns=t_ns, source=source, **self._extra)
+
+    def _release(self, t_ns, source):
+        letra, self.letra = self.letra, None
+        self.event_bus.publish("letter_released", letra, held_s=(t_ns - self._since_ns) / 1e9,
+                               t_capture_ns=t_ns, source=source, **self._extra)
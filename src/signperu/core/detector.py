@@ -1,25 +1,166 @@
 # srlsp-game/src/signperu/core/detector.py
 # Wrapper alrededor de abecedario.ClasificadorSenia
 # Provee una API sencilla: predict(frame) -> token|None y smoothing temporal
+#
+# NOTAS:
+# - cfg.DETECTOR_ENGINE elige el motor: "legacy" (mp.solutions.hands, síncrono) o
+#   "tasks" (HandLandmarker LIVE_STREAM asíncrono, clasificador/landmarker.py). Si el
+#   modelo .task no está, se usa legacy.
+# - stats() informa del throughput real del motor (resultados/s y latencia media) para
+#   comparar ambos (ver test/compare_engines.py). Con "tasks" detect_from_frame solo
+#   envía el frame, así que el tiempo que ven RateGovernor/AdaptiveStride es el del envío;
+#   el motor descarta por sí mismo los frames que no da abasto a procesar.
+# - cfg.DETECTOR_MAX_HANDS > 1 detecta varias manos por frame: detect_from_frame sigue
+#   devolviendo la mano principal y `hands` da todas (id estable, lado, letra, landmarks).
+# - Cascada (clasificador/cascada.py): tras las reglas, las manos ambiguas (ninguna letra,
+#   varias, o margen < DETECTOR_CASCADE_MIN_MARGIN) pasan por la etapa cara `heavy` si se
+#   inyectó una; stats()["cascade"] da la tasa de cada etapa.
+# - Sin `heavy` explícito, la etapa cara es el clasificador de plantillas
+#   (clasificador/plantillas.py) si cfg.DETECTOR_TEMPLATES apunta a un índice construido.
+import os
+import time
+
+from signperu import config as cfg
 from signperu.clasificador.abecedario import ClasificadorSenia
+from signperu.clasificador.cascada import ClasificadorCascada
+
+
+class EngineStats:
+    """Envíos, resultados y latencia de un motor de detección."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.t0 = time.perf_counter()
+        self.submitted = 0
+        self.results = 0
+        self._latency = 0.0
+
+    def on_submit(self):
+        self.submitted += 1
+
+    def on_result(self, latency_s):
+        self.results += 1
+        self._latency += latency_s
+
+    def snapshot(self):
+        elapsed = max(1e-9, time.perf_counter() - self.t0)
+        return {
+            "submitted": self.submitted,
+            "results": self.results,
+            "results_per_s": self.results / elapsed,
+            "mean_latency_ms": 1000.0 * self._latency / self.results if self.results else None,
+        }
+
 
 class DetectorWrapper:
     """
     Wrapper para el clasificador existente en abecedario.py.
     Expone detect_from_frame(frame) -> (letra_detectada | None, annotated_frame)
     """
-    def __init__(self, config=None):
+    def __init__(self, config=None, engine=None, heavy=None, profile=None):
         self.config = config or {}
-        # Usa la clase existente sin modificarla
-        self._clf = ClasificadorSenia()
+        # perfil de core/tuner.py con que se construye (lo calibra benchmark() o lo aplicó el tuner)
+        from signperu.core import tuner
+        self.profile = profile or tuner.current_profile()
+        self._profile_override = profile
+        self.engine_stats = EngineStats()
+        if heavy is None:
+            heavy = self._templates_engine()
+        # heavy: clasificador caro (clasificar(landmarks) -> letra | None) solo para manos ambiguas
+        self.cascade = ClasificadorCascada(heavy, min_margin=getattr(cfg, "DETECTOR_CASCADE_MIN_MARGIN", 0.0))
+        self._resueltas = None   # manos ya pasadas por la cascada (el motor "tasks" repite resultado)
+        self.engine = engine or getattr(cfg, "DETECTOR_ENGINE", "legacy")
+        self._clf = None
+        if self.engine == "tasks":
+            self._clf = self._tasks_engine()
+        if self._clf is None:
+            self.engine = "legacy"
+            # Usa la clase existente; DETECTOR_ROI_TRACKING recorta la entrada alrededor de la mano.
+            # Complejidad del modelo y umbrales: perfil de la máquina (core/tuner.py) o config
+            self._clf = ClasificadorSenia(
+                roi_tracking=getattr(cfg, "DETECTOR_ROI_TRACKING", True),
+                model_complexity=self._param("model_complexity", "DETECTOR_MODEL_COMPLEXITY", 1),
+                min_detection_confidence=self._param("min_detection_confidence", "DETECTOR_MIN_DETECTION_CONFIDENCE", 0.7),
+                min_tracking_confidence=self._param("min_tracking_confidence", "DETECTOR_MIN_TRACKING_CONFIDENCE", 0.5),
+                max_num_hands=getattr(cfg, "DETECTOR_MAX_HANDS", 1))
+
+    def _param(self, key, name, default):
+        """Valor del perfil pasado a __init__ (calibración) o, si no, de la config."""
+        if self._profile_override is not None:
+            return self._profile_override[key]
+        return getattr(cfg, name, default)
+
+    def _tasks_engine(self):
+        """ClasificadorLandmarker (LIVE_STREAM) o None si falta el modelo o MediaPipe Tasks."""
+        from signperu.clasificador.landmarker import MODEL_PATH, ClasificadorLandmarker
+        model = getattr(cfg, "DETECTOR_TASKS_MODEL", None) or MODEL_PATH
+        if not os.path.isfile(model):
+            print(f"[DetectorWrapper] modelo {model} no encontrado; se usa el motor legacy")
+            return None
+        try:
+            return ClasificadorLandmarker(
+                model,
+                min_detection_confidence=self._param("min_detection_confidence", "DETECTOR_MIN_DETECTION_CONFIDENCE", 0.7),
+                min_tracking_confidence=self._param("min_tracking_confidence", "DETECTOR_MIN_TRACKING_CONFIDENCE", 0.5),
+                on_result=self.engine_stats.on_result,
+                max_num_hands=getattr(cfg, "DETECTOR_MAX_HANDS", 1))
+        except Exception as e:
+            print("[DetectorWrapper] no se pudo crear HandLandmarker; se usa el motor legacy:", e)
+            return None
+
+    @property
+    def hands(self):
+        """Manos de la última detección (ver clasificador/manos.py), ordenadas por id."""
+        return getattr(self._clf, "manos", [])
+
+    def _templates_engine(self):
+        """ClasificadorPlantillas del índice de cfg.DETECTOR_TEMPLATES, o None si no hay índice."""
+        carpeta = getattr(cfg, "DETECTOR_TEMPLATES", None)
+        if not carpeta:
+            return None
+        from signperu.clasificador.plantillas import ClasificadorPlantillas
+        try:
+            return ClasificadorPlantillas(carpeta,
+                                          max_dist=getattr(cfg, "DETECTOR_TEMPLATES_MAX_DIST", 0.8),
+                                          alumno=getattr(cfg, "DETECTOR_TEMPLATES_STUDENT", None))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[DetectorWrapper] no se pudo cargar el índice de plantillas {carpeta}:", e)
+            return None
+
+    def reset(self):
+        """Reinicia el estado de seguimiento entre sesiones de captura (ver core/warmup.py)."""
+        self._clf.reset()
+        self._resueltas = None
+
+    def close(self):
+        close = getattr(self._clf, "close", None)
+        if close:
+            close()
+
+    def stats(self):
+        """Throughput del motor desde su creación (resultados/s, latencia media)."""
+        return dict(self.engine_stats.snapshot(), engine=self.engine, cascade=self.cascade.stats.snapshot())
 
-    def detect_from_frame(self, frame):
+    def detect_from_frame(self, frame, annotate=True):
         """
         Llama a ClasificadorSenia.procesar_mano(frame) que devuelve (letra, frame_annotado)
-        Retorna (letra, frame_annotado)
+        Retorna (letra, frame_annotado, coords)
+        coords: píxeles de `frame` (el frame de detección, posiblemente escalado).
+        annotate=False: sin dibujo; se devuelve el mismo `frame`.
+        Con el motor "tasks" el resultado es el último terminado (de un frame anterior).
         """
         try:
-            letra, frame_proc, coords = self._clf.procesar_mano(frame)
+            self.engine_stats.on_submit()
+            t0 = time.perf_counter()
+            letra, frame_proc, coords = self._clf.procesar_mano(frame, anotar=annotate)
+            if self.engine == "legacy":
+                self.engine_stats.on_result(time.perf_counter() - t0)
+            manos = self.hands
+            if manos and manos is not self._resueltas:
+                self._resueltas = self.cascade.resolver(manos)
+            if manos:
+                letra = manos[0]["letra"]   # mano principal, quizá corregida por la etapa cara
             return letra, frame_proc, coords
         except Exception as e:
             # Si algo falla, devolvemos None y el frame original
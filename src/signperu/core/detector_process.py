@@ -0,0 +1,184 @@
+# srlsp-game/src/signperu/core/detector_process.py
+# DetectorWrapper ejecutado en un proceso aparte (evita que MediaPipe compita por el GIL con la UI).
+#
+# NOTAS:
+# - ProcessDetector expone la misma API que DetectorWrapper (detect_from_frame), así que
+#   ProcessingThread / DetectionLane no cambian: solo se inyecta otra estrategia.
+# - Transporte: un anillo de `slots` frames en multiprocessing.shared_memory. El hilo de
+#   procesamiento copia el frame de detección al siguiente slot y envía por un Pipe solo
+#   (slot, forma, anotar). El proceso trabajador detecta, escribe el frame anotado (si se
+#   pidió) en el mismo slot y responde (letra, coords, manos). Nada de pickle de imágenes.
+# - El frame anotado devuelto es una vista del slot: válida durante `slots - 1` detecciones
+#   (igual que los frames del FrameRing).
+# - Mientras el hilo espera la respuesta (conn.poll/recv) libera el GIL: la UI y la captura
+#   siguen corriendo y la inferencia ocupa otro núcleo.
+# - Si el proceso muere o no responde en `timeout`, se devuelve "sin detección" y se
+#   relanza en la siguiente llamada.
+# - reset() envía ("reset",) al trabajador: reinicia el seguimiento sin respuesta ni relanzar
+#   el proceso, para reutilizar el mismo ProcessDetector entre sesiones (core/warmup.py).
+import multiprocessing as mp
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def _attach(name):
+    """Abre un segmento existente sin que el resource_tracker del trabajador lo reclame al salir."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+
+def _worker_main(conn, shm_name, slots, slot_bytes, config):
+    """Bucle del proceso trabajador: crea su propio DetectorWrapper y atiende peticiones."""
+    from signperu import config as cfg
+    from signperu.core import tuner
+    from signperu.core.detector import DetectorWrapper   # MediaPipe se carga solo en el trabajador
+    if getattr(cfg, "DETECTOR_AUTOTUNE", True):
+        tuner.apply_cached_profile()   # mismo perfil que eligió el proceso principal
+    shm = _attach(shm_name)
+    detector = DetectorWrapper(config)
+    try:
+        while True:
+            msg = conn.recv()
+            if msg is None:
+                break
+            if msg[0] == "reset":
+                detector.reset()   # sin respuesta: el siguiente "detect" ya llega limpio
+                continue
+            if msg[0] == "attach":
+                # el proceso principal reservó un anillo más grande (cambió la resolución)
+                _, shm_name, slots, slot_bytes = msg
+                shm.close()
+                shm = _attach(shm_name)
+                continue
+            _, slot, shape, annotate = msg
+            nbytes = int(np.prod(shape))
+            frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_bytes)
+            letra, frame_proc, coords = detector.detect_from_frame(frame, annotate=annotate)
+            if frame_proc is not None and frame_proc is not frame and frame_proc.nbytes == nbytes:
+                frame[...] = frame_proc.reshape(shape)
+            del frame
+            conn.send((letra, coords, detector.hands))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        shm.close()
+
+
+class ProcessDetector:
+    """
+    Proxy de DetectorWrapper en un proceso trabajador con frames en memoria compartida.
+    Un ProcessDetector por carril (lo usa un solo ProcessingThread).
+    """
+    def __init__(self, config=None, slots=3, timeout=2.0, startup_timeout=30.0):
+        self.config = config or {}
+        self.slots = int(slots)
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self.hands = []   # manos de la última respuesta (como DetectorWrapper.hands)
+        self._ctx = mp.get_context("spawn")   # igual en Windows y Linux; MediaPipe no tolera fork
+        self._lock = threading.Lock()
+        self._proc = None
+        self._conn = None
+        self._shm = None
+        self._slot_bytes = 0
+        self._next = 0
+        self._ready = False   # True tras la primera respuesta del trabajador actual
+
+    # ---------------- proceso trabajador ----------------
+    def _alloc(self, nbytes):
+        """Reserva (o agranda) el anillo compartido; devuelve True si cambió."""
+        if self._shm is not None and nbytes <= self._slot_bytes:
+            return False
+        self._release_shm()
+        self._slot_bytes = int(nbytes)
+        self._shm = shared_memory.SharedMemory(create=True, size=self._slot_bytes * self.slots)
+        return True
+
+    def _release_shm(self):
+        if self._shm is None:
+            return
+        try:
+            self._shm.close()
+        except BufferError:
+            pass   # aún hay vistas (frames anotados) vivas; el SO libera al desmapear
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def _ensure_worker(self, nbytes):
+        resized = self._alloc(nbytes)
+        if self._proc is not None and self._proc.is_alive():
+            if resized:
+                self._conn.send(("attach", self._shm.name, self.slots, self._slot_bytes))
+            return
+        self._stop_worker()
+        self._conn, child = self._ctx.Pipe()
+        self._proc = self._ctx.Process(target=_worker_main, daemon=True,
+                                       args=(child, self._shm.name, self.slots, self._slot_bytes, self.config))
+        self._proc.start()
+        child.close()
+
+    def _stop_worker(self):
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (OSError, BrokenPipeError):
+                pass
+            self._conn.close()
+            self._conn = None
+        if self._proc is not None:
+            self._proc.join(1.0)
+            if self._proc.is_alive():
+                self._proc.terminate()
+            self._proc = None
+        self._ready = False
+        self.hands = []
+
+    # ---------------- API de DetectorWrapper ----------------
+    def detect_from_frame(self, frame, annotate=True):
+        """Igual que DetectorWrapper.detect_from_frame, pero la inferencia ocurre en el trabajador."""
+        with self._lock:
+            try:
+                self._ensure_worker(frame.nbytes)
+                slot = self._next
+                self._next = (self._next + 1) % self.slots
+                buf = np.ndarray(frame.shape, dtype=np.uint8, buffer=self._shm.buf,
+                                 offset=slot * self._slot_bytes)
+                buf[...] = frame
+                self._conn.send(("detect", slot, frame.shape, annotate))
+                # la primera respuesta incluye la carga de MediaPipe en el trabajador
+                if not self._conn.poll(self.timeout if self._ready else self.startup_timeout):
+                    print("[ProcessDetector] el trabajador no responde; se relanzará")
+                    self._stop_worker()
+                    return None, frame, None
+                letra, coords, self.hands = self._conn.recv()
+                self._ready = True
+                return letra, buf, coords
+            except (EOFError, OSError, BrokenPipeError) as e:
+                print("[ProcessDetector] error:", e)
+                self._stop_worker()
+                return None, frame, None
+
+    def reset(self):
+        """Reinicia el seguimiento del trabajador (si está vivo) sin relanzarlo."""
+        with self._lock:
+            if self._proc is None or not self._proc.is_alive():
+                return
+            try:
+                self._conn.send(("reset",))
+            except (OSError, BrokenPipeError):
+                self._stop_worker()
+
+    def close(self):
+        with self._lock:
+            self._stop_worker()
+            self._release_shm()
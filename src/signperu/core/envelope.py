@@ -0,0 +1,38 @@
+# srlsp-game/src/signperu/core/envelope.py
+# Sobre (envelope) compacto que acompaña a cada frame por todo el pipeline.
+#
+# NOTAS:
+# - Lo crea CaptureThread justo después de leer el frame: número de secuencia,
+#   instante de captura (time.monotonic_ns) e id de la fuente.
+# - Los eventos 'frame_captured' y "frame@WxH" publican el envelope; 'hand_detected'
+#   lo añade como kwarg `envelope=` con el frame y los landmarks; 'frame_annotated'
+#   (solo si tiene suscriptores) publica uno con el frame anotado.
+# - derive() crea un envelope hermano (misma seq/instante/fuente) con otras
+#   referencias, p. ej. el frame escalado o el anotado. No copia datos.
+# - Sirve para descartar frames viejos, medir latencia y no redibujar un frame ya pintado.
+import time
+
+
+class FrameEnvelope:
+    """Metadatos de un frame + referencias (sin copia) al frame y a los landmarks."""
+    __slots__ = ("seq", "t_capture_ns", "source_id", "frame", "landmarks")
+
+    def __init__(self, seq, t_capture_ns, source_id, frame=None, landmarks=None):
+        self.seq = seq
+        self.t_capture_ns = t_capture_ns
+        self.source_id = source_id
+        self.frame = frame
+        self.landmarks = landmarks
+
+    def derive(self, frame=None, landmarks=None):
+        """Envelope con la misma identidad (seq, instante, fuente) y otras referencias."""
+        return FrameEnvelope(self.seq, self.t_capture_ns, self.source_id,
+                             frame=frame, landmarks=landmarks)
+
+    def age_ms(self, now_ns=None):
+        """Milisegundos transcurridos desde la captura."""
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        return (now_ns - self.t_capture_ns) / 1e6
+
+    def __repr__(self):
+        return f"FrameEnvelope(seq={self.seq}, source={self.source_id!r}, age={self.age_ms():.1f}ms)"
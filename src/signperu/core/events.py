@@ -8,15 +8,28 @@ class EventBus:
     def __init__(self):
         self._subs = defaultdict(list)
         self._lock = threading.RLock()
+        # se incrementa en cada (des)suscripción; permite cachear consultas sobre suscriptores
+        self.version = 0
 
     def subscribe(self, event_name, callback):
         with self._lock:
             self._subs[event_name].append(callback)
+            self.version += 1
 
     def unsubscribe(self, event_name, callback):
         with self._lock:
             if callback in self._subs[event_name]:
                 self._subs[event_name].remove(callback)
+                self.version += 1
+
+    def has_subscribers(self, event_name):
+        with self._lock:
+            return bool(self._subs.get(event_name))
+
+    def event_names(self, prefix=""):
+        """Nombres de evento con al menos un suscriptor (opcionalmente filtrados por prefijo)."""
+        with self._lock:
+            return [name for name, subs in self._subs.items() if subs and name.startswith(prefix)]
 
     def publish(self, event_name, *args, **kwargs):
         with self._lock:
@@ -0,0 +1,159 @@
+# srlsp-game/src/signperu/core/frame_ring.py
+# Anillo de frames preasignados ("el último frame gana") compartido entre
+# CaptureThread (productor) y ProcessingThread / UI (consumidores).
+#
+# NOTAS:
+# - La memoria es fija: se reservan `slots` buffers al inicio y la cámara
+#   escribe directamente en ellos (cap.read(image=slot)), sin asignar un
+#   ndarray nuevo por frame.
+# - Los consumidores toman prestado (borrow) el último frame sin copiarlo y lo
+#   devuelven con release(). Un slot prestado nunca se reescribe.
+# - Los slots se reutilizan en orden circular, así que una referencia NO prestada
+#   (p. ej. la recibida por 'frame_captured') sigue siendo válida durante al menos
+#   `slots - 1` capturas. Quien necesite guardar un frame más tiempo debe copiarlo.
+# - borrow_latest() entrega un token (generación, slot), no el índice a secas: reshape()
+#   reasigna los slots y sube la generación, y release()/envelope() de un token de una
+#   generación anterior se ignoran (no descuentan el préstamo de otro frame ni devuelven
+#   sus metadatos). El préstamo viejo conserva su buffer, que ya no está en el anillo.
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class FrameRing:
+    """
+    Pool fijo de buffers para frames con número de secuencia.
+    Productor: acquire_write() -> escribir en el buffer -> commit(idx).
+    Consumidor: borrow_latest(after_seq) -> usar el frame -> release(token).
+    """
+    def __init__(self, shape=(480, 640, 3), slots=4, dtype=np.uint8):
+        self._cond = threading.Condition()
+        self._dtype = dtype
+        # (ancho, alto) del frame original si este anillo guarda versiones escaladas
+        self.ref_size = None
+        self._gen = 0   # sube con cada reshape(): invalida los tokens de préstamo anteriores
+        self._alloc(tuple(shape), max(2, int(slots)))
+
+    def _alloc(self, shape, slots):
+        self.shape = shape
+        self._buffers = [np.zeros(shape, dtype=self._dtype) for _ in range(slots)]
+        self._seqs = [0] * slots        # secuencia del frame que contiene cada slot
+        self._envelopes = [None] * slots  # FrameEnvelope asociado a cada slot (opcional)
+        self._borrowed = [0] * slots    # nº de préstamos activos por slot
+        self._latest = -1               # slot con el último frame publicado
+        self._writing = -1              # slot que el productor está escribiendo
+        self._seq = 0
+        self._consumed_seq = 0          # mayor secuencia prestada al menos una vez
+        self.dropped = 0                # frames publicados que nadie llegó a tomar
+
+    @property
+    def slots(self):
+        return len(self._buffers)
+
+    @property
+    def seq(self):
+        """Número de secuencia del último frame publicado (0 si aún no hay)."""
+        return self._seq
+
+    @property
+    def pending(self):
+        """True si el último frame publicado aún no lo ha tomado ningún consumidor."""
+        with self._cond:
+            return self._latest >= 0 and self._seqs[self._latest] > self._consumed_seq
+
+    # ---------------- productor ----------------
+    def acquire_write(self):
+        """
+        Devuelve (idx, buffer) del slot libre más antiguo para que el productor escriba.
+        Devuelve (None, None) si todos los slots están prestados.
+        """
+        with self._cond:
+            n = len(self._buffers)
+            start = (self._latest + 1) % n
+            for k in range(n):
+                i = (start + k) % n
+                if i != self._latest and self._borrowed[i] == 0:
+                    self._writing = i
+                    return i, self._buffers[i]
+            return None, None
+
+    def commit(self, idx, envelope=None):
+        """
+        Publica el slot idx como último frame y despierta a los consumidores. Devuelve su secuencia.
+        envelope: FrameEnvelope con los metadatos del frame (ver envelope(idx)).
+        """
+        with self._cond:
+            if self._latest >= 0 and self._seqs[self._latest] > self._consumed_seq:
+                # el frame anterior se reemplaza sin que ningún consumidor lo tomara
+                self.dropped += 1
+            self._seq += 1
+            self._seqs[idx] = self._seq
+            self._envelopes[idx] = envelope
+            self._latest = idx
+            self._writing = -1
+            self._cond.notify_all()
+            return self._seq
+
+    def reshape(self, shape):
+        """
+        Reasigna el pool con una nueva forma (p. ej. la cámara entrega otra resolución).
+        Solo el productor debe llamarlo; los préstamos en curso conservan su buffer viejo.
+        """
+        shape = tuple(shape)
+        with self._cond:
+            if shape == self.shape:
+                return
+            seq, consumed, dropped = self._seq, self._consumed_seq, self.dropped
+            self._gen += 1
+            self._alloc(shape, len(self._buffers))
+            self._seq, self._consumed_seq, self.dropped = seq, consumed, dropped
+
+    # ---------------- consumidores ----------------
+    def borrow_latest(self, after_seq=0, timeout=None):
+        """
+        Espera (hasta timeout) un frame con secuencia > after_seq y lo presta.
+        Devuelve (seq, token, frame) o None si no llegó nada nuevo; token = (generación, slot)
+        es lo que reciben release() y envelope().
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._seq > after_seq and self._latest >= 0, timeout):
+                return None
+            i = self._latest
+            self._borrowed[i] += 1
+            self._consumed_seq = max(self._consumed_seq, self._seqs[i])
+            return self._seqs[i], (self._gen, i), self._buffers[i]
+
+    def release(self, token):
+        """Devuelve un slot prestado con borrow_latest() (ignora tokens de antes de un reshape)."""
+        gen, idx = token
+        with self._cond:
+            if gen == self._gen and self._borrowed[idx] > 0:
+                self._borrowed[idx] -= 1
+
+    def envelope(self, token):
+        """FrameEnvelope guardado con commit() para el slot prestado (None si no se guardó o ya se reasignó)."""
+        gen, idx = token
+        with self._cond:
+            return self._envelopes[idx] if gen == self._gen else None
+
+    @contextmanager
+    def latest(self, after_seq=0, timeout=None):
+        """
+        Uso:
+            with ring.latest(last_seq, timeout=0.5) as item:
+                if item: seq, frame = item
+        """
+        item = self.borrow_latest(after_seq, timeout)
+        try:
+            yield (item[0], item[2]) if item else None
+        finally:
+            if item:
+                self.release(item[1])
+
+    def peek_latest(self):
+        """(seq, frame) del último frame sin prestarlo (referencia de vida corta), o (0, None)."""
+        with self._cond:
+            if self._latest < 0:
+                return 0, None
+            return self._seqs[self._latest], self._buffers[self._latest]
@@ -0,0 +1,57 @@
+# srlsp-game/src/signperu/core/gate.py
+# Filtro barato de presencia de mano: evita inferencias de MediaPipe en escenas vacías o quietas.
+#
+# NOTAS:
+# - Trabaja sobre una miniatura en gris (32x24 por defecto): energía de movimiento =
+#   diferencia media absoluta con la miniatura anterior. Opcionalmente exige una
+#   fracción mínima de píxeles con tono de piel (máscara YCrCb sobre la miniatura).
+# - Histéresis: mientras la última detección real vio una mano la puerta queda abierta
+#   (el seguimiento no se corta a mitad de una seña aunque la mano esté quieta) y sigue
+#   abierta `hold` segundos después de perderla o de que cese el movimiento.
+# - Con la puerta cerrada se reutiliza el último resultado (sin mano) y el coste por
+#   frame es un resize + cvtColor de la miniatura. Cada `refresh` segundos se deja pasar
+#   un frame aunque no haya movimiento.
+import cv2
+import numpy as np
+
+
+class PresenceGate:
+    def __init__(self, motion_threshold=4.0, skin_min=0.0, hold=1.0, refresh=2.0, size=(32, 24)):
+        self.motion_threshold = motion_threshold
+        self.skin_min = skin_min          # 0 = sin máscara de piel
+        self.hold_ns = int(hold * 1e9)
+        self.refresh_ns = int(refresh * 1e9)
+        self.size = size
+        self._prev = None                 # miniatura gris anterior (int16 para restar sin desbordar)
+        self._open_until = 0
+        self._last_pass = 0
+        self.skipped = 0
+        self.passed = 0
+
+    def should_detect(self, frame, t_ns):
+        """True si merece la pena ejecutar el detector sobre este frame."""
+        thumb = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(thumb, cv2.COLOR_BGR2GRAY).astype(np.int16)
+        prev, self._prev = self._prev, gray
+        motion = prev is None or float(np.abs(gray - prev).mean()) > self.motion_threshold
+        if motion and self.skin_min > 0:
+            motion = self._skin_fraction(thumb) >= self.skin_min
+        if motion:
+            self._open_until = t_ns + self.hold_ns
+        if motion or t_ns < self._open_until or t_ns - self._last_pass >= self.refresh_ns:
+            self._last_pass = t_ns
+            self.passed += 1
+            return True
+        self.skipped += 1
+        return False
+
+    def on_result(self, hand_found, t_ns):
+        """Resultado de la detección real: con mano la puerta se mantiene abierta."""
+        if hand_found:
+            self._open_until = t_ns + self.hold_ns
+
+    @staticmethod
+    def _skin_fraction(thumb):
+        ycrcb = cv2.cvtColor(thumb, cv2.COLOR_BGR2YCrCb)
+        mask = cv2.inRange(ycrcb, (0, 133, 77), (255, 173, 127))
+        return cv2.countNonZero(mask) / float(mask.size)
@@ -0,0 +1,130 @@
+# srlsp-game/src/signperu/core/governor.py
+# Regulador de lazo cerrado para la tasa de captura.
+#
+# NOTAS:
+# - ProcessingThread informa cuánto tarda cada detección (on_processed) y
+#   CaptureThread informa cada frame publicado junto con los descartes del FrameRing
+#   (on_captured). Con eso el regulador estima el throughput real del detector.
+# - Si se descartan muchos frames (el detector no da abasto) bajamos la tasa de
+#   captura/publicación hasta ~throughput * headroom; si no hay descartes la subimos
+#   poco a poco hasta max_fps. Así no se leen, decodifican ni publican a todos los
+#   suscriptores de 'frame_captured' frames que luego se tiran.
+# - Los frames que la puerta de presencia (core/gate.py) descarta sin detectar se informan
+#   con on_gated(): se cuentan aparte y no entran en la estimación del throughput, que
+#   así sigue midiendo al detector y no a la puerta (en una escena quieta el regulador no
+#   sube la tasa al máximo para luego tener que bajarla cuando aparece una mano).
+# - max_fps=0 significa "sin tope" (fuentes en modo lo más rápido posible).
+import threading
+import time
+
+from signperu import config as cfg
+
+
+class RateGovernor:
+    """
+    Ajusta la tasa de captura al throughput del detector.
+    Expone current_fps, target_fps, processing_fps, drop_rate y contadores en stats().
+    """
+    def __init__(self, max_fps=20, min_fps=None, period=0.5, headroom=1.15, enabled=True):
+        self.max_fps = float(max_fps or 0)
+        self.min_fps = float(min_fps if min_fps is not None else getattr(cfg, "GOVERNOR_MIN_FPS", 5))
+        self.period = period
+        self.headroom = headroom
+        self.enabled = enabled
+        # descartes esperables al capturar headroom veces más rápido que el detector, más margen
+        self._drop_limit = (1.0 - 1.0 / headroom) + 0.15
+        self._lock = threading.Lock()
+
+        # estado publicado
+        self.current_fps = self.max_fps   # tasa que aplica la captura ahora mismo
+        self.target_fps = self.max_fps    # tasa a la que converge el regulador
+        self.processing_fps = 0.0         # capacidad estimada del detector (frames/s ocupados)
+        self.capture_fps = 0.0            # tasa de captura medida
+        self.drop_rate = 0.0              # fracción de frames descartados en el último periodo
+        self.captured = 0
+        self.processed = 0
+        self.gated = 0
+        self.dropped = 0
+
+        # acumuladores del periodo en curso
+        self._t_last = time.monotonic()
+        self._p_captured = 0
+        self._p_processed = 0
+        self._p_busy = 0.0
+        self._p_dropped_at = 0
+
+    # ---------------- entradas ----------------
+    def on_captured(self, dropped_total=0):
+        """Llamar desde CaptureThread tras publicar un frame (dropped_total: FrameRing.dropped)."""
+        with self._lock:
+            self.captured += 1
+            self._p_captured += 1
+            self.dropped = dropped_total
+            now = time.monotonic()
+            if now - self._t_last >= self.period:
+                self._update(now)
+
+    def on_processed(self, seconds):
+        """Llamar desde ProcessingThread con la duración de una detección."""
+        with self._lock:
+            self.processed += 1
+            self._p_processed += 1
+            self._p_busy += max(0.0, seconds)
+
+    def on_gated(self):
+        """Llamar desde ProcessingThread por un frame que la puerta descartó sin detectar."""
+        with self._lock:
+            self.gated += 1
+
+    # ---------------- salida ----------------
+    def interval(self):
+        """Segundos entre capturas según la tasa actual (0 = sin espera)."""
+        fps = self.current_fps if self.enabled else self.max_fps
+        return 1.0 / fps if fps > 0 else 0.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "current_fps": round(self.current_fps, 2),
+                "target_fps": round(self.target_fps, 2),
+                "capture_fps": round(self.capture_fps, 2),
+                "processing_fps": round(self.processing_fps, 2),
+                "drop_rate": round(self.drop_rate, 3),
+                "captured": self.captured,
+                "processed": self.processed,
+                "gated": self.gated,
+                "dropped": self.dropped,
+            }
+
+    # ---------------- lazo de control ----------------
+    def _update(self, now):
+        elapsed = now - self._t_last
+        self.capture_fps = self._p_captured / elapsed if elapsed > 0 else 0.0
+        dropped = self.dropped - self._p_dropped_at
+        self.drop_rate = dropped / self._p_captured if self._p_captured else 0.0
+
+        if self._p_processed and self._p_busy > 0:
+            # throughput si el detector nunca esperara frames (suavizado exponencial)
+            busy_fps = self._p_processed / self._p_busy
+            self.processing_fps = busy_fps if not self.processing_fps else 0.7 * self.processing_fps + 0.3 * busy_fps
+            target = self.processing_fps * self.headroom
+            if self.max_fps > 0:
+                target = min(target, self.max_fps)
+            self.target_fps = max(self.min_fps, target)
+
+            if self.enabled:
+                if not self.current_fps or self.current_fps > self.target_fps:
+                    # sobrecarga (o aún sin tope): bajar de golpe al objetivo
+                    self.current_fps = self.target_fps
+                elif self.drop_rate > self._drop_limit:
+                    # más descartes de los que explica el headroom: el throughput medido es optimista
+                    self.current_fps = max(self.min_fps, self.current_fps * 0.8)
+                else:
+                    # sin descartes de más: subir de forma gradual
+                    self.current_fps = min(self.target_fps, self.current_fps * 1.25 + 0.5)
+
+        self._t_last = now
+        self._p_captured = 0
+        self._p_processed = 0
+        self._p_busy = 0.0
+        self._p_dropped_at = self.dropped
@@ -0,0 +1,176 @@
+# srlsp-game/src/signperu/core/lanes.py
+# Varias cámaras (estaciones de alumnos) en un mismo proceso.
+#
+# NOTAS:
+# - Cada fuente tiene su propio carril (DetectionLane): FrameSource + CaptureThread
+#   + anillos + RateGovernor + detector propio + ProcessingThread. Nada se comparte
+#   entre carriles salvo el EventBus y el InferenceScheduler.
+# - Con cfg.DETECTOR_PROCESS el detector de cada carril corre en su propio proceso
+#   (core/detector_process.py); el resto del carril no cambia.
+# - El detector llega como Future de core/warmup.py (el primer carril recibe el que se
+#   calentó al arrancar la app): crear un carril no bloquea la UI y ProcessingThread
+#   espera al detector en su propio hilo. `ready` indica si ya está cargado. Al parar,
+#   el detector vuelve a la reserva del proceso en lugar de destruirse.
+# - La calibración pendiente de la máquina (core/tuner.py) solo corre entre stop() y el
+#   siguiente start(): medir con los carriles detectando falsearía el perfil.
+# - Los eventos van etiquetados: el FrameEnvelope lleva source_id y 'hand_detected'
+#   añade el kwarg `source=`. Los flujos "frame@WxH/<source_id>" son por carril;
+#   los no etiquetados los sirve el carril principal (el primero).
+# - InferenceScheduler reparte las inferencias por turnos FIFO con un máximo de
+#   `workers` simultáneas (por defecto núcleos - 1, dejando uno para UI/captura),
+#   así cada estación recibe una fracción predecible del detector.
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+from signperu import config as cfg
+from signperu.core import tuner
+from signperu.core.capture import CaptureThread
+from signperu.core.processing import ProcessingThread
+from signperu.core.sources import make_source
+from signperu.core.warmup import claim_detector, release_detector
+
+
+class InferenceScheduler:
+    """
+    Turnos FIFO para las inferencias de todos los carriles.
+    Uso (desde ProcessingThread):
+        with scheduler.turn(lane_id):
+            detector.detect_from_frame(...)
+    """
+    def __init__(self, workers=None):
+        if not workers:
+            workers = max(1, (os.cpu_count() or 2) - 1)
+        self.workers = int(workers)
+        self._cond = threading.Condition()
+        self._queue = deque()     # tickets en espera, en orden de llegada
+        self._active = 0
+        self.served = {}          # lane_id -> inferencias atendidas
+
+    @contextmanager
+    def turn(self, lane_id=None):
+        ticket = object()
+        with self._cond:
+            self._queue.append(ticket)
+            # esperamos a ser el primero de la cola y a que haya un hueco libre
+            self._cond.wait_for(lambda: self._queue[0] is ticket and self._active < self.workers)
+            self._queue.popleft()
+            self._active += 1
+            self.served[lane_id] = self.served.get(lane_id, 0) + 1
+            self._cond.notify_all()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+
+class DetectionLane:
+    """Una estación: fuente + captura + detector + procesamiento, con eventos etiquetados."""
+    def __init__(self, event_bus, source, target_fps=20, scheduler=None, detector=None, primary=True):
+        self.event_bus = event_bus
+        self.source = make_source(source)
+        self.source_id = self.source.source_id
+        if detector is None:
+            detector = claim_detector()   # Future: DetectorWrapper o ProcessDetector según la config
+        self.detector = detector
+        self.capture = CaptureThread(event_bus, target_fps=target_fps, source=self.source, primary=primary)
+        self.processing = ProcessingThread(event_bus, self.detector, self.capture.detection_ring,
+                                           governor=self.capture.governor, scheduler=scheduler)
+
+    @property
+    def running(self):
+        return self.capture.running
+
+    @property
+    def ready(self):
+        """True cuando el detector del carril ya está cargado (calentamiento terminado)."""
+        detector = self.processing.detector
+        return not isinstance(detector, Future) or detector.done()
+
+    def start(self):
+        self.capture.start()
+        self.processing.start()
+
+    def stop(self):
+        try:
+            self.capture.stop()
+        except Exception:
+            pass
+        try:
+            self.processing.stop()
+        except Exception:
+            pass
+        # el detector sobrevive a la sesión: se reinicia y vuelve a la reserva (core/warmup.py).
+        # Esperar al hilo y el reset ocurren fuera de aquí (stop se llama desde la UI).
+        detector = self.processing.detector
+        # (si sigue siendo un Future el hilo nunca llegó a detectar: no hay que esperarlo)
+        busy = None if isinstance(detector, Future) else self.processing
+        release_detector(detector, busy=busy)
+
+    def stats(self):
+        stats = dict(self.capture.stats(), source=self.source_id)
+        detector_stats = getattr(self.processing.detector, "stats", None)
+        if callable(detector_stats):
+            stats["detector"] = detector_stats()   # motor y throughput (core/detector.py)
+        return stats
+
+
+class LaneManager:
+    """
+    Crea un carril por fuente. Con una sola fuente equivale al pipeline clásico
+    (CaptureThread + ProcessingThread) y `primary` expone sus hilos.
+    """
+    def __init__(self, event_bus, sources=None, target_fps=20, workers=None):
+        if sources is None:
+            sources = getattr(cfg, "CAMERA_SOURCES", None) or [cfg.CAMERA_SRC]
+        self.event_bus = event_bus
+        self.scheduler = InferenceScheduler(workers if workers is not None else getattr(cfg, "INFERENCE_WORKERS", None))
+        self.lanes = []
+        seen = set()
+        for i, src in enumerate(sources):
+            lane = DetectionLane(event_bus, src, target_fps=target_fps, scheduler=self.scheduler, primary=(i == 0))
+            if lane.source_id in seen:
+                # dos fuentes con el mismo id (p. ej. dos clips con igual nombre): desambiguamos
+                lane.source_id = lane.source.source_id = f"{lane.source_id}#{i}"
+                lane.capture.scaler.source_id = lane.source_id
+            seen.add(lane.source_id)
+            self.lanes.append(lane)
+
+    @property
+    def primary(self):
+        return self.lanes[0] if self.lanes else None
+
+    @property
+    def running(self):
+        return any(lane.running for lane in self.lanes)
+
+    @property
+    def ready(self):
+        return all(lane.ready for lane in self.lanes)
+
+    def lane(self, source_id):
+        for lane in self.lanes:
+            if lane.source_id == source_id:
+                return lane
+        return None
+
+    def start(self):
+        tuner.pause_calibration()   # no se mide la máquina mientras los carriles detectan
+        for lane in self.lanes:
+            lane.start()
+
+    def stop(self):
+        for lane in self.lanes:
+            lane.stop()
+        if getattr(cfg, "DETECTOR_AUTOTUNE", True):
+            tuner.calibrate_when_idle()   # sin carriles: momento de la calibración pendiente
+
+    def stats(self):
+        """Estadísticas por carril + inferencias atendidas por el planificador."""
+        return {"lanes": [lane.stats() for lane in self.lanes],
+                "workers": self.scheduler.workers,
+                "served": dict(self.scheduler.served)}
@@ -0,0 +1,67 @@
+# srlsp-game/src/signperu/core/overlay.py
+# Dibujo rápido de landmarks de la mano sobre frames ya escalados a tamaño de pantalla.
+#
+# NOTAS:
+# - Usa el array (21, 2) de landmarks (píxeles del frame de detección) y lo escala al
+#   tamaño del frame de destino: se dibuja a resolución de pantalla, no a 640x480.
+# - Todas las conexiones en una sola llamada a cv2.polylines (6 polilíneas cubren las
+#   21 conexiones de MediaPipe) y todos los puntos en otra, como segmentos de longitud
+#   cero con el grosor del punto. Dos llamadas a OpenCV en lugar de ~42, con una mano
+#   o con varias (array (N, 21, 2)).
+# - draw() pinta en el frame recibido (hacerlo sobre una copia propia, p. ej. la salida
+#   de cvtColor, nunca sobre un slot compartido del FrameRing). render_rgba() crea una
+#   capa transparente para pygame/Tk.
+import cv2
+import numpy as np
+
+# polilíneas que recorren las conexiones de MediaPipe Hands (HAND_CONNECTIONS)
+HAND_CHAINS = (
+    (0, 1, 2, 3, 4),         # pulgar
+    (0, 5, 6, 7, 8),         # índice
+    (9, 10, 11, 12),         # medio
+    (13, 14, 15, 16),        # anular
+    (0, 17, 18, 19, 20),     # meñique
+    (5, 9, 13, 17),          # palma
+)
+_CHAIN_IDX = [np.array(c, dtype=np.intp) for c in HAND_CHAINS]
+
+
+class LandmarkOverlay:
+    """Colores en el orden de canales del frame de destino (BGR por defecto)."""
+    def __init__(self, line_color=(0, 255, 0), point_color=(255, 128, 0), thickness=1, point_size=3):
+        self.line_color = line_color
+        self.point_color = point_color
+        self.thickness = thickness
+        self.point_size = point_size
+
+    @staticmethod
+    def scale(landmarks, src_size, dst_size):
+        """Landmarks (21, 2) del espacio src_size (ancho, alto) al dst_size, como int32."""
+        pts = np.asarray(landmarks, dtype=np.float32)
+        if src_size is not None and tuple(src_size) != tuple(dst_size):
+            pts = pts * (dst_size[0] / float(src_size[0]), dst_size[1] / float(src_size[1]))
+        return pts.astype(np.int32)
+
+    def draw(self, frame, landmarks, src_size=None, line_color=None, point_color=None):
+        """Dibuja la mano (21, 2) o las manos (N, 21, 2) sobre `frame` (in situ) y lo devuelve."""
+        if landmarks is None:
+            return frame
+        pts = self.scale(landmarks, src_size, (frame.shape[1], frame.shape[0])).reshape(-1, 21, 2)
+        cv2.polylines(frame, [mano[c] for mano in pts for c in _CHAIN_IDX], False,
+                      line_color or self.line_color, self.thickness, cv2.LINE_AA)
+        # cada punto como segmento degenerado [p, p]: el grosor lo convierte en un círculo
+        pts = pts.reshape(-1, 2)
+        cv2.polylines(frame, list(np.repeat(pts[:, None, :], 2, axis=1)), False,
+                      point_color or self.point_color, self.point_size, cv2.LINE_AA)
+        return frame
+
+    def render_rgba(self, size, landmarks, src_size=None):
+        """Capa RGBA (alto, ancho, 4) transparente con la mano dibujada, para componer en pygame/Tk."""
+        w, h = size
+        layer = np.zeros((h, w, 4), dtype=np.uint8)
+        if landmarks is None:
+            return layer
+        # en RGBA los colores BGR se invierten y se añade alfa opaco
+        line = tuple(self.line_color[::-1]) + (255,)
+        point = tuple(self.point_color[::-1]) + (255,)
+        return self.draw(layer, landmarks, src_size, line_color=line, point_color=point)
@@ -0,0 +1,77 @@
+# srlsp-game/src/signperu/core/prediction.py
+# Detección a saltos (stride) con landmarks extrapolados entre detecciones reales.
+#
+# NOTAS:
+# - AdaptiveStride decide en qué frames se ejecuta MediaPipe: N = ceil(t_detección /
+#   (budget * intervalo_entre_frames)), limitado a [1, max_stride]. Con budget=0.5 la
+#   detección ocupa como mucho ~media CPU de un núcleo aunque el juego pida más fps.
+# - LandmarkPredictor extrapola a velocidad constante a partir de las dos últimas
+#   detecciones reales (sin esperar al siguiente frame, así no añade latencia). Pasado
+#   `max_age` sin detección real deja de predecir.
+# - ProcessingThread publica los frames intermedios como 'hand_detected' con
+#   predicted=True, la última letra real y los landmarks estimados.
+import math
+
+import numpy as np
+
+
+class AdaptiveStride:
+    """Cada cuántos frames se ejecuta la detección completa."""
+    def __init__(self, max_stride=1, budget=0.5, alpha=0.2):
+        self.max_stride = max(1, int(max_stride))
+        self.budget = budget
+        self.alpha = alpha
+        self.stride = 1
+        self._det_s = None      # EMA de la duración de una detección (s)
+        self._dt_s = None       # EMA del intervalo entre frames (s)
+        self._last_t_ns = None
+        self._since = 0         # frames desde la última detección real
+
+    def on_frame(self, t_ns):
+        """Registra un frame nuevo y devuelve True si toca detección completa."""
+        if self._last_t_ns is not None and t_ns > self._last_t_ns:
+            dt = (t_ns - self._last_t_ns) / 1e9
+            self._dt_s = dt if self._dt_s is None else self._dt_s + self.alpha * (dt - self._dt_s)
+        self._last_t_ns = t_ns
+        self._since += 1
+        if self._since >= self.stride:
+            self._since = 0
+            return True
+        return False
+
+    def on_detected(self, seconds):
+        """Duración de la última detección real; recalcula el stride."""
+        self._det_s = seconds if self._det_s is None else self._det_s + self.alpha * (seconds - self._det_s)
+        if self.max_stride == 1 or not self._dt_s:
+            self.stride = 1
+            return
+        n = math.ceil(self._det_s / (self.budget * self._dt_s))
+        self.stride = min(self.max_stride, max(1, n))
+
+
+class LandmarkPredictor:
+    """Extrapolación lineal de landmarks (21, 2) a partir de las dos últimas detecciones."""
+    def __init__(self, max_age=0.3):
+        self.max_age_ns = int(max_age * 1e9)
+        self.letra = None
+        self._t = []    # instantes (ns) de las últimas dos detecciones con mano
+        self._p = []    # sus landmarks (float32)
+
+    def observe(self, t_ns, letra, puntos):
+        """Detección real: puntos None (sin mano) reinicia la predicción."""
+        self.letra = letra
+        if puntos is None:
+            self._t, self._p = [], []
+            return
+        self._t = (self._t + [t_ns])[-2:]
+        self._p = (self._p + [np.asarray(puntos, dtype=np.float32)])[-2:]
+
+    def predict(self, t_ns):
+        """(letra, landmarks estimados en t_ns) o (None, None) si no hay mano que seguir."""
+        if not self._p or t_ns - self._t[-1] > self.max_age_ns:
+            return None, None
+        p1 = self._p[-1]
+        if len(self._p) < 2 or self._t[1] <= self._t[0]:
+            return self.letra, p1
+        vel = (p1 - self._p[0]) / float(self._t[1] - self._t[0])
+        return self.letra, p1 + vel * float(t_ns - self._t[1])
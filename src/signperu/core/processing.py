@@ -7,41 +7,178 @@
 #Import de la interfaz Strategy (si se quiere proporcionar directamente)
 #from signperu.core.strategies import ProcessingStrategy, SimpleProcessingStrategy
 import threading
-from queue import Queue, Empty
+import time
+from concurrent.futures import Future
+from contextlib import nullcontext
+
+import numpy as np
+
+from signperu import config as cfg
+from signperu.core.confirmation import LetterConfirmer
+from signperu.core.envelope import FrameEnvelope
+from signperu.core.frame_ring import FrameRing
+from signperu.core.gate import PresenceGate
+from signperu.core.prediction import AdaptiveStride, LandmarkPredictor
+from signperu.core.tuner import LatencyMonitor, current_profile
 
 class ProcessingThread(threading.Thread):
     """
-    Hilo consumidor: toma frames desde frame_queue, ejecuta detector.detect_from_frame()
-    y publica eventos 'hand_detected' con (letra, frame_annotated).
+    Hilo consumidor: toma prestado el último frame del FrameRing de detección (sin copiarlo),
+    ejecuta detector.detect_from_frame() y publica eventos 'hand_detected' con (letra, frame_annotated).
+    Si recibe el RateGovernor de la captura le informa de la duración de cada detección.
+    `detector` puede ser un Future (core/warmup.py); se espera al arrancar el hilo.
+    Con varias cámaras, `scheduler` (core/lanes.InferenceScheduler) reparte los turnos de inferencia.
+    Con max_stride > 1 la detección completa solo corre cada N frames (N adaptativo, ver
+    core/prediction.py); los frames intermedios se publican con predicted=True y landmarks extrapolados.
+    El frame anotado solo se dibuja si alguien está suscrito a 'frame_annotated' (recibe un
+    FrameEnvelope con el frame anotado y los landmarks); 'hand_detected' lleva el frame sin anotar.
+    Con DETECTOR_GATE, un filtro de movimiento (core/gate.py) evita la inferencia en escenas
+    vacías o quietas; esos frames se publican sin mano y con gated=True.
+    Las detecciones reales pasan además por un LetterConfirmer (core/confirmation.py), que
+    publica 'letter_confirmed' / 'letter_held' / 'letter_released' con suavizado temporal.
+    Con DETECTOR_MAX_HANDS > 1, 'hand_detected' lleva hands= (todas las manos, con id estable)
+    y cada mano tiene su propio LetterConfirmer (sus eventos llevan hand=id).
     """
-    def __init__(self, event_bus, detector, frame_queue:Queue):
+    def __init__(self, event_bus, detector, frame_ring:FrameRing, governor=None, scheduler=None, max_stride=None):
         super().__init__(daemon=True)
         self.event_bus = event_bus
         self.detector = detector
-        self.frame_queue = frame_queue
+        self.frame_ring = frame_ring
+        self.governor = governor
+        self.scheduler = scheduler
+        if max_stride is None:
+            max_stride = getattr(cfg, "DETECTION_STRIDE_MAX", 1)
+        self.stride = AdaptiveStride(max_stride, budget=getattr(cfg, "DETECTION_STRIDE_BUDGET", 0.5))
+        self.predictor = LandmarkPredictor()
+        self.gate = None
+        if getattr(cfg, "DETECTOR_GATE", True):
+            self.gate = PresenceGate(motion_threshold=getattr(cfg, "GATE_MOTION_THRESHOLD", 4.0),
+                                     skin_min=getattr(cfg, "GATE_SKIN_MIN", 0.0),
+                                     hold=getattr(cfg, "GATE_HOLD_S", 1.0))
+        # latencia real de detección: con autotune rebaja el perfil de la máquina si no cabe (core/tuner.py)
+        self.latency = LatencyMonitor() if getattr(cfg, "DETECTOR_AUTOTUNE", True) else None
+        self.confirmer = self._new_confirmer()
+        self.max_hands = getattr(cfg, "DETECTOR_MAX_HANDS", 1)
+        self.hand_confirmers = {}   # id de mano -> LetterConfirmer (solo con varias manos)
         self.running = False
 
     def run(self):
         self.running = True
-        while self.running:
+        if isinstance(self.detector, Future):
+            # detector aún calentándose (core/warmup.py): lo esperamos aquí, no en la UI
             try:
-                frame = self.frame_queue.get(timeout=0.5)
-            except Empty:
+                self.detector = self.detector.result()
+            except Exception as e:
+                print("[ProcessingThread] no se pudo cargar el detector:", e)
+                self.running = False
+                return
+        if self.latency is not None:
+            # la rebaja parte del perfil con que se construyó este detector (core/tuner.py)
+            self.latency.profile = getattr(self.detector, "profile", None) or current_profile()
+        last_seq = 0
+        while self.running:
+            item = self.frame_ring.borrow_latest(after_seq=last_seq, timeout=0.5)
+            if item is None:
                 continue
+            last_seq, token, frame = item
+            # metadatos de captura (seq, instante, fuente) que acompañan al frame
+            env = self.frame_ring.envelope(token) or FrameEnvelope(last_seq, time.monotonic_ns(), None, frame)
             # src/signperu/core/processing.py (dentro del while)
             try:
-                letra, frame_proc, coords = self.detector.detect_from_frame(frame)
-                if coords:
+                if not self.stride.on_frame(env.t_capture_ns):
+                    self._publish_predicted(env, frame)
+                    continue
+                if self.gate is not None and not self.gate.should_detect(frame, env.t_capture_ns):
+                    self._publish_gated(env, frame)
+                    if self.governor is not None:
+                        # fuera del throughput: el governor debe medir al detector, no a la puerta
+                        self.governor.on_gated()
+                    continue
+                turn = self.scheduler.turn(env.source_id) if self.scheduler is not None else nullcontext()
+                # anotar (copia + dibujo) solo si algún consumidor quiere el frame anotado
+                annotate = self.event_bus.has_subscribers("frame_annotated")
+                with turn:
+                    t0 = time.perf_counter()
+                    letra, frame_proc, coords = self.detector.detect_from_frame(frame, annotate=annotate)
+                    elapsed = time.perf_counter() - t0
+                    if self.governor is not None:
+                        self.governor.on_processed(elapsed)
+                self.stride.on_detected(elapsed)
+                if self.latency is not None:
+                    self.latency.on_detected(elapsed)
+                self.predictor.observe(env.t_capture_ns, letra, coords)
+                if self.gate is not None:
+                    self.gate.on_result(coords is not None, env.t_capture_ns)
+                if coords is not None:
                     """ #Solo para comprobar que detecta las manos
                     try:
                         print("[ProcessingThread] detected:", letra, "landmarks(0:5):", coords[:5])
                     except Exception:
                         print("[ProcessingThread] detected:", letra, "landmarks count:", len(coords))
                     """
-                # Publicamos coords como 'landmarks' para quien quiera verlas
-                self.event_bus.publish("hand_detected", letra, frame=frame_proc, landmarks=coords)
+                # Publicamos coords como 'landmarks' para quien quiera verlas; el envelope
+                # permite emparejar landmarks y frames con su captura y medir su antigüedad
+                # source: estación de origen (varias cámaras comparten el mismo EventBus)
+                # hands: todas las manos del frame (letra y landmarks de cada una, ver clasificador/manos.py)
+                hands = getattr(self.detector, "hands", None)
+                self.event_bus.publish("hand_detected", letra, frame=frame, landmarks=coords,
+                                       envelope=env.derive(frame=frame, landmarks=coords),
+                                       source=env.source_id, predicted=False, hands=hands)
+                if annotate:
+                    self.event_bus.publish("frame_annotated", env.derive(frame=frame_proc, landmarks=coords),
+                                           source=env.source_id)
+                self._confirm(letra, hands, env)
             except Exception as e:
                 print("[ProcessingThread] error:", e)
+            finally:
+                # devolvemos el slot al anillo para que la captura pueda reutilizarlo
+                self.frame_ring.release(token)
+        # al parar soltamos la letra confirmada (los juegos reciben su 'letter_released')
+        self.confirmer.reset()
+        for confirmer in self.hand_confirmers.values():
+            confirmer.reset()
+        self.hand_confirmers.clear()
+
+    def _new_confirmer(self, hand=None):
+        return LetterConfirmer(self.event_bus,
+                               window=getattr(cfg, "DETECTOR_SMOOTHING_WINDOW", 0.5),
+                               threshold=getattr(cfg, "DETECTOR_CONFIRM_THRESHOLD", 0.6),
+                               hand=hand)
+
+    def _confirm(self, letra, hands, env):
+        """Pasa la detección a los confirmadores: uno por carril o, con varias manos, uno por mano."""
+        if self.max_hands <= 1:
+            self.confirmer.update(letra, env.t_capture_ns, env.source_id)
+            return
+        vistas = {mano["id"]: mano["letra"] for mano in hands or []}
+        for hid in vistas:
+            if hid not in self.hand_confirmers:
+                self.hand_confirmers[hid] = self._new_confirmer(hand=hid)
+        for hid, confirmer in list(self.hand_confirmers.items()):
+            confirmer.update(vistas.get(hid), env.t_capture_ns, env.source_id)
+            # mano que se fue y ya soltó su letra: su confirmador sobra
+            if hid not in vistas and confirmer.idle:
+                del self.hand_confirmers[hid]
+
+    def _publish_predicted(self, env, frame):
+        """Frame intermedio (sin detección): última letra real + landmarks extrapolados."""
+        t0 = time.perf_counter()
+        letra, puntos = self.predictor.predict(env.t_capture_ns)
+        coords = puntos.astype(np.int16) if puntos is not None else None
+        self.event_bus.publish("hand_detected", letra, frame=frame, landmarks=coords,
+                               envelope=env.derive(frame=frame, landmarks=coords),
+                               source=env.source_id, predicted=True, hands=None)
+        if self.governor is not None:
+            # el governor ve el coste medio real por frame (detección amortizada en N frames)
+            self.governor.on_processed(time.perf_counter() - t0)
+
+    def _publish_gated(self, env, frame):
+        """Frame descartado por el filtro de presencia: mismo resultado que una detección sin mano."""
+        self.predictor.observe(env.t_capture_ns, None, None)
+        self.event_bus.publish("hand_detected", None, frame=frame, landmarks=None,
+                               envelope=env.derive(frame=frame), source=env.source_id,
+                               predicted=False, gated=True, hands=[])
+        self._confirm(None, [], env)
 
     def stop(self):
         self.running = False
\ No newline at end of file
@@ -0,0 +1,249 @@
+# srlsp-game/src/signperu/core/recorder.py
+# Grabación de lo que vio la cámara durante una sesión, para reproducirlo sin cámara.
+#
+# Formato de una grabación (carpeta):
+#   meta.json        -> forma de cada chunk, frames por chunk, fuente original
+#   index.bin        -> registros INDEX_DTYPE (seq, t_ns, chunk, slot) en orden de llegada
+#   chunk_00000.bin  -> np.memmap uint8 de forma (frames_per_chunk, alto, ancho, 3)
+#
+# NOTAS:
+# - FrameRecorder se suscribe a 'frame_captured'; el handler solo copia (y escala si
+#   se pide) el frame a una cola acotada. Si la cola está llena el frame se descarta
+#   (la captura nunca espera al disco) y se cuenta en `dropped`.
+# - Con source_id solo graba los frames de esa estación (con varias cámaras hay un
+#   FrameRecorder por carril, cada uno en su carpeta). La carpeta debe estar vacía o no
+#   existir: start() se niega a mezclar una grabación nueva con una anterior.
+# - Si cambia la resolución se abre un chunk nuevo; meta["chunks"] guarda la forma de
+#   cada chunk, así RecordingReader lee bien los anteriores.
+# - Un hilo escritor vuelca los frames en chunks memory-mapped de tamaño fijo, así
+#   la memoria usada es: cola (max_pending frames) + las páginas sucias del chunk actual.
+# - RecordingReader abre chunks con mmap de solo lectura y busca por tiempo con
+#   np.searchsorted sobre el índice. RecordingSource es una FrameSource para replay.
+import json
+import os
+import threading
+import time
+from queue import Queue, Full, Empty
+
+import cv2
+import numpy as np
+
+from signperu.core.sources import FrameSource
+
+INDEX_DTYPE = np.dtype([("seq", "<i8"), ("t_ns", "<i8"), ("chunk", "<i4"), ("slot", "<i4")])
+META_FILE = "meta.json"
+INDEX_FILE = "index.bin"
+
+
+def _chunk_path(path, n):
+    return os.path.join(path, f"chunk_{n:05d}.bin")
+
+
+class FrameRecorder:
+    """
+    Graba los frames de 'frame_captured' en una carpeta (ver formato arriba).
+    size=(ancho, alto) escala antes de guardar; max_fps limita la tasa grabada.
+    """
+    def __init__(self, event_bus, path, size=None, max_fps=0, frames_per_chunk=256, max_pending=8,
+                 source_id=None):
+        self.event_bus = event_bus
+        self.path = path
+        self.source_id = source_id   # None = cualquier fuente (una sola cámara)
+        self.size = tuple(size) if size else None
+        self.max_fps = max_fps
+        self.frames_per_chunk = int(frames_per_chunk)
+        self._queue = Queue(maxsize=max(1, int(max_pending)))
+        self._thread = None
+        self._last_t_ns = 0
+        self._source_id = source_id
+        self._chunk_shapes = []    # forma (alto, ancho, 3) de cada chunk escrito
+        self.recorded = 0
+        self.dropped = 0
+
+    # ---------------- ciclo de vida ----------------
+    def start(self):
+        """Empieza a grabar. FileExistsError si la carpeta ya tiene una grabación."""
+        if any(os.path.exists(os.path.join(self.path, f)) for f in (META_FILE, INDEX_FILE)):
+            raise FileExistsError(f"{self.path} ya contiene una grabación")
+        os.makedirs(self.path, exist_ok=True)
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+        self.event_bus.subscribe("frame_captured", self._on_frame)
+
+    def stop(self, timeout=5.0):
+        self.event_bus.unsubscribe("frame_captured", self._on_frame)
+        if self._thread:
+            self._queue.put(None)   # centinela: el escritor vacía la cola y termina
+            self._thread.join(timeout)
+            self._thread = None
+
+    # ---------------- productor (hilo de captura) ----------------
+    def _on_frame(self, env):
+        if self.source_id is not None and env.source_id != self.source_id:
+            return
+        if self.max_fps and env.t_capture_ns - self._last_t_ns < 1e9 / self.max_fps:
+            return
+        self._last_t_ns = env.t_capture_ns
+        self._source_id = env.source_id
+        # copiamos ya: el slot del FrameRing se reutilizará (el resize también copia)
+        if self.size:
+            frame = cv2.resize(env.frame, self.size, interpolation=cv2.INTER_AREA)
+        else:
+            frame = env.frame.copy()
+        try:
+            self._queue.put_nowait((env.seq, env.t_capture_ns, frame))
+        except Full:
+            self.dropped += 1
+
+    # ---------------- escritor (hilo propio) ----------------
+    def _writer(self):
+        chunk, chunk_no, slot = None, -1, 0
+        with open(os.path.join(self.path, INDEX_FILE), "wb") as index:
+            while True:
+                try:
+                    item = self._queue.get(timeout=0.5)
+                except Empty:
+                    continue
+                if item is None:
+                    break
+                seq, t_ns, frame = item
+                if chunk is None or slot >= self.frames_per_chunk or chunk.shape[1:] != frame.shape:
+                    if chunk is not None:
+                        chunk.flush()
+                    chunk_no += 1
+                    slot = 0
+                    chunk = np.memmap(_chunk_path(self.path, chunk_no), dtype=np.uint8, mode="w+",
+                                      shape=(self.frames_per_chunk,) + frame.shape)
+                    self._chunk_shapes.append(list(frame.shape))
+                    self._write_meta()
+                chunk[slot] = frame
+                rec = np.array([(seq, t_ns, chunk_no, slot)], dtype=INDEX_DTYPE)
+                index.write(rec.tobytes())
+                slot += 1
+                self.recorded += 1
+            if chunk is not None:
+                chunk.flush()
+            index.flush()
+        self._write_meta()
+
+    def _write_meta(self):
+        meta = {
+            # "shape": forma del último chunk (grabaciones antiguas solo tienen esta)
+            "shape": self._chunk_shapes[-1] if self._chunk_shapes else None,
+            "chunks": self._chunk_shapes,
+            "frames_per_chunk": self.frames_per_chunk,
+            "source_id": self._source_id,
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with open(os.path.join(self.path, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+
+class RecordingReader:
+    """Acceso aleatorio a una grabación: por posición (frame(i)) o por tiempo (seek_time)."""
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, META_FILE), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.shape = tuple(self.meta["shape"]) if self.meta.get("shape") else None
+        self.chunk_shapes = [tuple(shape) for shape in self.meta.get("chunks") or []]
+        self.frames_per_chunk = self.meta["frames_per_chunk"]
+        self.index = np.fromfile(os.path.join(path, INDEX_FILE), dtype=INDEX_DTYPE)
+        self._chunks = {}
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def duration(self):
+        """Segundos entre el primer y el último frame."""
+        if len(self.index) < 2:
+            return 0.0
+        return (self.index["t_ns"][-1] - self.index["t_ns"][0]) / 1e9
+
+    def _chunk(self, n):
+        chunk = self._chunks.get(n)
+        if chunk is None:
+            shape = self.chunk_shapes[n] if n < len(self.chunk_shapes) else self.shape
+            chunk = np.memmap(_chunk_path(self.path, n), dtype=np.uint8, mode="r",
+                              shape=(self.frames_per_chunk,) + shape)
+            self._chunks[n] = chunk
+        return chunk
+
+    def frame(self, i):
+        """(registro del índice, frame) de la posición i. El frame es una vista del mmap (solo lectura)."""
+        rec = self.index[i]
+        return rec, self._chunk(int(rec["chunk"]))[int(rec["slot"])]
+
+    def seek_time(self, seconds):
+        """Posición del primer frame capturado en o después de `seconds` desde el inicio."""
+        if not len(self.index):
+            return 0
+        t = self.index["t_ns"][0] + int(seconds * 1e9)
+        return min(int(np.searchsorted(self.index["t_ns"], t)), len(self.index) - 1)
+
+    def frame_at(self, seconds):
+        return self.frame(self.seek_time(seconds))
+
+    def __iter__(self):
+        for i in range(len(self.index)):
+            yield self.frame(i)
+
+
+class RecordingSource(FrameSource):
+    """
+    Reproduce una grabación como FrameSource. En tiempo real respeta los instantes
+    originales de captura (saltando frames si vamos atrasados).
+    """
+    def __init__(self, path, realtime=True, loop=False, start=0.0):
+        super().__init__(realtime=realtime)
+        self.path = path
+        self.loop = loop
+        self.start = start
+        self.reader = None
+        self.source_id = os.path.basename(os.path.normpath(path))
+        self._pos = 0
+
+    def open(self):
+        try:
+            self.reader = RecordingReader(self.path)
+        except (OSError, ValueError, KeyError):
+            return False
+        if not len(self.reader):
+            return False
+        self._pos = self.reader.seek_time(self.start)
+        self._t0 = None
+        return True
+
+    def read(self, out=None):
+        if self._pos >= len(self.reader):
+            if not self.loop:
+                self.exhausted = True
+                return False, None
+            self._pos = self.reader.seek_time(self.start)
+            self._t0 = None
+        if self.realtime:
+            self._pace_recorded()
+        _, frame = self.reader.frame(self._pos)
+        self._pos += 1
+        if out is not None and out.shape == frame.shape:
+            out[...] = frame
+            return True, out
+        return True, np.array(frame)
+
+    def _pace_recorded(self):
+        """Como FrameSource._pace pero con los instantes grabados en lugar de fps fijos."""
+        t_ns = self.reader.index["t_ns"]
+        now = time.monotonic()
+        if self._t0 is None:
+            self._t0 = now - (t_ns[self._pos] - t_ns[0]) / 1e9
+        due = self._t0 + (t_ns[self._pos] - t_ns[0]) / 1e9
+        if due > now:
+            time.sleep(due - now)
+            return
+        # atrasados: saltamos al último frame cuyo instante ya pasó
+        elapsed_ns = t_ns[0] + int((now - self._t0) * 1e9)
+        latest = int(np.searchsorted(t_ns, elapsed_ns, side="right")) - 1
+        self._pos = max(self._pos, min(latest, len(t_ns) - 1))
@@ -0,0 +1,286 @@
+# srlsp-game/src/signperu/core/sources.py
+# Fuentes de frames intercambiables para CaptureThread (patrón Strategy).
+#
+# NOTAS:
+# - CameraSource: webcam física (cv2.VideoCapture con CAP_DSHOW si existe).
+# - VideoFileSource: clip grabado (reproduce quejas de campo sin cámara).
+# - ImageDirSource: carpeta de imágenes (jpg/png/bmp) en orden alfabético.
+# - SyntheticSource: patrón generado en memoria (benchmarks en máquinas sin cámara).
+# - realtime=True: los frames siguen el reloj de pared (espera si vamos adelantados,
+#   salta frames si vamos atrasados). realtime=False: "lo más rápido posible",
+#   cada frame se entrega una vez y sin esperas (útil para medir throughput).
+# - read(out) escribe en el buffer `out` si se proporciona (slots del FrameRing).
+# - Las fuentes con supports_grab separan grab() (capturar, barato) de retrieve(out)
+#   (decodificar); CaptureThread lo usa para decodificar solo los frames que se usan.
+import os
+import time
+
+import cv2
+import numpy as np
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class FrameSource:
+    """
+    Interfaz de una fuente de frames. Subclases implementan open/read/release.
+    """
+    source_id = "source"
+    supports_grab = False
+
+    def __init__(self, realtime=True, fps=0.0):
+        self.realtime = realtime
+        self.fps = float(fps or 0.0)
+        self.exhausted = False   # True cuando una fuente finita ya no tiene frames
+        self._t0 = None
+        self._n = 0
+
+    def open(self) -> bool:
+        raise NotImplementedError()
+
+    def read(self, out=None):
+        """Devuelve (ok, frame). Si out se proporciona, intenta escribir en él."""
+        raise NotImplementedError()
+
+    def grab(self):
+        """Captura el siguiente frame sin decodificarlo. Por defecto no hay separación."""
+        return True
+
+    def retrieve(self, out=None):
+        """Decodifica el frame capturado con grab(). Por defecto equivale a read()."""
+        return self.read(out)
+
+    def release(self):
+        pass
+
+    def _pace(self):
+        """
+        Modo tiempo real: espera hasta el instante del próximo frame.
+        Devuelve cuántos frames hay que saltar si vamos atrasados (0 si no).
+        """
+        if not self.realtime or self.fps <= 0:
+            return 0
+        now = time.monotonic()
+        if self._t0 is None:
+            self._t0 = now
+            self._n = 0
+        due = self._t0 + self._n / self.fps
+        skip = 0
+        if due > now:
+            time.sleep(due - now)
+        else:
+            skip = int((now - due) * self.fps)
+        self._n += 1 + skip
+        return skip
+
+    @staticmethod
+    def _into(frame, out):
+        """Copia frame en out si las formas coinciden; si no, devuelve frame tal cual."""
+        if out is None or frame is None or out.shape != frame.shape:
+            return frame
+        out[...] = frame
+        return out
+
+
+class CameraSource(FrameSource):
+    """Webcam física. El driver ya marca el ritmo, así que no aplica pacing propio."""
+    supports_grab = True
+
+    def __init__(self, src=0):
+        super().__init__(realtime=True)
+        self.src = src
+        self.source_id = f"cam{src}"
+        self.cap = None
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.src, cv2.CAP_DSHOW if hasattr(cv2, "CAP_DSHOW") else 0)
+        return self.cap.isOpened()
+
+    def read(self, out=None):
+        if out is not None:
+            return self.cap.read(image=out)
+        return self.cap.read()
+
+    def grab(self):
+        return self.cap.grab()
+
+    def retrieve(self, out=None):
+        if out is not None:
+            return self.cap.retrieve(image=out)
+        return self.cap.retrieve()
+
+    def release(self):
+        try:
+            if self.cap and self.cap.isOpened():
+                self.cap.release()
+        except Exception:
+            pass
+
+
+class VideoFileSource(FrameSource):
+    """Clip de vídeo grabado. En tiempo real respeta los fps del archivo saltando frames si hace falta."""
+    supports_grab = True
+
+    def __init__(self, path, realtime=True, loop=False):
+        super().__init__(realtime=realtime)
+        self.path = path
+        self.loop = loop
+        self.source_id = os.path.basename(path)
+        self.cap = None
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            return False
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        return True
+
+    def read(self, out=None):
+        for _ in range(self._pace()):
+            self.cap.grab()
+        ok, frame = self.cap.read(image=out) if out is not None else self.cap.read()
+        if not ok and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.cap.read(image=out) if out is not None else self.cap.read()
+        if not ok:
+            self.exhausted = True
+        return ok, frame
+
+    def grab(self):
+        for _ in range(self._pace()):
+            self.cap.grab()
+        ok = self.cap.grab()
+        if not ok and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok = self.cap.grab()
+        if not ok:
+            self.exhausted = True
+        return ok
+
+    def retrieve(self, out=None):
+        if out is not None:
+            return self.cap.retrieve(image=out)
+        return self.cap.retrieve()
+
+    def release(self):
+        try:
+            if self.cap:
+                self.cap.release()
+        except Exception:
+            pass
+
+
+class ImageDirSource(FrameSource):
+    """
+    Carpeta de imágenes en orden alfabético, a `fps` constantes.
+    cache=True decodifica cada imagen una sola vez (mide el pipeline sin coste de imread).
+    """
+    def __init__(self, path, fps=20, realtime=True, loop=True, cache=False):
+        super().__init__(realtime=realtime, fps=fps)
+        self.path = path
+        self.loop = loop
+        self.cache = cache
+        self.source_id = os.path.basename(os.path.normpath(path))
+        self._files = []
+        self._decoded = {}
+        self._pos = 0
+
+    def open(self):
+        try:
+            names = sorted(f for f in os.listdir(self.path) if f.lower().endswith(IMAGE_EXTS))
+        except OSError:
+            return False
+        self._files = [os.path.join(self.path, f) for f in names]
+        self._pos = 0
+        return bool(self._files)
+
+    def _load(self, i):
+        if self.cache and i in self._decoded:
+            return self._decoded[i]
+        img = cv2.imread(self._files[i], cv2.IMREAD_COLOR)
+        if self.cache and img is not None:
+            self._decoded[i] = img
+        return img
+
+    def read(self, out=None):
+        self._pos += self._pace()
+        if self._pos >= len(self._files):
+            if not self.loop:
+                self.exhausted = True
+                return False, None
+            self._pos %= len(self._files)
+        img = self._load(self._pos)
+        self._pos += 1
+        if img is None:
+            return False, None
+        return True, self._into(img, out)
+
+
+class SyntheticSource(FrameSource):
+    """
+    Patrón sintético (degradado + cuadrado en movimiento) generado sin asignar memoria
+    si se proporciona `out`. Sirve para medir el pipeline sin cámara ni archivos.
+    """
+    def __init__(self, size=(640, 480), fps=30, realtime=True, frames=0):
+        super().__init__(realtime=realtime, fps=fps)
+        self.size = (int(size[0]), int(size[1]))
+        self.frames = int(frames)   # 0 = infinito
+        self.source_id = "synthetic"
+        self._count = 0
+        self._base = None
+
+    def open(self):
+        w, h = self.size
+        ramp = np.linspace(0, 255, w, dtype=np.float32).astype(np.uint8)
+        self._base = np.empty((h, w, 3), dtype=np.uint8)
+        self._base[...] = ramp[None, :, None]
+        self._count = 0
+        return True
+
+    def read(self, out=None):
+        self._count += 1 + self._pace()
+        if self.frames and self._count > self.frames:
+            self.exhausted = True
+            return False, None
+        w, h = self.size
+        frame = out if out is not None and out.shape == self._base.shape else np.empty_like(self._base)
+        frame[...] = self._base
+        side = max(8, h // 6)
+        x = (self._count * 7) % max(1, w - side)
+        y = (self._count * 3) % max(1, h - side)
+        frame[y:y + side, x:x + side] = (40, 160, 220)
+        return True, frame
+
+
+def make_source(spec, realtime=True):
+    """
+    Crea una fuente a partir de una especificación sencilla:
+      0 / "1"           -> CameraSource (índice de cámara)
+      "synthetic"       -> SyntheticSource (admite "synthetic:640x480@30")
+      carpeta grabada   -> RecordingSource (core/recorder.py, contiene meta.json)
+      carpeta           -> ImageDirSource
+      ruta a archivo    -> VideoFileSource
+    Si spec ya es un FrameSource se devuelve tal cual.
+    """
+    if isinstance(spec, FrameSource):
+        return spec
+    if isinstance(spec, int) or (isinstance(spec, str) and spec.isdigit()):
+        return CameraSource(int(spec))
+    spec = str(spec)
+    if spec.startswith("synthetic"):
+        size, fps = (640, 480), 30
+        if ":" in spec:
+            opts = spec.split(":", 1)[1]
+            dims, _, rate = opts.partition("@")
+            if "x" in dims:
+                w, h = dims.split("x")
+                size = (int(w), int(h))
+            if rate:
+                fps = float(rate)
+        return SyntheticSource(size=size, fps=fps, realtime=realtime)
+    if os.path.isdir(spec):
+        if os.path.isfile(os.path.join(spec, "meta.json")):
+            from signperu.core.recorder import RecordingSource   # import diferido: recorder importa este módulo
+            return RecordingSource(spec, realtime=realtime)
+        return ImageDirSource(spec, realtime=realtime)
+    return VideoFileSource(spec, realtime=realtime)
@@ -0,0 +1,100 @@
+# srlsp-game/src/signperu/core/streams.py
+# Flujos de frames a varias resoluciones generados una sola vez en la captura.
+#
+# NOTAS:
+# - Cada resolución es un evento del EventBus con nombre "frame@<ancho>x<alto>".
+#   Un consumidor pide la resolución que necesita simplemente suscribiéndose:
+#       event_bus.subscribe(stream_event((380, 290)), callback)
+#   Con varias cámaras (core/lanes.py) cada carril atiende además sus flujos
+#   etiquetados "frame@<ancho>x<alto>/<source_id>"; los nombres sin etiqueta los
+#   sirve solo el carril principal.
+# - StreamScaler (dentro de CaptureThread) consulta qué flujos tienen suscriptores
+#   y escala cada frame a esas resoluciones una vez, en lugar de que cada juego/GUI
+#   haga su propio resize del frame completo.
+# - El evento publica un FrameEnvelope (misma seq/instante que el frame original)
+#   cuyo .frame es el frame escalado.
+# - Los frames escalados viven en FrameRing pequeños: la referencia recibida es
+#   válida durante al menos `slots - 1` frames (igual que 'frame_captured'). Un
+#   consumidor de UI que lo pinta más tarde (after(), loop del juego) debe copiarlo en
+#   el handler: son frames de tamaño de pantalla y la copia es barata.
+import cv2
+
+from signperu.core.frame_ring import FrameRing
+
+STREAM_PREFIX = "frame@"
+
+
+def stream_event(size, source_id=None):
+    """Nombre del evento para frames de tamaño (ancho, alto), opcionalmente de una sola fuente."""
+    name = f"{STREAM_PREFIX}{int(size[0])}x{int(size[1])}"
+    return f"{name}/{source_id}" if source_id is not None else name
+
+
+def parse_stream_event(name):
+    """
+    Inverso de stream_event(): 'frame@380x290' -> ((380, 290), None),
+    'frame@380x290/cam1' -> ((380, 290), 'cam1'), o None si no es un flujo.
+    """
+    if not name.startswith(STREAM_PREFIX):
+        return None
+    dims, _, source_id = name[len(STREAM_PREFIX):].partition("/")
+    try:
+        w, h = dims.split("x")
+        return (int(w), int(h)), (source_id or None)
+    except ValueError:
+        return None
+
+
+def fit_size(src_size, box):
+    """Mayor tamaño con la proporción de src_size que cabe en box (como PIL.thumbnail)."""
+    sw, sh = src_size
+    bw, bh = box
+    scale = min(bw / float(sw), bh / float(sh), 1.0)
+    return max(1, int(round(sw * scale))), max(1, int(round(sh * scale)))
+
+
+class StreamScaler:
+    """
+    Produce, para cada frame, las resoluciones que algún suscriptor ha pedido.
+    """
+    def __init__(self, event_bus, slots=3, source_id=None, primary=True):
+        self.event_bus = event_bus
+        self.slots = slots
+        self.source_id = source_id   # atiende los flujos etiquetados con esta fuente
+        self.primary = primary       # y, si es el carril principal, los no etiquetados
+        self._rings = {}        # nombre de evento -> ((w, h), FrameRing)
+        self._version = None    # versión del bus con la que se calculó _rings
+
+    def _refresh(self):
+        rings = {}
+        for name in self.event_bus.event_names(STREAM_PREFIX):
+            parsed = parse_stream_event(name)
+            if not parsed:
+                continue
+            size, source_id = parsed
+            if (source_id is None and self.primary) or (source_id is not None and source_id == self.source_id):
+                # conservamos buffers ya reservados; liberamos los que nadie usa
+                rings[name] = self._rings.get(name) or (size, FrameRing(shape=(size[1], size[0], 3), slots=self.slots))
+        self._rings = rings
+        self._version = self.event_bus.version
+
+    def active(self):
+        """True si hay al menos un flujo con suscriptores para esta fuente."""
+        if self._version != self.event_bus.version:
+            self._refresh()
+        return bool(self._rings)
+
+    def publish(self, envelope):
+        """Escala envelope.frame a cada resolución activa y publica el evento correspondiente."""
+        if self._version != self.event_bus.version:
+            self._refresh()
+        frame = envelope.frame
+        for name, (size, ring) in self._rings.items():
+            idx, buf = ring.acquire_write()
+            if buf is None:
+                continue
+            cv2.resize(frame, size, dst=buf, interpolation=cv2.INTER_AREA)
+            ring.ref_size = (frame.shape[1], frame.shape[0])
+            scaled = envelope.derive(frame=buf)
+            ring.commit(idx, scaled)
+            self.event_bus.publish(name, scaled)
@@ -0,0 +1,330 @@
+# srlsp-game/src/signperu/core/tuner.py
+# Ajuste automático de la detección a cada máquina: complejidad del modelo, tamaño de
+# entrada del detector y umbrales de MediaPipe.
+#
+# NOTAS:
+# - PROFILES va de más calidad a más ligero. tune() mide cada perfil con una calibración
+#   corta (un DetectorWrapper con el motor, la cascada y las plantillas de la config sobre
+#   frames de TUNER_CALIBRATION_SOURCE) y se queda con el primero cuya latencia mediana
+#   cabe en DETECTOR_LATENCY_BUDGET_MS.
+# - Los perfiles ligeros bajan también min_tracking_confidence: MediaPipe sigue la mano
+#   con el modelo de landmarks en vez de volver a la detección de palma (lo más caro).
+# - Solo cuentan los frames en que se detectó una mano (sin mano no corre el modelo de
+#   landmarks). TUNER_CALIBRATION_SOURCE debe ser una grabación con manos (app.py --record):
+#   sin ella, o con menos de MIN_HAND_FRAMES frames con mano, no se calibra ni se guarda nada.
+# - El perfil elegido se guarda en TUNER_PROFILE_PATH (JSON) con clave platform.node():
+#   las ejecuciones siguientes lo aplican sin medir hasta cumplir TUNER_MAX_AGE_DAYS.
+# - apply_profile() escribe los valores en signperu.config (DETECTION_SIZE y DETECTOR_*),
+#   donde los leen CaptureThread y DetectorWrapper. start_warmup() aplica el perfil
+#   guardado antes de crear los carriles. Sin perfil vigente, request_calibration() la deja
+#   pendiente: medir mientras los carriles detectan sesgaría el perfil hacia los ligeros y
+#   haría tartamudear la sesión, así que calibrate_when_idle() la lanza al parar los
+#   carriles (LaneManager.stop) y pause_calibration() la aborta si vuelven a arrancar. Solo
+#   guarda el resultado: se aplica en el próximo arranque.
+# - LatencyMonitor vigila la latencia real en ProcessingThread: si la mediana de una
+#   ventana supera 1.5x el presupuesto, downgrade() guarda y aplica el siguiente perfil más
+#   ligero (se usa al construir el próximo detector o al reiniciar la aplicación). El perfil
+#   actual es estado del módulo: baja un solo escalón por perfil medido aunque lo pidan
+#   varios carriles, y la siguiente rebaja parte del perfil nuevo.
+import json
+import os
+import platform
+import statistics
+import threading
+import time
+
+import cv2
+
+from signperu import config as cfg
+from signperu.core.sources import make_source
+from signperu.core.streams import fit_size
+
+PROFILES = (
+    {"name": "completo", "model_complexity": 1, "detection_size": (320, 240),
+     "min_detection_confidence": 0.7, "min_tracking_confidence": 0.5},
+    {"name": "ligero", "model_complexity": 0, "detection_size": (320, 240),
+     "min_detection_confidence": 0.6, "min_tracking_confidence": 0.5},
+    {"name": "ligero-256", "model_complexity": 0, "detection_size": (256, 192),
+     "min_detection_confidence": 0.6, "min_tracking_confidence": 0.4},
+    {"name": "minimo", "model_complexity": 0, "detection_size": (192, 144),
+     "min_detection_confidence": 0.5, "min_tracking_confidence": 0.4},
+)
+
+_lock = threading.Lock()
+_current = None   # perfil aplicado en este proceso
+_tuned = False    # tune() ya resolvió el perfil (guardado vigente o calibración)
+_pending = False  # falta calibrar (no hay perfil vigente); se mide cuando no corre ningún carril
+_thread = None    # hilo de la calibración en curso
+_cancel = threading.Event()   # pause_calibration(): un carril arranca, la medida se aborta
+
+
+def profile_by_name(name):
+    for profile in PROFILES:
+        if profile["name"] == name:
+            return profile
+    return None
+
+
+def apply_profile(profile):
+    """Escribe el perfil en signperu.config (lo leen las capturas y detectores que se creen después)."""
+    cfg.DETECTION_SIZE = tuple(profile["detection_size"])
+    cfg.DETECTOR_MODEL_COMPLEXITY = profile["model_complexity"]
+    cfg.DETECTOR_MIN_DETECTION_CONFIDENCE = profile["min_detection_confidence"]
+    cfg.DETECTOR_MIN_TRACKING_CONFIDENCE = profile["min_tracking_confidence"]
+
+
+# ---------------- persistencia (un perfil por máquina) ----------------
+def _path():
+    return getattr(cfg, "TUNER_PROFILE_PATH", os.path.join("data", "detector_profiles.json"))
+
+
+def _load_all():
+    try:
+        with open(_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_entry(node=None):
+    """Entrada guardada de esta máquina ({'profile', 'latency_ms', 'measured_at', ...}) o None."""
+    return _load_all().get(node or platform.node())
+
+
+def save_entry(profile, latency_ms, node=None, reason="calibración"):
+    path = _path()
+    data = _load_all()
+    data[node or platform.node()] = {
+        "profile": profile["name"],
+        "latency_ms": None if latency_ms is None else round(latency_ms, 2),
+        "budget_ms": getattr(cfg, "DETECTOR_LATENCY_BUDGET_MS", 40),
+        "measured_at": time.time(),
+        "reason": reason,
+    }
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        print("[tuner] no se pudo guardar el perfil:", e)
+
+
+def apply_cached_profile():
+    """
+    Aplica el perfil guardado de esta máquina (si lo hay). Devuelve True si además
+    sigue vigente (más reciente que TUNER_MAX_AGE_DAYS) y no hace falta recalibrar.
+    """
+    global _current
+    entry = load_entry()
+    profile = profile_by_name(entry.get("profile")) if entry else None
+    if profile is None:
+        return False
+    apply_profile(profile)
+    _current = profile
+    max_age = getattr(cfg, "TUNER_MAX_AGE_DAYS", 7) * 86400
+    return time.time() - entry.get("measured_at", 0) < max_age
+
+
+# ---------------- calibración ----------------
+MIN_HAND_FRAMES = 10   # frames con mano necesarios para que la medida valga
+
+
+def calibration_frames(n=40):
+    """Frames para medir de TUNER_CALIBRATION_SOURCE (en bucle si es corta); [] si no hay fuente."""
+    spec = getattr(cfg, "TUNER_CALIBRATION_SOURCE", None)
+    if not spec:
+        print("[tuner] sin TUNER_CALIBRATION_SOURCE (grabación con manos): no se calibra")
+        return []
+    source = make_source(spec, realtime=False)
+    frames = []
+    if not source.open():
+        print(f"[tuner] no se pudo abrir la fuente de calibración {spec}")
+        return []
+    try:
+        for _ in range(n * 4):   # tope de lecturas fallidas
+            ok, frame = source.read()
+            if ok and frame is not None:
+                frames.append(frame.copy())
+            elif source.exhausted:
+                break
+            if len(frames) >= n:
+                break
+    finally:
+        source.release()
+    return frames
+
+
+def _wait_result(detector, results, timeout=1.0):
+    """Espera el resultado asíncrono del motor "tasks" (legacy ya lo tiene al volver)."""
+    limite = time.perf_counter() + timeout
+    while detector.engine_stats.results <= results and time.perf_counter() < limite:
+        if _cancel.is_set():
+            return
+        time.sleep(0.001)
+
+
+def benchmark(profile, frames):
+    """
+    Latencia mediana (ms) de una detección completa con `profile` sobre los `frames` en que
+    se detectó una mano, con el motor, la cascada y las plantillas que elige la config.
+    None si hubo menos de MIN_HAND_FRAMES frames con mano o se pausó la calibración.
+    """
+    from signperu.core.detector import DetectorWrapper
+    detector = DetectorWrapper(profile=profile)
+    try:
+        small = []
+        for frame in frames:
+            size = fit_size((frame.shape[1], frame.shape[0]), profile["detection_size"])
+            small.append(cv2.resize(frame, size, interpolation=cv2.INTER_AREA))
+        # la primera inferencia inicializa: no cuenta
+        results = detector.engine_stats.results
+        detector.detect_from_frame(small[0], annotate=False)
+        _wait_result(detector, results)
+        tiempos = []
+        for frame in small[1:]:
+            if _cancel.is_set():
+                return None
+            results = detector.engine_stats.results
+            t0 = time.perf_counter()
+            detector.detect_from_frame(frame, annotate=False)
+            _wait_result(detector, results)
+            if detector.hands:   # sin mano no corre el modelo de landmarks: no es la carga real
+                tiempos.append(time.perf_counter() - t0)
+        if len(tiempos) < MIN_HAND_FRAMES:
+            print(f"[tuner] solo {len(tiempos)} frames con mano en la fuente de calibración; "
+                  "no se guarda el perfil")
+            return None
+        return statistics.median(tiempos) * 1000.0
+    finally:
+        detector.close()
+
+
+def tune(force=False, apply=True):
+    """
+    Perfil de esta máquina: el guardado si sigue vigente; si no, calibra y lo guarda.
+    apply=False solo guarda (lo usa el próximo arranque). Seguro de llamar varias veces
+    (solo calibra una vez por proceso). No mide con carriles en marcha: ver calibrate_when_idle().
+    """
+    global _current, _tuned, _pending
+    with _lock:
+        if _tuned and not force:
+            return _current
+        _tuned = True
+        if not force and apply_cached_profile():
+            return _current
+    frames = calibration_frames()
+    if len(frames) < 2:
+        _pending = False   # sin fuente válida otra pausa no mediría mejor
+        return _current
+    budget = getattr(cfg, "DETECTOR_LATENCY_BUDGET_MS", 40)
+    elegido, latencia = None, None
+    for profile in PROFILES:
+        latencia = benchmark(profile, frames)
+        if latencia is None:
+            # pausada (sigue pendiente) o sin manos: no se guarda una medida incompleta
+            _pending = _cancel.is_set()
+            return _current
+        elegido = profile
+        print(f"[tuner] perfil {profile['name']}: {latencia:.1f} ms (presupuesto {budget} ms)")
+        if latencia <= budget:
+            break
+    with _lock:
+        save_entry(elegido, latencia)
+        _pending = False
+        if not apply:
+            print(f"[tuner] perfil para {platform.node()}: {elegido['name']} (se aplica en el próximo arranque)")
+            return elegido
+        apply_profile(elegido)
+        _current = elegido
+    print(f"[tuner] perfil elegido para {platform.node()}: {elegido['name']}")
+    return elegido
+
+
+def current_profile():
+    """Perfil aplicado en este proceso (None = valores de la config)."""
+    return _current
+
+
+def request_calibration():
+    """Marca que falta calibrar esta máquina; se mide en el próximo calibrate_when_idle()."""
+    global _pending
+    with _lock:
+        _pending = True
+
+
+def calibrate_when_idle():
+    """
+    Lanza la calibración pendiente en un hilo daemon. Solo debe llamarse sin carriles en
+    marcha (LaneManager.stop); guarda el perfil sin aplicarlo.
+    """
+    global _thread
+    with _lock:
+        if not _pending or (_thread is not None and _thread.is_alive()):
+            return
+        _cancel.clear()
+        _thread = threading.Thread(target=tune, kwargs={"force": True, "apply": False},
+                                   name="detector-tuner", daemon=True)
+        _thread.start()
+
+
+def pause_calibration(timeout=1.0):
+    """Detiene la calibración en curso (arranca un carril); sigue pendiente para la próxima pausa."""
+    _cancel.set()
+    thread = _thread
+    if thread is not None:
+        thread.join(timeout)
+
+
+def wait_calibration():
+    """Espera a que termine la calibración en curso (al salir de app.py)."""
+    thread = _thread
+    if thread is not None and thread.is_alive():
+        print("[tuner] terminando la calibración de la máquina antes de salir...")
+        thread.join()
+
+
+def downgrade(observed_ms, measured=None):
+    """
+    Pasa al perfil siguiente más ligero que el actual: lo guarda y lo aplica a la config
+    (los próximos detectores se construyen con él). `measured` es el perfil con que se
+    midió la latencia; si ya no es el actual, otro carril ya rebajó y no se baja otro
+    escalón. Devuelve el nuevo perfil o None.
+    """
+    global _current
+    with _lock:
+        actual = _current or PROFILES[0]
+        if measured is not None and measured is not actual:
+            return None
+        i = PROFILES.index(actual) if actual in PROFILES else 0
+        if i + 1 >= len(PROFILES):
+            return None
+        siguiente = PROFILES[i + 1]
+        save_entry(siguiente, None, reason=f"latencia real {observed_ms:.1f} ms con {actual['name']}")
+        apply_profile(siguiente)
+        _current = siguiente
+        print(f"[tuner] latencia real {observed_ms:.1f} ms: próximo detector con perfil {siguiente['name']}")
+        return siguiente
+
+
+class LatencyMonitor:
+    """Mediana de la latencia real de detección por ventanas; rebaja el perfil de la máquina si no cabe."""
+    def __init__(self, budget_ms=None, window=300, factor=1.5):
+        self.budget_ms = budget_ms or getattr(cfg, "DETECTOR_LATENCY_BUDGET_MS", 40)
+        self.window = int(window)
+        self.factor = factor
+        self.median_ms = None
+        self.profile = None   # perfil del detector medido (lo fija ProcessingThread)
+        self._muestras = []
+
+    def on_detected(self, seconds):
+        self._muestras.append(seconds * 1000.0)
+        if len(self._muestras) < self.window:
+            return
+        self.median_ms = statistics.median(self._muestras)
+        self._muestras = []
+        if self.median_ms > self.factor * self.budget_ms:
+            # un escalón por perfil medido: las ventanas siguientes de este detector (o de
+            # otro carril con el mismo perfil) ya no bajan más
+            downgrade(self.median_ms, self.profile or current_profile() or PROFILES[0])
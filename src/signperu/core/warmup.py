@@ -0,0 +1,149 @@
+# srlsp-game/src/signperu/core/warmup.py
+# Calentamiento del detector en segundo plano y reserva de detectores para todo el proceso.
+#
+# NOTAS:
+# - Importar mediapipe y construir el grafo de Hands tarda varios segundos. start_warmup()
+#   lo hace en un hilo daemon nada más arrancar (app.py / MainWindow) y ejecuta una
+#   inferencia de prueba sobre un frame negro de DETECTION_SIZE para calentar cachés.
+# - Devuelve un concurrent.futures.Future: la UI consulta done() desde after() sin
+#   bloquearse; ProcessingThread espera result() en su propio hilo.
+# - Los detectores viven lo que el proceso, no lo que una sesión de captura:
+#   claim_detector() entrega uno libre de la reserva (o un Future nuevo si no queda) y
+#   release_detector() lo devuelve tras reset() (ROI y seguimiento de MediaPipe limpios),
+#   así parar/arrancar la cámara o lanzar otro juego no reconstruye el grafo de Hands.
+#   shutdown() cierra los que quedan en la reserva al salir.
+# - release_detector() no bloquea (se llama desde el hilo de Tk al parar): esperar al hilo
+#   de procesamiento y el reset() (una inferencia sobre un frame negro) ocurren en un hilo
+#   aparte, y a la reserva va enseguida un Future que claim_detector() entrega como
+#   cualquier otro. Si el hilo no termina o el reset falla, ese Future trae uno nuevo.
+# - Con DETECTOR_PROCESS el detector es un ProcessDetector: la inferencia de prueba
+#   arranca el proceso trabajador y espera a que MediaPipe esté cargado allí.
+# - Con DETECTOR_AUTOTUNE, start_warmup() aplica antes el perfil guardado de la máquina
+#   (core/tuner.py, lectura de un JSON). El primer detector se construye enseguida con ese
+#   perfil o con la config; si no hay perfil vigente, la calibración queda pendiente y
+#   corre cuando no hay ningún carril detectando (ver LaneManager.stop): solo guarda el
+#   perfil para el próximo arranque y no compite con la primera sesión.
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from signperu import config as cfg
+from signperu.core import tuner
+
+_lock = threading.Lock()
+_idle = []   # Futures de detectores libres (calentándose o ya listos), el más antiguo primero
+
+
+def _build():
+    """Construye el detector del carril según la config y hace una inferencia de prueba."""
+    t0 = time.perf_counter()
+    if getattr(cfg, "DETECTOR_PROCESS", False):
+        from signperu.core.detector_process import ProcessDetector
+        detector = ProcessDetector()
+    else:
+        from signperu.core.detector import DetectorWrapper
+        detector = DetectorWrapper()
+    w, h = getattr(cfg, "DETECTION_SIZE", None) or (cfg.FRAME_WIDTH, cfg.FRAME_HEIGHT)
+    detector.detect_from_frame(np.zeros((h, w, 3), dtype=np.uint8), annotate=False)
+    print(f"[warmup] detector listo en {time.perf_counter() - t0:.2f}s")
+    return detector
+
+
+def _spawn(build=_build):
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(build())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="detector-warmup", daemon=True).start()
+    return future
+
+
+def _recycle(detector, busy=None):
+    """Espera a que `busy` (hilo que lo usaba) termine y reinicia el detector; si no se puede, uno nuevo."""
+    if busy is not None:
+        busy.join(5.0)   # que no quede una detección en curso
+        if busy.is_alive():
+            print("[warmup] el hilo de procesamiento no terminó; se construye otro detector")
+            return _build()
+    try:
+        detector.reset()
+    except Exception as e:
+        print("[warmup] reset del detector falló, se descarta:", e)
+        _close(detector)
+        return _build()
+    return detector
+
+
+def _done(detector):
+    future = Future()
+    future.set_result(detector)
+    return future
+
+
+def start_warmup():
+    """
+    Future de un detector libre de la reserva; si no queda ninguno, arranca el
+    calentamiento de uno nuevo (la primera llamada, al abrir la aplicación).
+    """
+    with _lock:
+        if not _idle:
+            if getattr(cfg, "DETECTOR_AUTOTUNE", True):
+                # antes de que se creen los carriles: DETECTION_SIZE del perfil de la máquina
+                if not tuner.apply_cached_profile():
+                    tuner.request_calibration()   # se mide al parar los carriles
+            _idle.append(_spawn())
+        return _idle[0]
+
+
+def claim_detector():
+    """Future con un detector para un carril: uno libre de la reserva o uno nuevo en segundo plano."""
+    with _lock:
+        if _idle:
+            return _idle.pop(0)
+    return _spawn()
+
+
+def release_detector(detector, busy=None):
+    """
+    Devuelve a la reserva el detector de un carril que se detuvo (instancia o Future).
+    `busy`: hilo que aún puede estar usándolo. La espera y el reset() van en segundo plano.
+    """
+    if isinstance(detector, Future):
+        if not detector.done():
+            with _lock:
+                _idle.append(detector)   # aún calentándose: ya está limpio
+            return
+        if detector.exception() is not None:
+            return
+        detector = detector.result()
+    with _lock:
+        _idle.append(_spawn(lambda: _recycle(detector, busy)))
+
+
+def shutdown():
+    """Cierra los detectores libres (p. ej. procesos trabajadores de ProcessDetector)."""
+    with _lock:
+        libres = list(_idle)
+        _idle.clear()
+    def cerrar(f):
+        if f.exception() is None:
+            _close(f.result())
+    for future in libres:
+        future.add_done_callback(cerrar)
+
+
+def _close(detector):
+    close = getattr(detector, "close", None)
+    if close:
+        try:
+            close()
+        except Exception:
+            pass
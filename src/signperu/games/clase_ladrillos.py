@@ -151,15 +151,15 @@ class ClaseLadrillos:
         # centramos la paleta en x
         self.paddle_x = int(max(self.paddle_w//2, min(self.width-self.paddle_w//2, x)))
 
-    def process_detection(self, letra: str):
-        """Mapea detecciones a acciones (A->izquierda, B->derecha)."""
+    def process_detection(self, letra: str, amount: int = 20):
+        """Mapea detecciones a acciones (A->izquierda, B->derecha), desplazando `amount` px."""
         if not letra:
             return
         letra = str(letra).strip().upper()
         if letra == "A":
-            self.move_paddle_left()
+            self.move_paddle_left(amount)
         elif letra == "B":
-            self.move_paddle_right()
+            self.move_paddle_right(amount)
         else:
             # otras letras: no acción por ahora
             pass
@@ -5,12 +5,12 @@ Responsabilidades:
 - Mantener lista de letras (posición, char)
 - Generar (spawn), mover y limpiar letras
 - Comprobar colisiones cuando llega una letra confirmada por detector
-- Ventana de confirmación (debounce) para detecciones
+- Recibir letras ya confirmadas por el pipeline ('letter_confirmed', core/confirmation.py)
+  con push_confirmed
 - Exponer estado para que la UI lo dibuje
 Diseñado para ser independiente de Pygame / UI.
 """
 
-from collections import deque
 import time
 import random
 from typing import List, Dict, Optional
@@ -19,7 +19,7 @@ class LetrasLogic:
     def __init__(self, *,
                  width:int=800, height:int=600,
                  spawn_interval:float=1.5, letter_speed:float=2.0,
-                 max_lives:int=20, detect_confirm:int=3):
+                 max_lives:int=20):
         # Tamaño lógico (usado para límites)
         self.width = width
         self.height = height
@@ -37,8 +37,6 @@ class LetrasLogic:
         # temporizadores
         self._last_spawn_ts = time.time()
 
-        # debounce/confirm window para detecciones
-        self.detect_window = deque(maxlen=max(1, int(detect_confirm)))
         # letra confirmada lista para consumir por la lógica
         self._latest_confirmed: Optional[str] = None
 
@@ -51,7 +49,6 @@ class LetrasLogic:
         self.vidas = self.max_lives
         self.puntuacion = 0
         self._last_spawn_ts = time.time()
-        self.detect_window.clear()
         self._latest_confirmed = None
         self.last_shown_letter = None
 
@@ -114,17 +111,15 @@ class LetrasLogic:
         # si no encontró, mostrar igualmente (feedback), pero no puntuar
         self.last_shown_letter = letra
 
-    # --------------- detección / debounce ----------------
-    def push_detected(self, letra: str):
-        """
-        Empujar una nueva detección (string). La lógica se encarga de confirmar
-        cuando la ventana se llena con la misma letra.
-        """
+    # --------------- letras confirmadas ----------------
+    @staticmethod
+    def _normalizar(letra: str) -> Optional[str]:
+        """Primer caracter alfabético en mayúscula (o None si no hay)."""
         if not letra:
-            return
+            return None
         letra = letra.strip().upper()
         if not letra:
-            return
+            return None
         # usar solo primer caracter alfabético
         if len(letra) > 1:
             found = None
@@ -134,15 +129,17 @@ class LetrasLogic:
                     break
             letra = found if found else letra[0]
         if not (letra.isalpha() or letra == "Ñ"):
-            return
-
-        self.detect_window.append(letra)
-        if len(self.detect_window) == self.detect_window.maxlen:
-            items = list(self.detect_window)
-            if all(x == items[0] for x in items):
-                # confirmación
-                self._latest_confirmed = items[-1]
-                self.detect_window.clear()
+            return None
+        return letra
+
+    def push_confirmed(self, letra: str):
+        """
+        Letra ya confirmada por el pipeline (evento 'letter_confirmed'): se consume
+        en el siguiente tick.
+        """
+        letra = self._normalizar(letra)
+        if letra:
+            self._latest_confirmed = letra
 
     # --------------- getters para UI ----------------
     def get_letters(self):
@@ -13,6 +13,13 @@ class GameBase(abc.ABC):
         self.db = db
         self.config = config or {}
         self.user = user
+        # con varias cámaras: fuente (source_id) de la estación de este juego; None = todas
+        self.station_source = getattr(config, "STATION_SOURCE", None)
+
+    def is_my_station(self, kwargs):
+        """True si un evento 'hand_detected' (kwarg `source`) corresponde a la estación de este juego."""
+        source = kwargs.get("source")
+        return self.station_source is None or source is None or source == self.station_source
 
     @abc.abstractmethod
     def start(self):
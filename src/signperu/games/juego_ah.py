@@ -16,6 +16,11 @@ from signperu.core.capture import CaptureThread
 from signperu.core.processing import ProcessingThread
 from signperu.core.detector import DetectorWrapper
 from signperu.games.clase_ah import ClaseAh  # ruta de la clase juego  ahorcado
+from signperu.core.streams import stream_event
+from signperu.core.overlay import LandmarkOverlay
+
+VIDEO_SIZE = (500, 370)  # tamaño del feed de cámara en la UI (flujo escalado por la captura)
+HAND_MAX_AGE_NS = 300_000_000  # no dibujamos landmarks más viejos que 0.3 s respecto al frame mostrado
 
 class JuegoAH(GameBase):
     def __init__(self, event_bus, db=None, config=None, user=None):
@@ -31,10 +36,15 @@ class JuegoAH(GameBase):
         self.Texto2 = None
         self.Lienzo = None
         self.camara_activa = False
+        # landmarks de la última detección, dibujados sobre el frame de VIDEO_SIZE
+        self._overlay = LandmarkOverlay(line_color=(0, 255, 0, 255), point_color=(0, 128, 255, 255), point_size=4)
+        self._hand = None   # (landmarks, tamaño del frame de detección, instante de captura ns)
         # Podemos usar detector/capture locales — pero por el app general los hilos
         # se crean en app.py y publican eventos; aquí solo nos subscribimos:
         self.event_bus.subscribe("hand_detected", self._on_hand_detected_event)
-        self.event_bus.subscribe("frame_captured", self._on_frame_event)
+        self.event_bus.subscribe("letter_confirmed", self._on_letter_confirmed_event)
+        self._frame_stream = stream_event(VIDEO_SIZE, self.station_source)
+        self.event_bus.subscribe(self._frame_stream, self._on_frame_event)
 
     def start(self):
         # crear ventana
@@ -60,7 +70,8 @@ class JuegoAH(GameBase):
         self.camara_activa = False
         try:
             self.event_bus.unsubscribe("hand_detected", self._on_hand_detected_event)
-            self.event_bus.unsubscribe("frame_captured", self._on_frame_event)
+            self.event_bus.unsubscribe("letter_confirmed", self._on_letter_confirmed_event)
+            self.event_bus.unsubscribe(self._frame_stream, self._on_frame_event)
         except Exception:
             pass
         try:
@@ -69,9 +80,19 @@ class JuegoAH(GameBase):
         except Exception:
             pass
 
-    # Public callback para event_bus -> lo convertimos a llamada en hilo principal usar after
+    # Public callbacks para event_bus -> lo convertimos a llamada en hilo principal usar after
     def _on_hand_detected_event(self, letra, frame=None, **kwargs):
-        # este callback puede venir desde cualquier hilo, actualizamos UI con .after
+        # cada frame: solo guardamos los landmarks para dibujarlos en el feed
+        if not self.is_my_station(kwargs):
+            return
+        env = kwargs.get("envelope")
+        if env is not None and env.frame is not None:
+            self._hand = (env.landmarks, (env.frame.shape[1], env.frame.shape[0]), env.t_capture_ns)
+
+    def _on_letter_confirmed_event(self, letra, **kwargs):
+        # letra confirmada por el pipeline (pocas por segundo); puede venir desde cualquier hilo
+        if not self.is_my_station(kwargs):
+            return
         if letra:
             def update():
                 try:
@@ -82,56 +103,42 @@ class JuegoAH(GameBase):
                     pass
             if self.app:
                 self.app.after(0, update)
-        # --- actualizar imagen con el frame anotado (si se proporcionó) ---
-        if frame is not None:
-            def update_image():
-                try:
-                    # frame llega en BGR (como lo produce detect_from_frame / procesar_mano)
-                    img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA)
-                    img = cv2.flip(img, 1)
-                    pil = Image.fromarray(img)
-                    if not self._ctk_image:
-                        self._ctk_image = ct.CTkImage(dark_image=pil, size=(500, 370))
-                        self.video_label.configure(image=self._ctk_image)
-                    else:
-                        # actualizar imagen existente para no recrear widgets constantemente
-                        self._ctk_image.configure(dark_image=pil)
-                        self.video_label.configure(image=self._ctk_image)
-                except Exception as e:
-                    # debug leve: no detener app por errores de imagen
-                    print("[JuegoAH] update_image error:", e)
-            if self.app and self.camara_activa:
-                self.app.after(0, update_image)
 
     # --- Implementación requerida por GameBase (abstract method) ---
     def on_hand_detected(self, letra, frame=None):
         """
         Implementación de la interfaz GameBase.
         Será llamada por quien necesite notificar detecciones de mano.
-        Reutiliza la lógica de _on_hand_detected_event para actualizar la UI.
+        Reutiliza la lógica de _on_letter_confirmed_event para actualizar la UI.
         """
         # Reusamos el mismo flujo: llamar al handler que actualiza UI con .after
-        self._on_hand_detected_event(letra, frame=frame)
+        self._on_letter_confirmed_event(letra)
 
-    def _on_frame_event(self, frame):
-        """Actualizamos el feed de la cámara en la UI (frame puede venir anotado)."""
-        if frame is None:
+    def _on_frame_event(self, env):
+        """Actualizamos el feed de la cámara en la UI (env: FrameEnvelope del flujo VIDEO_SIZE)."""
+        frame = env.frame if env is not None else None
+        if frame is None or not (self.app and self.camara_activa):
             return
+        # convertimos aquí: el frame es un slot del FrameRing y puede reescribirse antes de
+        # que Tk ejecute el after(); cvtColor ya hace la copia (pequeña, a VIDEO_SIZE)
+        img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA)
+        hand = self._hand
         def actualizar_imagen():
             try:
-                img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA)
+                # landmarks recientes dibujados a tamaño de pantalla, sobre la copia RGBA
+                if hand is not None and abs(env.t_capture_ns - hand[2]) < HAND_MAX_AGE_NS:
+                    self._overlay.draw(img, hand[0], src_size=hand[1])
                 img = cv2.flip(img, 1)
                 pil = Image.fromarray(img)
                 if not self._ctk_image:
-                    self._ctk_image = ct.CTkImage(dark_image=pil, size=(500, 370))
+                    self._ctk_image = ct.CTkImage(dark_image=pil, size=VIDEO_SIZE)
                     self.video_label.configure(image=self._ctk_image)
                 else:
                     self._ctk_image.configure(dark_image=pil)
                     self.video_label.configure(image=self._ctk_image)
             except Exception:
                 pass
-        if self.app and self.camara_activa:
-            self.app.after(0, actualizar_imagen)
+        self.app.after(0, actualizar_imagen)
 
     # Métodos del juego (adaptados)
     def JuegoNuevo(self):
@@ -2,7 +2,8 @@
 """
 UI Tkinter para Arkanoid (usa ClaseLadrillos para la lógica).
 Feed de cámara integrado en la misma ventana (panel dentro del Canvas).
-Se integra con EventBus: subscribe 'frame_captured' y 'hand_detected'.
+Se integra con EventBus: subscribe al flujo escalado 'frame@VIDEO_WxVIDEO_H' y a las letras
+confirmadas ('letter_confirmed' / 'letter_released'): la paleta se mueve mientras se mantiene A o B.
 """
 
 import tkinter as tk
@@ -14,6 +15,7 @@ import os
 
 from signperu.games.game_base import GameBase
 from signperu.games.clase_ladrillos import ClaseLadrillos
+from signperu.core.streams import stream_event
 
 MEDIA_DIR = os.path.join(os.path.dirname(__file__), "RecursosMultimedia")
 
@@ -27,6 +29,7 @@ GAME_OFFSET = VIDEO_W + 30   # espacio entre panel de cámara y área de juego
 # Tamaños del canvas general
 CANVAS_W = 1100
 CANVAS_H = 700
+PADDLE_HOLD_SPEED = 250   # px/s de la paleta mientras se mantiene la seña (independiente de los fps)
 
 class JuegoLadrillos(GameBase):
     def __init__(self, event_bus, db=None, config=None, user=None):
@@ -43,34 +46,38 @@ class JuegoLadrillos(GameBase):
         # frame recibido por EventBus
         self._frame_lock = threading.Lock()
         self._latest_frame = None  # BGR numpy array
+        self._latest_seq = 0       # seq del envelope de _latest_frame
+        self._shown_seq = 0        # seq del frame ya pintado en el panel
         self._video_imgtk = None   # referencia ImageTk para evitar GC
 
         # suscripciones (flexible con *args, **kwargs)
-        self.event_bus.subscribe("frame_captured", self._on_frame_event)
-        self.event_bus.subscribe("hand_detected", self._on_hand_detected_event)
+        # pedimos frames ya escalados al tamaño del panel (los produce la captura)
+        self._frame_stream = stream_event((VIDEO_W, VIDEO_H), self.station_source)
+        self.event_bus.subscribe(self._frame_stream, self._on_frame_event)
+        self.event_bus.subscribe("letter_confirmed", self._on_letter_confirmed_event)
+        self.event_bus.subscribe("letter_released", self._on_letter_released_event)
+        self._held_letter = None   # letra confirmada que se mantiene (mueve la paleta)
+        self._held_t = None        # instante (monotonic) del último movimiento por letra mantenida
 
         self._job = None
 
     # ---------- EventBus handlers ----------
-    def _on_frame_event(self, frame):
-        # recibe frames BGR desde CaptureThread/ProcessingThread
+    def _on_frame_event(self, env):
+        # recibe FrameEnvelope con frames BGR (VIDEO_W x VIDEO_H) desde CaptureThread.
+        # Copia propia (pequeña): el slot del FrameRing se reescribe si el loop se retrasa
+        frame = env.frame.copy()
         with self._frame_lock:
             self._latest_frame = frame
+            self._latest_seq = env.seq
 
-    def _on_hand_detected_event(self, *args, **kwargs):
-        letra = None
-        for a in args:
-            if isinstance(a, str):
-                letra = a
-                break
-        if letra is None:
-            for k in ("letra","letter","detected","result"):
-                v = kwargs.get(k)
-                if isinstance(v, str):
-                    letra = v
-                    break
-        if letra:
-            self.logic.process_detection(letra)
+    def _on_letter_confirmed_event(self, letra, **kwargs):
+        if self.is_my_station(kwargs):
+            self._held_letter = letra
+            self._held_t = time.monotonic()
+
+    def _on_letter_released_event(self, letra, **kwargs):
+        if self.is_my_station(kwargs) and self._held_letter == letra:
+            self._held_letter = None
 
     # ---------- UI lifecycle ----------
     def start(self):
@@ -190,6 +197,14 @@ class JuegoLadrillos(GameBase):
         self._job = self.root.after(20, self._game_loop)
 
     def _game_loop(self):
+        # paleta: se desplaza según el tiempo que se mantiene la letra confirmada
+        letra = self._held_letter
+        if letra:
+            now = time.monotonic()
+            amount = int(PADDLE_HOLD_SPEED * (now - self._held_t))
+            if amount > 0:
+                self.logic.process_detection(letra, amount=amount)
+                self._held_t = now
         # actualizar lógica
         self.logic.step()
         st = self.logic.get_state()
@@ -237,10 +252,14 @@ class JuegoLadrillos(GameBase):
             return
         vx, vy = self._video_area_pos
 
-        frame = None
+        # _latest_frame es una copia propia (ver _on_frame_event): no la reescribe la captura
         with self._frame_lock:
-            if self._latest_frame is not None:
-                frame = self._latest_frame.copy()
+            frame = self._latest_frame
+            seq = self._latest_seq
+        if frame is not None and seq == self._shown_seq and self.canvas.find_withtag("video_frame_img"):
+            # el loop (20 ms) va más rápido que la cámara: no reconvertimos el mismo frame
+            return
+        self._shown_seq = seq
         if frame is None:
             # si no hay frame, pintar fondo oscuro en la zona
             self.canvas.create_rectangle(vx, vy, vx+VIDEO_W, vy+VIDEO_H, fill="#141414", tags="video_frame")
@@ -249,8 +268,7 @@ class JuegoLadrillos(GameBase):
         try:
             import cv2
             rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            img = Image.fromarray(rgb)
-            img = img.resize((VIDEO_W, VIDEO_H), Image.LANCZOS)
+            img = Image.fromarray(rgb)   # ya llega a VIDEO_W x VIDEO_H
 
             # crear PhotoImage y colocarlo en canvas; mantener referencia en self._video_imgtk
             self._video_imgtk = ImageTk.PhotoImage(img)
@@ -272,16 +290,11 @@ class JuegoLadrillos(GameBase):
         # ------------------ implementaciones obligatorias (GameBase) ------------------
     def on_hand_detected(self, letra, frame=None):
         """
-        Implementación de la interfaz GameBase.
-        Puede ser llamada desde otros hilos; delegamos en el handler existente.
+        Implementación de la interfaz GameBase para llamadas directas: la letra se trata
+        como confirmada (mismo camino que 'letter_confirmed'; la suelta _on_letter_released_event).
         """
-        # delegar a nuestro handler robusto (acepta *args/**kwargs)
-        try:
-            # si viene desde hilo externo, reutilizamos el mismo flujo
-            self._on_hand_detected_event(letra, frame=frame)
-        except Exception:
-            # proteger contra errores en hilos externos
-            pass
+        if isinstance(letra, str) and letra:
+            self._on_letter_confirmed_event(letra)
 
     def stop(self):
         """
@@ -298,11 +311,12 @@ class JuegoLadrillos(GameBase):
 
         # desuscribir handlers (seguro aunque ya lo hagas en _on_close)
         try:
-            self.event_bus.unsubscribe("frame_captured", self._on_frame_event)
+            self.event_bus.unsubscribe(self._frame_stream, self._on_frame_event)
         except Exception:
             pass
         try:
-            self.event_bus.unsubscribe("hand_detected", self._on_hand_detected_event)
+            self.event_bus.unsubscribe("letter_confirmed", self._on_letter_confirmed_event)
+            self.event_bus.unsubscribe("letter_released", self._on_letter_released_event)
         except Exception:
             pass
 
@@ -321,8 +335,9 @@ class JuegoLadrillos(GameBase):
             except Exception:
                 pass
         try:
-            self.event_bus.unsubscribe("frame_captured", self._on_frame_event)
-            self.event_bus.unsubscribe("hand_detected", self._on_hand_detected_event)
+            self.event_bus.unsubscribe(self._frame_stream, self._on_frame_event)
+            self.event_bus.unsubscribe("letter_confirmed", self._on_letter_confirmed_event)
+            self.event_bus.unsubscribe("letter_released", self._on_letter_released_event)
         except Exception:
             pass
         try:
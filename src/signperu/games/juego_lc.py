@@ -11,6 +11,7 @@ import cv2
 
 from signperu.games.game_base import GameBase
 from signperu.games.clase_lc import LetrasLogic
+from signperu.core.streams import stream_event
 
 # Layout constants (ajusta si quieres)
 ANCHO = 1000
@@ -34,17 +35,18 @@ class JuegoLC(GameBase):
         spawn_interval = getattr(cfg, "LETTER_SPAWN_INTERVAL", 1.5)
         letter_speed = getattr(cfg, "LETTER_SPEED", 2.0)
         max_lives = getattr(cfg, "MAX_LIVES", 20)
-        detect_confirm = getattr(cfg, "DETECTOR_CONFIRM_THRESHOLD", 3)
 
         self.logic = LetrasLogic(width=GAME_AREA_W, height=ALTO,
                                  spawn_interval=spawn_interval,
                                  letter_speed=letter_speed,
-                                 max_lives=max_lives,
-                                 detect_confirm=detect_confirm)
+                                 max_lives=max_lives)
 
         # subscripciones
-        self.event_bus.subscribe("hand_detected", self._on_hand_detected_event)
-        self.event_bus.subscribe("frame_captured", self._on_frame_event)
+        # letras ya confirmadas por el pipeline (suavizado temporal en core/confirmation.py)
+        self.event_bus.subscribe("letter_confirmed", self._on_letter_confirmed_event)
+        # frames ya escalados al tamaño del panel de cámara (los produce la captura)
+        self._frame_stream = stream_event((CAMERA_PANEL_W, CAMERA_PANEL_H), self.station_source)
+        self.event_bus.subscribe(self._frame_stream, self._on_frame_event)
 
         # UI state
         self.screen = None
@@ -54,6 +56,9 @@ class JuegoLC(GameBase):
         self.in_play = False
         self._lock = threading.Lock()
         self._latest_frame = None  # BGR numpy array
+        self._latest_seq = 0       # seq del envelope de _latest_frame
+        self._camera_surf = None   # superficie ya convertida del último frame
+        self._camera_seq = 0       # seq de _camera_surf
 
     def start(self):
         pygame.init()
@@ -74,8 +79,8 @@ class JuegoLC(GameBase):
         self.running = False
         self.in_play = False
         try:
-            self.event_bus.unsubscribe("hand_detected", self._on_hand_detected_event)
-            self.event_bus.unsubscribe("frame_captured", self._on_frame_event)
+            self.event_bus.unsubscribe("letter_confirmed", self._on_letter_confirmed_event)
+            self.event_bus.unsubscribe(self._frame_stream, self._on_frame_event)
         except Exception:
             pass
         try:
@@ -84,48 +89,40 @@ class JuegoLC(GameBase):
             pass
 
     def on_hand_detected(self, letra, frame=None):
-        # interfaz por si alguien quiere llamar directamente (p. ej. tests)
-        self.logic.push_detected(letra)
+        # interfaz de GameBase para llamadas directas: la letra se trata como ya confirmada
+        self.logic.push_confirmed(letra)
 
     # --------------- EventBus callbacks ----------------
-    def _on_frame_event(self, frame):
+    def _on_frame_event(self, env):
+        # env: FrameEnvelope con el frame ya escalado al panel de cámara. Copia propia
+        # (pequeña): el slot del FrameRing se reescribe si el dibujo se retrasa
+        frame = env.frame.copy()
         with self._lock:
             self._latest_frame = frame
+            self._latest_seq = env.seq
 
-    def _on_hand_detected_event(self, *args, **kwargs):
-        """
-        Handler flexible: extrae letra como string (si la hay) y la pasa a la lógica.
-        Evita errores si vienen kwargs extra (landmarks, etc).
-        """
-        letra = None
-        # Chequeo sencillo: buscar primer str en args o kwargs["letra"/"letter"]
-        for a in args:
-            if isinstance(a, str):
-                letra = a
-                break
-        if letra is None:
-            for k in ("letra","letter","detected","result"):
-                v = kwargs.get(k)
-                if isinstance(v, str):
-                    letra = v
-                    break
-        if letra:
-            self.logic.push_detected(letra)
+    def _on_letter_confirmed_event(self, letra, **kwargs):
+        if self.is_my_station(kwargs):
+            self.logic.push_confirmed(letra)
 
     # --------------- Dibujo ----------------
     def _draw_camera_panel(self):
-        frame = None
+        # _latest_frame es una copia propia (ver _on_frame_event): no la reescribe la captura
         with self._lock:
-            frame = self._latest_frame.copy() if self._latest_frame is not None else None
+            frame = self._latest_frame
+            seq = self._latest_seq
 
         if frame is not None:
             try:
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                rgb = cv2.flip(rgb, 1)
-                h, w = rgb.shape[:2]
-                surf = pygame.image.frombuffer(rgb.tobytes(), (w, h), "RGB")
-                surf = pygame.transform.smoothscale(surf, (CAMERA_PANEL_W, CAMERA_PANEL_H))
-                self.screen.blit(surf, CAMERA_PANEL_POS)
+                if self._camera_surf is None or seq != self._camera_seq:
+                    # solo convertimos cuando llega un frame nuevo (el loop va a FPS del juego)
+                    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    rgb = cv2.flip(rgb, 1)
+                    h, w = rgb.shape[:2]
+                    # ya llega a CAMERA_PANEL_W x CAMERA_PANEL_H: sin smoothscale
+                    self._camera_surf = pygame.image.frombuffer(rgb.tobytes(), (w, h), "RGB")
+                    self._camera_seq = seq
+                self.screen.blit(self._camera_surf, CAMERA_PANEL_POS)
             except Exception:
                 pygame.draw.rect(self.screen, (20,20,20), (CAMERA_PANEL_POS[0], CAMERA_PANEL_POS[1], CAMERA_PANEL_W, CAMERA_PANEL_H))
         else:
@@ -1,6 +1,7 @@
 #srlsp-game/src/signperu/gui/main_window.py
 # Interfaz principal usando CustomTkinter.
-# Muestra visor de cámara (frames recibidos por EventBus) y recibe eventos "detection".
+# Muestra visor de cámara (frames recibidos por EventBus) y recibe las letras confirmadas
+# ('letter_confirmed').
 #
 # Requisitos: customtkinter, pillow, opencv-python, numpy
 #
@@ -18,11 +19,11 @@ import os
 import customtkinter as ctk
 from PIL import Image, ImageTk
 
-from queue import Queue
 from signperu.core.events import EventBus
-from signperu.core.capture import CaptureThread
-from signperu.core.processing import ProcessingThread
-from signperu.core.detector import DetectorWrapper
+from signperu.core.lanes import LaneManager
+from signperu.core.streams import stream_event, fit_size
+from signperu.core.warmup import shutdown as shutdown_detectors, start_warmup
+from signperu import config as cfg
 from signperu.persistence.db_manager import DBManager
 
 # Importamos las clases de juego (si están disponibles)
@@ -42,6 +43,8 @@ except Exception:
     JuegoLadrillos = None
 
 CTK_IMG_SIZE = (380, 280)  # tamaño preview cámara en la GUI (ajusta si quieres)
+# resolución del flujo de preview: CTK_IMG_SIZE con la proporción de la cámara (la escala la captura)
+PREVIEW_SIZE = fit_size((cfg.FRAME_WIDTH, cfg.FRAME_HEIGHT), CTK_IMG_SIZE)
 
 class MainWindow:
     def _init_(self, event_bus: EventBus, db: DBManager, config):
@@ -49,14 +52,21 @@ class MainWindow:
         self.db = db
         self.config = config
 
-        # hilos/cola (inicialmente no arrancados)
-        self.frame_q = None
+        # MediaPipe se importa y calienta en segundo plano desde ya (core/warmup.py);
+        # el primer carril que se cree recibe ese detector y lo reutilizan las sesiones
+        # siguientes (parar/arrancar cámara o lanzar juegos no reconstruye el grafo)
+        self._detector_ready = start_warmup()
+
+        # carriles de captura/detección (uno por cámara) y atajos al principal
+        self.lanes = None
         self.capture = None
         self.processing = None
         self.detector = None
 
         # último frame recibido (BGR numpy array)
         self._latest_frame = None
+        self._latest_seq = 0     # seq del envelope de _latest_frame
+        self._shown_seq = 0      # seq del último frame pintado (evita repintar el mismo)
         self._frame_lock = threading.Lock()
 
         # ventana
@@ -71,12 +81,16 @@ class MainWindow:
 
         # subscribir a detecciones para mostrar la última letra
         self._last_detected = None
-        self.event_bus.subscribe("hand_detected", self._on_hand_detected_event)
-        self.event_bus.subscribe("frame_captured", self._on_frame_event)
+        self.event_bus.subscribe("letter_confirmed", self._on_letter_confirmed_event)
+        self.event_bus.subscribe(stream_event(PREVIEW_SIZE), self._on_frame_event)
 
         # refresco del preview
         self._preview_job = None
         self._running = False
+        self._launch_job = None   # sondeo (after) mientras un juego espera a cámara/detector
+        self._detector_ready.add_done_callback(
+            lambda f: self.root.after(0, self._append_console,
+                                      "Detector listo." if f.exception() is None else f"Error cargando detector: {f.exception()}"))
 
     # ---------------- UI ----------------
     def _build_ui(self):
@@ -152,31 +166,27 @@ class MainWindow:
         self.btn_quit.pack(side="right", padx=6)
 
     # ---------------- EventBus handlers ----------------
-    def _on_frame_event(self, frame):
+    def _on_frame_event(self, env):
+        # env: FrameEnvelope con el frame ya escalado a PREVIEW_SIZE. Copiamos (es pequeño):
+        # el slot del FrameRing se reescribe si la UI va por detrás de la cámara
+        frame = env.frame.copy()
         with self._frame_lock:
             self._latest_frame = frame
+            self._latest_seq = env.seq
 
-    def _on_hand_detected_event(self, *args, **kwargs):
-        # buscamos primer string en args/kwargs
-        letra = None
-        for a in args:
-            if isinstance(a, str):
-                letra = a
-                break
-        if letra is None:
-            for key in ("letra","letter","detected","result"):
-                v = kwargs.get(key)
-                if isinstance(v, str):
-                    letra = v
-                    break
-        if letra:
+    def _on_letter_confirmed_event(self, letra, **kwargs):
+        # solo letras confirmadas por el pipeline (core/confirmation.py): pocas por segundo
+        if not letra:
+            return
+        def update():
             self._last_detected = letra
             self._append_console(f"Detección: {letra}")
-            # actualizar etiqueta en hilo principal
             try:
                 self.detect_label.configure(text=f"Última detección: {letra}")
             except Exception:
                 pass
+        # llega desde el hilo de procesamiento: actualizamos la UI en el hilo principal
+        self.root.after(0, update)
 
     # ---------------- capture / processing control ----------------
     def start_capture(self):
@@ -184,15 +194,15 @@ class MainWindow:
         if self.capture and getattr(self.capture, "running", False):
             return
         self._append_console("Iniciando captura y procesamiento...")
-        # crear resources
-        self.frame_q = Queue(maxsize=2)
-        self.capture = CaptureThread(self.event_bus, src=self.config.CAMERA_SRC, target_fps=self.config.FPS, frame_queue=self.frame_q)
-        self.detector = DetectorWrapper()
-        self.processing = ProcessingThread(self.event_bus, self.detector, self.frame_q)
+        # crear resources: un carril por fuente de CAMERA_SOURCES (o CAMERA_SRC)
+        sources = getattr(self.config, "CAMERA_SOURCES", None) or [self.config.CAMERA_SRC]
+        self.lanes = LaneManager(self.event_bus, sources, target_fps=self.config.FPS)
+        self.capture = self.lanes.primary.capture
+        self.detector = self.lanes.primary.detector
+        self.processing = self.lanes.primary.processing
 
         # start threads
-        self.capture.start()
-        self.processing.start()
+        self.lanes.start()
         self.btn_start_cam.configure(state="disabled")
         self.btn_stop_cam.configure(state="normal")
         self._running = True
@@ -203,14 +213,17 @@ class MainWindow:
     def stop_capture(self):
         """Detiene capture + processing y cancela preview."""
         self._append_console("Deteniendo captura y procesamiento...")
+        if self._launch_job:
+            # un juego esperaba a esta cámara: cancelamos su lanzamiento
+            try:
+                self.root.after_cancel(self._launch_job)
+            except Exception:
+                pass
+            self._launch_job = None
+            self._set_games_buttons_state("normal")
         try:
-            if self.capture:
-                self.capture.stop()
-        except Exception:
-            pass
-        try:
-            if self.processing:
-                self.processing.stop()
+            if self.lanes:
+                self.lanes.stop()
         except Exception:
             pass
         self.btn_start_cam.configure(state="normal")
@@ -235,18 +248,19 @@ class MainWindow:
         self._preview_job = self.root.after(50, self._update_preview)
 
     def _update_preview(self):
-        # obtiene último frame y lo pinta en el widget
-        frame = None
+        # obtiene último frame (copia propia, ver _on_frame_event) y lo pinta en el widget
         with self._frame_lock:
-            if self._latest_frame is not None:
-                frame = self._latest_frame.copy()
+            frame = self._latest_frame
+            seq = self._latest_seq
 
-        if frame is not None:
+        if frame is not None and seq == self._shown_seq:
+            pass   # mismo frame que ya está en pantalla: no repintamos
+        elif frame is not None:
+            self._shown_seq = seq
             try:
                 import cv2
                 rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(rgb)
-                img.thumbnail(CTK_IMG_SIZE, Image.LANCZOS)
+                img = Image.fromarray(rgb)   # ya llega a PREVIEW_SIZE desde la captura
                 imgtk = ImageTk.PhotoImage(img)
                 self._preview_canvas.configure(image=imgtk, text="")
                 # debemos mantener referencia para evitar GC
@@ -264,25 +278,19 @@ class MainWindow:
             self._preview_job = None
 
     # ---------------- launching games ----------------
-    def _wait_for_first_frame(self, timeout: float = 3.0) -> bool:
-        """
-        Espera hasta timeout segundos a que self._latest_frame no sea None.
-        Devuelve True si apareció al menos un frame, False si timeout.
-        Esto evita lanzar un juego antes de que la cámara/detector estén listos.
-        """
-        start = time.time()
-        while time.time() - start < timeout:
-            with self._frame_lock:
-                if self._latest_frame is not None:
-                    return True
-            time.sleep(0.08)
-        return False
+    def _pipeline_ready(self) -> bool:
+        """True si el detector está cargado y ya llegó al menos un frame."""
+        if self.lanes is None or not self.lanes.ready:
+            return False
+        with self._frame_lock:
+            return self._latest_frame is not None
 
     def _launch_game(self, key: str):
         """
         Lanza el juego correspondiente.
         Mejoras:
-        - Si la cámara no está activa la inicia y espera a primer frame (timeout).
+        - Si la cámara no está activa la inicia y espera (sin bloquear Tk: sondeo con
+          after()) a que el detector esté calentado y llegue el primer frame.
         - Oculta la ventana principal (withdraw) pero no destruye capture threads.
         - Tras finalizar el juego intenta detener el juego con stop() y, si
           fuimos quienes arrancamos la cámara, la para.
@@ -296,6 +304,8 @@ class MainWindow:
         if cls is None:
             self._append_console(f"Juego {key} no disponible.")
             return
+        if self._launch_job:
+            return   # ya hay un juego esperando a arrancar
 
         started_here = False
         try:
@@ -303,15 +313,31 @@ class MainWindow:
                 self._append_console("La cámara no está activa. Iniciando automáticamente...")
                 self.start_capture()
                 started_here = True
-                # Esperamos a que aparezca el primer frame (o timeout)
-                ready = self._wait_for_first_frame(timeout=4.0)
-                if not ready:
-                    self._append_console("Advertencia: no se recibió frame en el tiempo esperado (4s). El detector puede tardar más en cargar.")
-                else:
-                    self._append_console("Primer frame recibido. Lanzando juego.")
         except Exception as e:
             self._append_console(f"Error iniciando cámara: {e}")
 
+        if self._pipeline_ready():
+            self._run_game(key, cls, started_here)
+            return
+        # deshabilitar botones mientras esperamos para evitar re-entradas
+        self._set_games_buttons_state("disabled")
+        self._append_console("Esperando a la cámara y al detector...")
+        self._poll_launch(key, cls, started_here, time.monotonic() + 30.0)
+
+    def _poll_launch(self, key, cls, started_here, deadline):
+        """Sondeo desde el loop de Tk hasta que el pipeline esté listo (o venza el plazo)."""
+        self._launch_job = None
+        if self._pipeline_ready():
+            self._append_console("Detector y primer frame listos. Lanzando juego.")
+        elif time.monotonic() < deadline:
+            self._launch_job = self.root.after(100, self._poll_launch, key, cls, started_here, deadline)
+            return
+        else:
+            self._append_console("Advertencia: el detector o la cámara no respondieron a tiempo. Lanzando igualmente.")
+        self._run_game(key, cls, started_here)
+
+    def _run_game(self, key, cls, started_here):
+        """Oculta el menú y ejecuta el juego (bloqueante) hasta que termine."""
         # deshabilitar botones para evitar re-entradas
         self._set_games_buttons_state("disabled")
         self._append_console(f"Lanzando juego: {key}")
@@ -395,12 +421,13 @@ class MainWindow:
     # ---------------- close ----------------
     def _on_close(self):
         self._append_console("Cerrando aplicación...")
-        # detener hilos
+        # detener hilos y cerrar los detectores de la reserva (viven entre sesiones de captura)
         self.stop_capture()
+        shutdown_detectors()
         # desuscribir
         try:
-            self.event_bus.unsubscribe("frame_captured", self._on_frame_event)
-            self.event_bus.unsubscribe("hand_detected", self._on_hand_detected_event)
+            self.event_bus.unsubscribe(stream_event(PREVIEW_SIZE), self._on_frame_event)
+            self.event_bus.unsubscribe("letter_confirmed", self._on_letter_confirmed_event)
         except Exception:
             pass
         try:
@@ -0,0 +1,69 @@
+# src/signperu/test/compare_engines.py
+# Compara el throughput de los motores de detección (legacy vs tasks) sobre la misma fuente.
+# Uso: python -m signperu.test.compare_engines [fuente] [segundos]
+#      fuente: grabación (--record), vídeo, carpeta de imágenes o "synthetic" (por defecto)
+import sys
+import time
+
+import cv2
+
+from signperu import config as cfg
+from signperu.core.detector import DetectorWrapper
+from signperu.core.sources import make_source
+from signperu.core.streams import fit_size
+
+
+def run_engine(engine, spec, duration):
+    det = DetectorWrapper(engine=engine)
+    if det.engine != engine:
+        print(f"Motor {engine} no disponible (se cargó {det.engine}); se omite.")
+        return None
+    source = make_source(spec, realtime=False)
+    if not source.open():
+        print("ERROR: no se pudo abrir la fuente", spec)
+        return None
+    size = getattr(cfg, "DETECTION_SIZE", None)
+    frames = 0
+    det.engine_stats.reset()   # sin contar la carga del modelo
+    t0 = time.perf_counter()
+    try:
+        while time.perf_counter() - t0 < duration:
+            ok, frame = source.read()
+            if not ok:
+                if source.exhausted:
+                    break
+                continue
+            if size:
+                frame = cv2.resize(frame, fit_size((frame.shape[1], frame.shape[0]), size),
+                                   interpolation=cv2.INTER_AREA)
+            det.detect_from_frame(frame, annotate=False)
+            frames += 1
+    finally:
+        source.release()
+    elapsed = time.perf_counter() - t0
+    time.sleep(0.2)   # deja terminar los resultados asíncronos en vuelo
+    stats = det.stats()
+    det.close()
+    stats["frames_per_s"] = frames / elapsed
+    return stats
+
+
+def main(spec="synthetic", duration=10.0):
+    for engine in ("legacy", "tasks"):
+        stats = run_engine(engine, spec, duration)
+        if stats is None:
+            continue
+        lat = stats["mean_latency_ms"]
+        print(f"{engine:>6}: {stats['frames_per_s']:.1f} frames/s enviados, "
+              f"{stats['results_per_s']:.1f} resultados/s, "
+              f"latencia media {'-' if lat is None else f'{lat:.1f} ms'}, "
+              f"{stats['submitted'] - stats['results']} frames descartados")
+        cascada = stats["cascade"]
+        print(f"{'':>6}  cascada: {cascada['hands']} manos, {cascada['fast_rate']:.0%} por reglas, "
+              f"{cascada['ambiguous_rate']:.0%} ambiguas {cascada['ambiguous']}, "
+              f"{cascada['heavy_rate']:.0%} a la etapa cara")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "synthetic",
+         float(sys.argv[2]) if len(sys.argv) > 2 else 10.0)
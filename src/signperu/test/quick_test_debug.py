@@ -18,7 +18,7 @@ def main(duration=20, cam_src=0):
         letra, annotated, coords = det.detect_from_frame(frame)
         if letra:
             print("Señal detectada:", letra)
-        if coords:
+        if coords is not None:
             print("Landmarks:", coords[:5], "... total:", len(coords))
         # mostramos feed anotado por si hay landmarks
         annotated_rgb = cv2.cvtColor(annotated, cv2.COLOR_BGR2RGB)